@@ -49,6 +49,7 @@ from datetime import datetime
 from zoneinfo import ZoneInfo
 from urllib.parse import urlparse, urljoin
 import time
+from collections import deque
 import instructor
 from instructor import from_groq
 
@@ -76,11 +77,22 @@ try:
     from tools.RULAC_tools import get_RULAC_conflict_classification_methodology
     from tools.RULAC_tools import get_international_law_framework
     from tools.RULAC_tools import get_information_about_Argos
+    from tools.RULAC_tools import new_rulac_query_batch, close_async_neo4j_drivers
     # from tools.WEB_tools import get_website  # Temporarily disabled
     from tools.BRAVE_tools import brave_search  # New Brave Search tool
     from tools.HRW_tools import get_human_rights_research_by_country
 
-    from tools.NEWS_tools import get_combined_news
+    from tools.NEWS_tools import get_combined_news, close_scraper_sessions
+
+    # load the deterministic fast-path tool planner
+    from agents.tool_planner import plan_tool_calls, plan_speculative_rulac_calls, make_tool_call_key
+    from agents.tool_plan_cache import ToolPlanCache
+    from agents.tool_stream_parser import ToolCallStreamParser
+
+    # load shared, pooled LLM clients
+    from helpers.llm_clients import get_groq_client, get_async_groq_client
+    from helpers.rulac_batch import use_rulac_batch
+    from helpers.rulac_profiles import merge_rulac_sections
 
 
     # load Final System Prompts for General and Tool Agent
@@ -241,6 +253,116 @@ class ToolCall(BaseModel):
     args: dict = Field(..., description="The arguments to pass to the tool")
     reasoning: str = Field("", description="Explanation of why this tool was selected")
 
+class RequestContext:
+    """
+    Per-request state for a single pipe() run.
+
+    Holds the event emitter, the citation registry, stage timings and the request deadline,
+    so that one Pipe instance can serve many concurrent chats without them overwriting
+    each other's state.
+
+    UI events can also be queued with enqueue_event(); a background event pump then emits
+    them on its own schedule, pacing status updates so each one stays readable.
+    """
+
+    def __init__(self, event_emitter: Optional[Callable[[dict], Awaitable[None]]] = None, deadline: Optional[float] = None):
+        self.event_emitter = event_emitter
+        self.unique_citations_retrieved = set()  # Unique citation URLs emitted to the UI
+        self.citation_count = 0  # Number of citation events emitted
+        self.event_queue = asyncio.Queue()  # UI events waiting for the event pump
+        self._event_pump_task = None
+        self.start_time = time.time()
+        self.deadline = deadline  # Absolute time.time() by which the request should be answered, or None
+        self.timings = {}  # Stage name -> duration in seconds
+        self.tool_plan_complete = True  # False when the tool-selection stream broke off after tools were dispatched
+        self.prefetch_tasks = {}  # make_tool_call_key() -> speculative RULAC lookup task started during tool selection
+        self.latest_user_query = ""  # Last user message, used by RULAC tools to rank conflicts by relevance
+
+    async def emit_event(self, event: dict):
+        """Emit an event to this request's event emitter, if any"""
+        if self.event_emitter:
+            await self.event_emitter(event)
+
+    def enqueue_event(self, event: dict):
+        """Queue an event for the background event pump and return immediately"""
+        self.event_queue.put_nowait(event)
+
+    def start_event_pump(self, status_interval: float = 2.0):
+        """Start the background task that emits queued events, pacing status updates by status_interval seconds"""
+        if self._event_pump_task is None:
+            self._event_pump_task = asyncio.create_task(self._run_event_pump(status_interval))
+
+    async def close_event_pump(self):
+        """Flush all queued events (status updates are no longer paced) and stop the event pump"""
+        if self._event_pump_task is None:
+            return
+        self.event_queue.put_nowait(None)
+        await self._event_pump_task
+        self._event_pump_task = None
+
+    async def _run_event_pump(self, status_interval: float):
+        """
+        Emit queued events until close_event_pump() is called.
+        Citations and other events are emitted as soon as they arrive. Status updates are
+        held back so that consecutive ones are at least status_interval seconds apart.
+        """
+        pending_statuses = deque()
+        next_status_time = 0.0
+        closing = False
+        while not (closing and not pending_statuses):
+            # Emit the next pending status once its slot comes up (or straight away when closing)
+            if pending_statuses and (closing or time.time() >= next_status_time):
+                await self._safe_emit(pending_statuses.popleft())
+                next_status_time = time.time() + status_interval
+                continue
+
+            timeout = max(0.0, next_status_time - time.time()) if pending_statuses else None
+            try:
+                event = await asyncio.wait_for(self.event_queue.get(), timeout)
+            except asyncio.TimeoutError:
+                continue
+
+            if event is None:
+                closing = True
+            elif event.get("type") == "status":
+                pending_statuses.append(event)
+            else:
+                await self._safe_emit(event)
+
+    async def _safe_emit(self, event: dict):
+        """Emit an event from the event pump, logging instead of raising so the pump keeps running"""
+        try:
+            await self.emit_event(event)
+        except Exception as e:
+            logger.error(f"Failed to emit {event.get('type', 'unknown')} event: {e}")
+
+    def register_citation(self, citation_url: str) -> bool:
+        """
+        Record a citation URL and report whether it should be emitted to the UI.
+        Brave search citations share one URL, so each one is always emitted and made unique in the registry.
+        """
+        if not citation_url:
+            return False
+        if citation_url == "https://search.brave.com":
+            self.citation_count += 1
+            self.unique_citations_retrieved.add(f"{citation_url}#{self.citation_count}")
+            return True
+        if citation_url in self.unique_citations_retrieved:
+            return False
+        self.citation_count += 1
+        self.unique_citations_retrieved.add(citation_url)
+        return True
+
+    def record_timing(self, stage: str, start_time: float):
+        """Record how long a pipeline stage took, measured from start_time"""
+        self.timings[stage] = time.time() - start_time
+
+    def time_remaining(self) -> Optional[float]:
+        """Seconds left before the request deadline, or None if there is no deadline"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.time())
+
 # // HELPER FUNCTIONS //
 
 def load_template_from_path(file_path: str) -> str:
@@ -269,8 +391,8 @@ def generate_title(body: dict, groq_api_key: str = None) -> str:
             logger.warning("No Groq API key available for title generation")
             return json.dumps({"title": "New Chat"})
         
-        # Initialize Groq client
-        chat_client = Groq(api_key=api_key)
+        # Get the shared, pooled Groq client
+        chat_client = get_groq_client(api_key)
         
         # Get the user's message
         messages = body.get("messages", [])
@@ -333,8 +455,8 @@ def generate_follow_up(body: dict, groq_api_key: str = None) -> str:
                 "What human rights concerns are involved?"
             ]})
         
-        # Initialize Groq client
-        chat_client = Groq(api_key=api_key)
+        # Get the shared, pooled Groq client
+        chat_client = get_groq_client(api_key)
         
         # Get the conversation messages
         messages = body.get("messages", [])
@@ -472,6 +594,24 @@ class Pipe:
         ignored_websites: str = Field("", description="Comma-separated list of websites to ignore in search results")
         page_content_words_limit: int = Field(5000, description="Limit words content for each page")
         
+        # Tool selection parameters
+        tool_selection_timeout: float = Field(30.0, description="Timeout in seconds for each tool-selection LLM attempt")
+        stream_tool_selection: bool = Field(True, description="Stream the tool-selection LLM response and start each tool as soon as it is selected")
+        
+        # Latency budget parameters
+        request_deadline: float = Field(45.0, description="Seconds after the request starts by which the final response should begin; tools still running are cancelled (0 disables)")
+        enable_speculative_prefetch: bool = Field(True, description="Prefetch RULAC lookups for entities named in the query while the tool-selection LLM is planning")
+        enable_rulac_query_batching: bool = Field(True, description="Run the Neo4j queries of all RULAC conflict tools dispatched together in one read transaction")
+        tool_soft_deadline: float = Field(30.0, description="Seconds a research tool may run after it is dispatched before it is reported as unavailable")
+        news_tool_soft_deadline: float = Field(20.0, description="Soft deadline in seconds for get_combined_news, which searches, scrapes and summarizes articles")
+        rulac_profile_token_budget: int = Field(3000, description="Estimated prompt tokens for full conflict profiles per RULAC conflict tool; less relevant conflicts beyond it are listed one line each (0 = no limit)")
+        enable_fast_path_planner: bool = Field(True, description="Plan common questions with the rule-based planner instead of the tool-selection LLM")
+        tool_plan_cache_ttl: int = Field(3600, description="Seconds a cached tool plan stays valid (0 disables the tool plan cache)")
+        tool_plan_cache_size: int = Field(512, description="Maximum number of tool plans kept in the cache")
+        
+        # UI parameters
+        status_update_interval: float = Field(2.0, description="Minimum seconds between consecutive tool status updates in the UI")
+        
         # Override model_post_init to load from environment if empty (for local testing)
         def model_post_init(self, __context):
             """Load API keys from environment variables if not set via Valves"""
@@ -508,7 +648,7 @@ class Pipe:
         )
 
         # 2. Tool-Use LLM - Initialize the Groq client with instructor for structured output
-        groq_client = Groq(api_key=self.valves.groq_api_key)
+        groq_client = get_groq_client(self.valves.groq_api_key)
         self.structured_client = from_groq(groq_client, mode=instructor.Mode.JSON)
         
         # Keep the regular tool model for backward compatibility
@@ -556,11 +696,13 @@ class Pipe:
                     print(f"  - Env key length: {len(env_key)}, Valve key length: {len(self.valves.groq_api_key)}")
             print()
         
-        self.global_unique_citations_retreived = set()
-        self.global_citation_count = 0  # Reset the citation count at the start of each pipe run
-        self.event_emitter = None  # Will be set in pipe() method
-        self.is_first_tool_status_update = True # Flag for delayed status updates
-        self.tool_status_lock = asyncio.Lock() # Lock for handling parallel status updates
+        # Per-request state (event emitter, citations, timings) lives in a RequestContext created by pipe()
+
+        # Cache of tool plans keyed by the normalized query and recent conversation, shared by all requests
+        self.tool_plan_cache = ToolPlanCache(
+            max_entries=self.valves.tool_plan_cache_size,
+            ttl_seconds=self.valves.tool_plan_cache_ttl
+        )
         
         # Not sure if i need this, but openwebui tools docs say to set citation to False if you want to customise the citation event ... wont hurt to keep just in case
         # self.citation = False
@@ -668,6 +810,20 @@ class Pipe:
         except Exception as e:
             logger.warning(f"Failed to configure tool API keys: {e}")
             logger.warning("Tools will fall back to environment variables if available")
+
+    async def on_shutdown(self):
+        """
+        Close the pooled network resources the tools opened on the running event loop.
+        Called by the host on shutdown, and by the local test runs before their loop ends.
+        """
+        try:
+            await close_scraper_sessions()
+        except Exception as e:
+            logger.warning(f"Failed to close the article scraping session: {e}")
+        try:
+            await close_async_neo4j_drivers()
+        except Exception as e:
+            logger.warning(f"Failed to close the Neo4j driver: {e}")
         
     def create_mock_event_emitter(self):
         """Creates a mock event emitter for local testing that displays events in the console
@@ -741,14 +897,6 @@ class Pipe:
             #     console.print(panel)
         return mock_event_emitter
         
-    async def emit_event(self, event):
-        """Emit an event using the appropriate event emitter"""
-        if self.event_emitter:
-            await self.event_emitter(event)
-        elif self.local_testing and self.mock_event_emitter:
-            await self.mock_event_emitter(event)
-            
-        
     # Main execution logic that starts and ends full pipeline, messages are sent as 'body' input from the OPENWEBUI app and/or through local testing
     async def pipe(
         self,
@@ -857,16 +1005,12 @@ class Pipe:
         # Convert __user__ to User type in OpenWebUI
         user = User(**__user__)
 
-        # Save the event emitter for use throughout the pipe execution
-        self.event_emitter = __event_emitter__
-        
+        # Create the per-request context holding the event emitter and citation tracking for this run
         # If no event emitter is provided, use the mock event emitter for local testing
-        if not self.event_emitter:
-            self.event_emitter = self.create_mock_event_emitter()
-
-        # Reset citation tracking variables at start of new pipe run
-        self.global_unique_citations_retreived = set()
-        self.global_citation_count = 0
+        ctx = RequestContext(
+            event_emitter=__event_emitter__ or self.create_mock_event_emitter(),
+            deadline=time.time() + self.valves.request_deadline if self.valves.request_deadline > 0 else None
+        )
 
         # Print clear start marker for pipeline execution
         # Only print if logging level is INFO or below
@@ -899,14 +1043,20 @@ class Pipe:
 
 
         # Execute research tools and get their outputs - directly without router
-        tool_outputs = await self.handle_tool_query(messages)
+        # Status and citation events are queued by the tools and emitted by a background pump
+        ctx.start_event_pump(self.valves.status_update_interval)
+        try:
+            tool_outputs = await self.handle_tool_query(messages, ctx)
+        finally:
+            # Flush any remaining status and citation events before the final status update
+            await ctx.close_event_pump()
         logger.debug(f"Received {len(tool_outputs)} tool outputs from handle_tool_query")
         
         # Generate final response using tool outputs and original messages
-        result = self.handle_tool_query_final_response(tool_outputs, messages)
+        result = self.handle_tool_query_final_response_async(tool_outputs, messages, ctx)
         
         # Create status message showing citation count for display in the UI
-        unique_citation_count = len(self.global_unique_citations_retreived)
+        unique_citation_count = len(ctx.unique_citations_retrieved)
         logger.debug(f"Total unique citations: {unique_citation_count}")
 
         if unique_citation_count:
@@ -916,7 +1066,7 @@ class Pipe:
 
         # Send final status update to UI
         if eventMessageUI:
-            await self.emit_event(
+            await ctx.emit_event(
                 {
                     "type": "status",
                     "data": {
@@ -932,7 +1082,7 @@ class Pipe:
     # handle_general_query() method removed - Router is no longer used
     # All queries now go directly to tool agent for research and response generation
 
-    async def handle_tool_query(self, messages: list[dict]) -> list[dict]:
+    async def handle_tool_query(self, messages: list[dict], ctx: RequestContext) -> list[dict]:
         """
         Research orchestration function that selects and executes appropriate research tools.
         
@@ -945,6 +1095,7 @@ class Pipe:
         
         Args:
             messages: The full conversation messages from the user
+            ctx: Per-request context used for UI events and citation tracking
             
         Returns:
             List of dictionaries containing tool outputs with metadata
@@ -957,7 +1108,7 @@ class Pipe:
 
 
         # Send initial status update to UI
-        await self.emit_event(
+        ctx.enqueue_event(
             {
                 "type": "status",
                 "data": {
@@ -999,6 +1150,7 @@ class Pipe:
         
         # Debug output for extracted query and context
         logger.debug(f"Extracted latest user query: {latest_user_query}")
+        ctx.latest_user_query = latest_user_query
         logger.debug(f"Built conversation context with {len(previous_messages)} messages")
         
         # Prepare the system prompt for the tool-using LLM
@@ -1012,6 +1164,9 @@ class Pipe:
 
             1. RULAC (Rule of Law in Armed Conflicts) Tools:
                Use these tools to get detailed information about armed conflicts and their legal classification.
+               The four get_armed_conflict_data_by_* tools also accept statistics_only: true for questions that only need
+               numbers of conflicts (how many, which has the most, comparing counts); they then return a compact table of
+               conflict counts instead of full conflict profiles.
 
                a) State Actor Conflicts:
                   - Tool: get_armed_conflict_data_by_country
@@ -1272,237 +1427,73 @@ Return only valid JSON without any other text. Be concise.
         if logger.getEffectiveLevel() == logging.DEBUG:
             log_final_messages(structured_messages, "Structured Prompt for Tool Selection")
 
+        # Tools start running as soon as they are selected, while the tool-selection LLM may still be streaming the rest
+        # Each entry is (tool_call, task, soft deadline as an absolute time.time())
+        tool_tasks = []
+
         try:
-            # Get tool selection decisions from the LLM using direct Groq client instead of instructor
-            model_name = self.tool_model_name
-            log_api_request("Tool Model", model_name, {
-                "message_count": len(structured_messages),
-                "prompt_tokens_estimate": len(prompt_content) // 4
-            })
-            
-            start_time = time.time()
-            logger.info(f"Invoking Tool Selection LLM ({model_name})")
-            
-            # Initialize raw Groq client for debugging
-            direct_client = Groq(api_key=self.valves.groq_api_key)
-            
-            # Add retry logic for 503 errors
-            max_retries = 3
-            retry_count = 0
-            backoff_time = 1  # Initial backoff in seconds
-            
-            while retry_count <= max_retries:
+            selection_start = time.time()
+            self.tool_plan_cache.max_entries = self.valves.tool_plan_cache_size
+            tool_execution_start = None
+
+            def dispatch_tool_call(tool_call: dict):
+                nonlocal tool_execution_start
+                if tool_execution_start is None:
+                    tool_execution_start = time.time()
+                    ctx.timings["first_tool_dispatch"] = tool_execution_start - ctx.start_time
+                deadline = self._tool_deadline(tool_call["name"], ctx)
+                # Claim a matching speculative lookup now, before unused ones are discarded
+                prefetched = ctx.prefetch_tasks.pop(make_tool_call_key(tool_call["name"], tool_call["args"]), None)
+                logger.info(f"Dispatching tool {tool_call['name']} ({tool_call['id']}), {deadline - time.time():.1f}s budget{', reusing prefetched result' if prefetched else ''}")
                 try:
-                    # Debug: Try with direct Groq client first
-                    logger.debug("Using direct Groq client for debugging")
-                    
-                    # Add retry logic for 503 errors
-                    max_retries = 3
-                    retry_count = 0
-                    backoff_time = 1  # Initial backoff in seconds
-                    
-                    while retry_count <= max_retries:
-                        try:
-                            completion = direct_client.chat.completions.create(
-                                model=model_name,
-                                messages=structured_messages,
-                                temperature=self.tool_temperature,
-                                response_format={"type": "json_object"}
-                            )
-                            
-                            log_api_response_time("Tool Model", model_name, start_time)
-                            
-                            # Extract and parse JSON response
-                            json_response = completion.choices[0].message.content
-                            logger.debug(f"Raw JSON response: {json_response}")
-                            
-                            # Print raw API response details (more verbose)
-                            if logger.getEffectiveLevel() == logging.DEBUG:
-                                console.print(Panel(
-                                    Pretty(completion.model_dump()),
-                                    title="Debug: Raw Groq API Response",
-                                    border_style="magenta",
-                                    expand=False
-                                ))
-                            
-                            # Successfully got a response, break out of retry loop
-                            break
-                            
-                        except Exception as retry_e:
-                            retry_count += 1
-                            error_type = type(retry_e).__name__
-                            error_details = str(retry_e)
-                            
-                            # Check if this is a 503 error
-                            is_503_error = False
-                            if error_type == "InternalServerError" and "503" in str(error_details):
-                                is_503_error = True
-                            
-                            # Log detailed error information
-                            logger.error(f"Tool Model API Error ({error_type}): {error_details}")
-                            
-                            # If it's a 503 error and we have retries left, retry after backoff
-                            if is_503_error and retry_count <= max_retries:
-                                wait_time = backoff_time * (2 ** (retry_count - 1))
-                                logger.warning(f"Got 503 error, retrying in {wait_time}s (attempt {retry_count}/{max_retries})")
-                                # Wait before retry with exponential backoff
-                                time.sleep(wait_time)
-                            else:
-                                # For non-503 errors or if we've used all retries, re-raise to be caught by outer try/except
-                                raise retry_e
-                    
+                    task = asyncio.create_task(self._process_tool_call(tool_call, ctx, prefetched=prefetched))
+                except Exception:
+                    if prefetched is not None:
+                        prefetched.cancel()
+                    raise
+                tool_tasks.append((tool_call, task, deadline))
+
+            # Reuse a cached plan for repeated questions, skipping the planners entirely
+            tool_calls = None
+            if self.valves.tool_plan_cache_ttl > 0:
+                tool_calls = self.tool_plan_cache.get(latest_user_query, conversation_context)
+                cache_stats = self.tool_plan_cache.stats()
+                logger.info(
+                    f"Tool plan cache {'hit' if tool_calls else 'miss'} "
+                    f"(hits={cache_stats['hits']}, misses={cache_stats['misses']}, hit rate={cache_stats['hit_rate']:.0%})"
+                )
+
+            if not tool_calls:
+                # Try the deterministic fast-path planner first, and only ask the tool-selection LLM when it is not confident
+                if self.valves.enable_fast_path_planner:
+                    tool_calls = plan_tool_calls(latest_user_query, conversation_context)
+                if tool_calls:
+                    logger.info(f"Fast-path planner selected {len(tool_calls)} tools, skipping tool-selection LLM")
+                else:
+                    # Hide RULAC latency behind the LLM call by prefetching the lookups it is likely to ask for
+                    if self.valves.enable_speculative_prefetch:
+                        self._start_speculative_prefetch(latest_user_query, ctx)
+                    # The LLM selection dispatches each tool itself as soon as its JSON object is complete
                     try:
-                        parsed_response = json.loads(json_response)
-                        logger.debug(f"Parsed response: {json.dumps(parsed_response, indent=2)}")
-                        
-                        # Debug panel for full response structure
-                        if logger.getEffectiveLevel() == logging.DEBUG:
-                            console.print(Panel(
-                                Pretty(parsed_response),
-                                title="Debug: Full Parsed Response",
-                                border_style="green"
-                            ))
-                        
-                        # Extract tool calls from the parsed response
-                        tool_calls = []
-                        if "tools" in parsed_response and isinstance(parsed_response["tools"], list):
-                            for i, tool_info in enumerate(parsed_response["tools"]):
-                                if "name" in tool_info and "args" in tool_info:
-                                    tool_calls.append({
-                                        "id": f"tool_{i}",
-                                        "name": tool_info["name"],
-                                        "args": tool_info["args"],
-                                        "reasoning": tool_info.get("reasoning", "No reasoning provided")
-                                    })
-                        else:
-                            logger.warning(f"Unexpected response structure. No 'tools' array found.")
-                            # Try to extract any tool-like information from the response
-                            if isinstance(parsed_response, dict):
-                                for key, value in parsed_response.items():
-                                    logger.debug(f"Checking field: {key} = {value}")
-                                
-                                # Try to find any field that looks like it might contain tools
-                                potential_tool_fields = []
-                                for key, value in parsed_response.items():
-                                    if isinstance(value, list) and len(value) > 0:
-                                        potential_tool_fields.append((key, value))
-                                
-                                if potential_tool_fields:
-                                    logger.info(f"Found potential tool fields: {[f[0] for f in potential_tool_fields]}")
-                                    # Use the first list field as potential tools
-                                    field_name, field_value = potential_tool_fields[0]
-                                    logger.info(f"Using '{field_name}' as tools array")
-                                    
-                                    for i, item in enumerate(field_value):
-                                        if isinstance(item, dict):
-                                            # Check if this looks like a tool definition
-                                            if "name" in item or "tool" in item:
-                                                tool_name = item.get("name") or item.get("tool")
-                                                # Extract args if available or default to empty dict
-                                                args = {}
-                                                for arg_key in ["args", "arguments", "parameters"]:
-                                                    if arg_key in item and isinstance(item[arg_key], dict):
-                                                        args = item[arg_key]
-                                                        break
-                                                
-                                                reasoning = "Extracted from non-standard response"
-                                                for reason_key in ["reasoning", "reason", "description", "explanation"]:
-                                                    if reason_key in item and isinstance(item[reason_key], str):
-                                                        reasoning = item[reason_key]
-                                                        break
-                                                
-                                                tool_calls.append({
-                                                    "id": f"extracted_tool_{i}",
-                                                    "name": tool_name,
-                                                    "args": args,
-                                                    "reasoning": reasoning
-                                                })
-                                    
-                                    if tool_calls:
-                                        logger.info(f"Successfully extracted {len(tool_calls)} tools from non-standard response")
-                                    else:
-                                        # No valid tools found, use fallback
-                                        logger.warning("No valid tools could be extracted, using fallback")
-                                        tool_calls = [{
-                                            "id": "fallback_tool",
-                                            "name": "get_information_about_Argos",
-                                            "args": {},
-                                            "reasoning": "Non-standard response format, fallback to general information"
-                                        }]
-                                else:
-                                    # No potential tool fields found, use fallback
-                                    logger.warning("No potential tool fields found, using fallback")
-                                    tool_calls = [{
-                                        "id": "fallback_tool",
-                                        "name": "get_information_about_Argos",
-                                        "args": {},
-                                        "reasoning": "Non-standard response format, fallback to general information"
-                                    }]
-                    except json.JSONDecodeError as json_e:
-                        logger.error(f"Failed to parse JSON: {json_e}")
-                        logger.debug(f"Problematic JSON string: {json_response}")
-                        # Fallback: try to extract tool names with regex
-                        tool_regex = r'"name":\s*"([^"]+)"'
-                        tool_matches = re.findall(tool_regex, json_response)
-                        logger.debug(f"Found tool names with regex: {tool_matches}")
-                        
-                        # Create fallback tool call
-                        tool_calls = [{
-                            "id": "fallback_tool",
-                            "name": "get_information_about_Argos",
-                            "args": {},
-                            "reasoning": "JSON parsing error, fallback to general information"
-                        }]
-                    
-                    # Successfully processed the response, break out of retry loop
-                    break
-                    
-                except Exception as tool_e:
-                    retry_count += 1
-                    log_api_response_time("Tool Model", model_name, start_time, status="error")
-                    error_type = type(tool_e).__name__
-                    error_details = str(tool_e)
-                    
-                    # Check if this is a 503 error that we should retry
-                    is_503_error = False
-                    if error_type == "InternalServerError" and "503" in str(error_details):
-                        is_503_error = True
-                    
-                    # Log detailed error information
-                    logger.error(f"Tool Model API Error ({error_type}): {error_details}")
-                    
-                    # Create a detailed error panel for inspection
-                    error_panel = Panel(
-                        f"Error Type: {error_type}\nDetails: {error_details}",
-                        title="Tool Model LLM API Error",
-                        border_style="red",
-                        expand=False
+                        tool_calls = await self._select_tools_with_llm(structured_messages, ctx, on_tool_call=dispatch_tool_call)
+                    finally:
+                        self._discard_speculative_prefetch(ctx)
+
+                # Cache the plan unless it is an error fallback or was cut short
+                if ctx.tool_plan_complete and not any(call.get("id") == "fallback_tool" for call in tool_calls):
+                    self.tool_plan_cache.put(
+                        latest_user_query,
+                        conversation_context,
+                        tool_calls,
+                        ttl_seconds=self.valves.tool_plan_cache_ttl
                     )
-                    console.print(error_panel)
-                    
-                    # For 503 errors, retry if we haven't exceeded max retries
-                    if is_503_error and retry_count <= max_retries:
-                        wait_time = backoff_time * (2 ** (retry_count - 1))
-                        logger.warning(f"Got 503 error, retrying in {wait_time}s (attempt {retry_count}/{max_retries})")
-                        # Wait before retry with exponential backoff
-                        time.sleep(wait_time)
-                        continue
-                    
-                    # If we've used all retries or it's not a 503 error, use the fallback
-                    if retry_count > max_retries:
-                        logger.warning(f"Max retries ({max_retries}) exceeded, using fallback tool")
-                    elif not is_503_error:
-                        logger.warning(f"Non-503 error occurred, using fallback tool")
-                    
-                    # Fallback to basic tool call for get_information_about_Argos
-                    tool_calls = [{
-                        "id": "fallback_tool",
-                        "name": "get_information_about_Argos",
-                        "args": {},
-                        "reasoning": "Fallback to general information about Argos due to an error in tool selection"
-                    }]
-                    logger.warning("Using fallback tool call due to API error")
-                    break
+            ctx.record_timing("tool_selection", selection_start)
+
+            # Cached and fast-path plans are complete up front, so dispatch them all at once, with their RULAC queries batched
+            if not tool_tasks:
+                with use_rulac_batch(self._rulac_query_batch(tool_calls)):
+                    for tool_call in tool_calls:
+                        dispatch_tool_call(tool_call)
 
             # # Display tool selection decisions
             # formatted_tool_decision = Text()
@@ -1550,7 +1541,7 @@ Return only valid JSON without any other text. Be concise.
             # console.print(panel)
 
             # Emit tool-specific status update *after* invocation completes
-            await self.emit_event(
+            ctx.enqueue_event(
                         {
                             "type": "status",
                             "data": {
@@ -1566,267 +1557,11 @@ Return only valid JSON without any other text. Be concise.
                                 "START OF TOOL CALLS\n" + 
                                 "="*50 + "[/bold yellow]\n")
 
-            # Execute all tools in parallel using asyncio.gather
-            async def process_tool_call(tool_call):
-                
-                # Debug logging level right before the conditional check
-                # print(f"DEBUG - Logger level before tool call: {logger.level} (ERROR={logging.ERROR}, INFO={logging.INFO}, DEBUG={logging.DEBUG})")
-                # print(f"DEBUG - Is INFO enabled? {logger.isEnabledFor(logging.INFO)}")
-                
-                if logger.isEnabledFor(logging.INFO):
-                    # Display tool call details for debugging
-                    formatted_tool_call = Text()
-                    formatted_tool_call.append(f"Processing Tool Call: {tool_call['name']}\n", style="bold underline")
-                    formatted_tool_call.append("Arguments:\n")
-                    for key, value in tool_call['args'].items():
-                        formatted_tool_call.append(f"  {key}: {value}\n")
-                    formatted_tool_call.append(f"Reasoning: {tool_call['reasoning']}\n")
-                    panel = Panel(
-                        formatted_tool_call,
-                        style="white on black",
-                        border_style="blue",
-                        title="[PROCESSING TOOL]",
-                        title_align="left",
-                        expand=True,
-                    )
-                    console.print(panel)
-                
-                # Select the appropriate tool function based on name
-                tool_functions = {
-                    "get_armed_conflict_data_by_country": get_armed_conflict_data_by_country,
-                    "get_armed_conflict_data_by_non_state_actor": get_armed_conflict_data_by_non_state_actor,
-                    "get_armed_conflict_data_by_organization": get_armed_conflict_data_by_organization,
-                    "get_armed_conflict_data_by_region": get_armed_conflict_data_by_region,
-                    "get_information_about_RULAC": get_information_about_RULAC,
-                    "get_RULAC_conflict_classification_methodology": get_RULAC_conflict_classification_methodology,
-                    "get_international_law_framework": get_international_law_framework,
-                    "get_information_about_Argos": get_information_about_Argos,
-                    "brave_search": brave_search,
-                    "get_human_rights_research_by_country": get_human_rights_research_by_country,
-                    "get_combined_news": get_combined_news
-                }
-                
-                if tool_call["name"] not in tool_functions:
-                    logger.warning(f"Unknown tool: {tool_call['name']}")
-                    return None
-                
-                selected_tool = tool_functions[tool_call["name"]]
-                
-                # Fix missing parameters based on known tool requirements
-                fixed_args = tool_call["args"].copy()
-                
-                # Special handling for specific tools with known required parameters
-                if tool_call["name"] == "get_armed_conflict_data_by_country":
-                    # Ensure countries parameter exists as a list
-                    if "countries" not in fixed_args or not isinstance(fixed_args["countries"], list):
-                        if "countries" in fixed_args and isinstance(fixed_args["countries"], str):
-                            # Convert string to list with one element
-                            fixed_args["countries"] = [fixed_args["countries"]]
-                        else:
-                            # Default empty list
-                            fixed_args["countries"] = []
-                    
-                    # Ensure conflict_types parameter exists as a list
-                    if "conflict_types" not in fixed_args:
-                        fixed_args["conflict_types"] = []
-                        logger.warning(f"Added missing required parameter 'conflict_types' with default value []")
-                
-                # Similar fixes for other tools
-                if tool_call["name"] == "get_armed_conflict_data_by_non_state_actor":
-                    if "non_state_actors" not in fixed_args or not isinstance(fixed_args["non_state_actors"], list):
-                        if "non_state_actors" in fixed_args and isinstance(fixed_args["non_state_actors"], str):
-                            fixed_args["non_state_actors"] = [fixed_args["non_state_actors"]]
-                        else:
-                            fixed_args["non_state_actors"] = []
-                
-                if tool_call["name"] == "get_armed_conflict_data_by_organization":
-                    if "organizations" not in fixed_args or not isinstance(fixed_args["organizations"], list):
-                        if "organizations" in fixed_args and isinstance(fixed_args["organizations"], str):
-                            fixed_args["organizations"] = [fixed_args["organizations"]]
-                        else:
-                            fixed_args["organizations"] = []
-                    if "conflict_types" not in fixed_args:
-                        fixed_args["conflict_types"] = []
-                
-                if tool_call["name"] == "get_armed_conflict_data_by_region":
-                    if "regions" not in fixed_args or not isinstance(fixed_args["regions"], list):
-                        if "regions" in fixed_args and isinstance(fixed_args["regions"], str):
-                            fixed_args["regions"] = [fixed_args["regions"]]
-                        else:
-                            fixed_args["regions"] = []
-                    if "conflict_types" not in fixed_args:
-                        fixed_args["conflict_types"] = []
-                
-                if tool_call["name"] == "get_international_law_framework" and "law_focus" not in fixed_args:
-                    fixed_args["law_focus"] = "International Humanitarian Law (IHL)"
-                
-                if tool_call["name"] == "get_human_rights_research_by_country" and "country" not in fixed_args:
-                    fixed_args["country"] = "Unknown"
-                
-                if tool_call["name"] == "brave_search" and "query" not in fixed_args:
-                    fixed_args["query"] = "Missing query"
-                
-                if tool_call["name"] == "get_combined_news" and "search_query" not in fixed_args:
-                    fixed_args["search_query"] = "Current news"
-                
-                # Log if any parameters were fixed
-                if fixed_args != tool_call["args"]:
-                    logger.warning(f"Fixed tool arguments for {tool_call['name']}: {tool_call['args']} -> {fixed_args}")
-                    # Update the tool_call with fixed arguments for logging/display
-                    tool_call["args"] = fixed_args
-
-                # Get tool-specific friendly name for UI status
-                tool_name = tool_call["name"]
-                friendly_description = self.tool_friendly_names.get(
-                    tool_name, 
-                    f"🔍 Researching with {tool_name}..."
-                )
-
-                # Add detailed tool params to status (optional)
-                if tool_name == "get_armed_conflict_data_by_country" and "countries" in tool_call["args"]:
-                    countries = tool_call["args"]["countries"]
-                    if isinstance(countries, list) and countries:
-                        country_names = " and ".join(countries)
-                        friendly_description = f"Analyzing RULAC conflict profiles on '{country_names}'"
-                elif tool_name == "get_human_rights_research_by_country" and "country" in tool_call["args"]:
-                    country = tool_call["args"]["country"]
-                    friendly_description = f"Analyzing HRW human rights research on '{country}'"
-                elif tool_name == "brave_search" and "query" in tool_call["args"]:
-                    query = tool_call["args"]["query"]
-                    friendly_description = f"Searching web for '{query}'"
-                elif tool_name == "get_international_law_framework" and "law_focus" in tool_call["args"]:
-                    law_focus = tool_call["args"]["law_focus"]
-                    friendly_description = f"Analyzing framework on '{law_focus}'"
-                elif tool_name == "get_RULAC_conflict_classification_methodology":
-                    friendly_description = f"Analyzing RULAC conflict classification methodology"
-                elif tool_name == "get_combined_news" and "search_query" in tool_call["args"]:
-                    query = tool_call["args"]["search_query"]
-                    friendly_description = f"Checking developments on '{query}'"
-
-                # Execute the tool and return results
-                try:
-                    tool_output = await selected_tool.ainvoke(fixed_args)
-                    
-                    # Emit tool-specific status update *after* invocation completes
-                    # --- Add Lock and Delay Logic ---
-                    async with self.tool_status_lock:
-                        if self.is_first_tool_status_update:
-                            # First tool update, emit immediately and set flag
-                            self.is_first_tool_status_update = False
-                        else:
-                            # Subsequent tool updates, wait 2 seconds
-                            await asyncio.sleep(2)
-                        
-                        # Now emit the event
-                        await self.emit_event(
-                            {
-                                "type": "status",
-                                "data": {
-                                    "description": friendly_description,
-                                    "done": False,
-                                },
-                            }
-                        )
-                    # --- End Lock and Delay Logic ---
-
-                    # Process the output
-                    if isinstance(tool_output, dict) and "content" in tool_output and "citations" in tool_output:
-                        content = tool_output["content"]
-                        citations = tool_output["citations"]
-                        
-                        # Process citations
-                        if citations and isinstance(citations, list):
-                            for citation in citations:
-                                if isinstance(citation, dict) and "url" in citation:
-                                    citation_url = citation.get("url", "")
-                                    citation_title = citation.get("title", "Source")
-                                    formatted_content = citation.get("formatted_content", "")
-                                    
-                                    # Only emit new citations to avoid duplicates, unless it's a Brave search result
-                                    should_emit_citation = citation_url and (
-                                        citation_url == "https://search.brave.com" or 
-                                        citation_url not in self.global_unique_citations_retreived
-                                    )
-                                    
-                                    if should_emit_citation:
-                                        # Create citation event for UI
-                                        citation_event = {
-                                            "type": "citation",
-                                            "data": {
-                                                "document": [formatted_content],
-                                                "metadata": [
-                                                    {
-                                                        "date_accessed": datetime.now().isoformat(),
-                                                        "source": citation_title,
-                                                    }
-                                                ],
-                                                "source": {
-                                                    "name": citation_url.replace('http://www.', '').replace('https://www.', '').replace('http://', '').replace('https://', ''), 
-                                                    "url": citation_url
-                                                },
-                                            }
-                                        }
-
-                                        # Emit citation event to UI
-                                        await self.emit_event(citation_event)
-                                        # logger.info(f"Emitted citation event: {citation_event}")
-                                        # Track citation count
-                                        self.global_citation_count += 1
-                                        # Track unique URLs, making Brave URLs unique for the set
-                                        if should_emit_citation:
-                                            if citation_url == "https://search.brave.com":
-                                                # Append count to make Brave URL unique in the set
-                                                unique_brave_url = f"{citation_url}#{self.global_citation_count}" 
-                                                self.global_unique_citations_retreived.add(unique_brave_url)
-                                            elif citation_url not in self.global_unique_citations_retreived:
-                                                # Add other URLs only if they are new
-                                                self.global_unique_citations_retreived.add(citation_url)
-                        
-                        # Return formatted output
-                        return {
-                            "tool_name": tool_call["name"],
-                            "tool_call_id": tool_call["id"],
-                            "content": content,
-                            "args": tool_call["args"],
-                            "reasoning": tool_call["reasoning"]
-                        }
-                    else:
-                        # Handle non-standard tool outputs
-                        return {
-                            "tool_name": tool_call["name"],
-                            "tool_call_id": tool_call["id"],
-                            "content": tool_output,
-                            "args": tool_call["args"],
-                            "reasoning": tool_call["reasoning"]
-                        }
-                except Exception as e:
-                    # Handle tool execution errors
-                    panel = Panel.fit(
-                        f"❌ Error invoking tool {tool_call['name']}:\n{e}",
-                        style="white on red",
-                        border_style="red",
-                    )
-                    console.print(panel)
-                    logger.error(f"Tool execution error: {e}")
-                    
-                    # Return error information
-                    return {
-                        "tool_name": tool_call["name"],
-                        "tool_call_id": tool_call["id"],
-                        "content": f"Error executing tool: {str(e)}",
-                        "error": True,
-                        "args": tool_call["args"],
-                        "reasoning": tool_call["reasoning"]
-                    }
-
-            # Create tasks to run in parallel
-            tool_tasks = [process_tool_call(tool_call) for tool_call in tool_calls]
-            
-            # Execute all tools in parallel
+            # Wait for the dispatched tools, which run in parallel, each only until its soft deadline
             logger.info(f"Running {len(tool_tasks)} tool tasks in parallel")
-            # Reset the flag before starting parallel tasks
-            self.is_first_tool_status_update = True
-            tool_results = await asyncio.gather(*tool_tasks)
+            tool_results = await self._collect_tool_results(tool_tasks, ctx)
+            if tool_execution_start is not None:
+                ctx.record_timing("tool_execution", tool_execution_start)
             
             # Filter out None results and add to tool_outputs
             for result in tool_results:
@@ -1841,7 +1576,7 @@ Return only valid JSON without any other text. Be concise.
 
             # Log summary of tool execution
             logger.debug(f"Collected {len(tool_outputs)} tool outputs")
-            logger.info(f"Successfully emitted all collected citations: {self.global_citation_count}")
+            logger.info(f"Successfully queued all collected citations: {ctx.citation_count}")
 
             # Only print if logging level is INFO or below
             if logger.isEnabledFor(logging.INFO):
@@ -1853,8 +1588,11 @@ Return only valid JSON without any other text. Be concise.
             return tool_outputs
 
         except Exception as e:
-            # Handle overall process errors
+            # Handle overall process errors; tools already dispatched are not waited for, so stop them
             logger.error(f"Error during tool model execution: {e}")
+            for _, task, _ in tool_tasks:
+                if not task.done():
+                    task.cancel()
             return [{
                 "tool_name": "get_information_about_Argos",
                 "tool_call_id": "error_recovery",
@@ -1863,23 +1601,674 @@ Return only valid JSON without any other text. Be concise.
                 "reasoning": "Error during tool model execution"
             }]
 
-    def handle_tool_query_final_response(self, tool_outputs: list[dict], original_messages: list[dict]) -> Generator[str, None, None]:
+    def _tool_deadline(self, tool_name: str, ctx: RequestContext) -> float:
         """
-        Generates the final response after all research tools have been executed.
+        Absolute time by which a tool dispatched now should finish: its soft deadline,
+        capped by the request deadline.
+        """
+        soft_deadline = self.valves.news_tool_soft_deadline if tool_name == "get_combined_news" else self.valves.tool_soft_deadline
+        deadline = time.time() + soft_deadline
+        if ctx.deadline is not None:
+            deadline = min(deadline, ctx.deadline)
+        return deadline
+
+    async def _collect_tool_results(self, tool_tasks: list[tuple[dict, asyncio.Task, float]], ctx: RequestContext) -> list[dict]:
+        """
+        Wait for dispatched tools until their deadlines instead of for the slowest tool.
+        
+        Tools that finish in time contribute their output; tools still running at their
+        deadline are cancelled and reported as unavailable, so the final response can start
+        with the partial results.
+        
+        Args:
+            tool_tasks: (tool_call, task, absolute deadline) entries in dispatch order
+            ctx: Per-request context for the current pipe run
+            
+        Returns:
+            Tool output dicts in dispatch order
+        """
+        tool_results = []
+        # The tasks already run in parallel, so waiting on them in turn costs no more than the latest deadline
+        for tool_call, task, deadline in tool_tasks:
+            try:
+                tool_results.append(await asyncio.wait_for(task, timeout=max(0.0, deadline - time.time())))
+            except asyncio.TimeoutError:
+                # wait_for has cancelled the late tool
+                logger.warning(f"Tool {tool_call['name']} ({tool_call['id']}) missed its deadline and was cancelled")
+                ctx.timings[f"timed_out:{tool_call['id']}"] = time.time() - ctx.start_time
+                ctx.enqueue_event(
+                    {
+                        "type": "status",
+                        "data": {
+                            "description": f"{tool_call['name']} did not finish in time, continuing without it",
+                            "done": False,
+                        },
+                    }
+                )
+                tool_results.append({
+                    "tool_name": tool_call["name"],
+                    "tool_call_id": tool_call["id"],
+                    "content": f"Results from {tool_call['name']} are unavailable: the tool did not finish within the response time budget. Do not speculate about what it would have returned.",
+                    "error": True,
+                    "timed_out": True,
+                    "args": tool_call["args"],
+                    "reasoning": tool_call["reasoning"]
+                })
+        return tool_results
+
+    def _start_speculative_prefetch(self, latest_user_query: str, ctx: RequestContext):
+        """
+        Start the RULAC lookups for entities named in the query while the tool-selection LLM plans.
+        
+        The tasks are kept in ctx.prefetch_tasks under their canonical tool call key; dispatched
+        tool calls with the same key reuse them instead of querying Neo4j again.
+        """
+        rulac_tools = {
+            "get_armed_conflict_data_by_country": get_armed_conflict_data_by_country,
+            "get_armed_conflict_data_by_non_state_actor": get_armed_conflict_data_by_non_state_actor,
+            "get_armed_conflict_data_by_organization": get_armed_conflict_data_by_organization,
+            "get_armed_conflict_data_by_region": get_armed_conflict_data_by_region,
+        }
+        speculative_calls = plan_speculative_rulac_calls(latest_user_query)
+        with use_rulac_batch(self._rulac_query_batch(speculative_calls)):
+            for tool_call in speculative_calls:
+                key = make_tool_call_key(tool_call["name"], tool_call["args"])
+                invoke_args = {**tool_call["args"], **self._rulac_injected_args(tool_call["name"], ctx)}
+                ctx.prefetch_tasks[key] = asyncio.create_task(rulac_tools[tool_call["name"]].ainvoke(invoke_args))
+                logger.info(f"Speculatively prefetching {key}")
+
+    def _rulac_query_batch(self, tool_calls: List[dict]):
+        """
+        Batch for the Neo4j queries of the RULAC conflict tools among tool_calls, or None when batching
+        is disabled or fewer than two of them run. Tool tasks created under use_rulac_batch() join it.
+        """
+        rulac_calls = [call for call in tool_calls if call["name"].startswith("get_armed_conflict_data_by_")]
+        if not self.valves.enable_rulac_query_batching or len(rulac_calls) < 2:
+            return None
+        logger.debug(f"Batching the RULAC queries of {len(rulac_calls)} tool calls")
+        return new_rulac_query_batch(len(rulac_calls))
+
+    def _rulac_injected_args(self, tool_name: str, ctx: RequestContext) -> dict:
+        """Arguments hidden from the tool-calling schema that the pipeline passes to RULAC conflict tools"""
+        if not tool_name.startswith("get_armed_conflict_data_by_"):
+            return {}
+        return {"token_budget": self.valves.rulac_profile_token_budget, "relevance_query": ctx.latest_user_query}
+
+    def _discard_speculative_prefetch(self, ctx: RequestContext):
+        """Cancel the prefetched lookups that no selected tool claimed"""
+        for key, task in ctx.prefetch_tasks.items():
+            logger.info(f"Discarding unused speculative prefetch {key}")
+            if task.done():
+                # Retrieve any exception so a failed lookup nobody needed is not reported as unhandled
+                if not task.cancelled():
+                    task.exception()
+            else:
+                task.cancel()
+        ctx.prefetch_tasks.clear()
+
+    async def _process_tool_call(self, tool_call: dict, ctx: RequestContext, prefetched: Optional[asyncio.Task] = None) -> dict:
+        """
+        Run a single selected tool and emit its status and citation events.
+        
+        Args:
+            tool_call: Tool call dict with id, name, args and reasoning
+            ctx: Per-request context for the current pipe run
+            prefetched: Speculative lookup task already running for this exact call, reused instead of invoking the tool
+            
+        Returns:
+            Tool output dict for the final response, or an error entry if the tool failed
+        """
+                
+        # Debug logging level right before the conditional check
+        # print(f"DEBUG - Logger level before tool call: {logger.level} (ERROR={logging.ERROR}, INFO={logging.INFO}, DEBUG={logging.DEBUG})")
+        # print(f"DEBUG - Is INFO enabled? {logger.isEnabledFor(logging.INFO)}")
+                
+        if logger.isEnabledFor(logging.INFO):
+            # Display tool call details for debugging
+            formatted_tool_call = Text()
+            formatted_tool_call.append(f"Processing Tool Call: {tool_call['name']}\n", style="bold underline")
+            formatted_tool_call.append("Arguments:\n")
+            for key, value in tool_call['args'].items():
+                formatted_tool_call.append(f"  {key}: {value}\n")
+            formatted_tool_call.append(f"Reasoning: {tool_call['reasoning']}\n")
+            panel = Panel(
+                formatted_tool_call,
+                style="white on black",
+                border_style="blue",
+                title="[PROCESSING TOOL]",
+                title_align="left",
+                expand=True,
+            )
+            console.print(panel)
+                
+        # Select the appropriate tool function based on name
+        tool_functions = {
+            "get_armed_conflict_data_by_country": get_armed_conflict_data_by_country,
+            "get_armed_conflict_data_by_non_state_actor": get_armed_conflict_data_by_non_state_actor,
+            "get_armed_conflict_data_by_organization": get_armed_conflict_data_by_organization,
+            "get_armed_conflict_data_by_region": get_armed_conflict_data_by_region,
+            "get_information_about_RULAC": get_information_about_RULAC,
+            "get_RULAC_conflict_classification_methodology": get_RULAC_conflict_classification_methodology,
+            "get_international_law_framework": get_international_law_framework,
+            "get_information_about_Argos": get_information_about_Argos,
+            "brave_search": brave_search,
+            "get_human_rights_research_by_country": get_human_rights_research_by_country,
+            "get_combined_news": get_combined_news
+        }
+                
+        if tool_call["name"] not in tool_functions:
+            logger.warning(f"Unknown tool: {tool_call['name']}")
+            return None
+                
+        selected_tool = tool_functions[tool_call["name"]]
+                
+        # Fix missing parameters based on known tool requirements
+        fixed_args = tool_call["args"].copy()
+                
+        # Special handling for specific tools with known required parameters
+        if tool_call["name"] == "get_armed_conflict_data_by_country":
+            # Ensure countries parameter exists as a list
+            if "countries" not in fixed_args or not isinstance(fixed_args["countries"], list):
+                if "countries" in fixed_args and isinstance(fixed_args["countries"], str):
+                    # Convert string to list with one element
+                    fixed_args["countries"] = [fixed_args["countries"]]
+                else:
+                    # Default empty list
+                    fixed_args["countries"] = []
+                    
+            # Ensure conflict_types parameter exists as a list
+            if "conflict_types" not in fixed_args:
+                fixed_args["conflict_types"] = []
+                logger.warning(f"Added missing required parameter 'conflict_types' with default value []")
+                
+        # Similar fixes for other tools
+        if tool_call["name"] == "get_armed_conflict_data_by_non_state_actor":
+            if "non_state_actors" not in fixed_args or not isinstance(fixed_args["non_state_actors"], list):
+                if "non_state_actors" in fixed_args and isinstance(fixed_args["non_state_actors"], str):
+                    fixed_args["non_state_actors"] = [fixed_args["non_state_actors"]]
+                else:
+                    fixed_args["non_state_actors"] = []
+                
+        if tool_call["name"] == "get_armed_conflict_data_by_organization":
+            if "organizations" not in fixed_args or not isinstance(fixed_args["organizations"], list):
+                if "organizations" in fixed_args and isinstance(fixed_args["organizations"], str):
+                    fixed_args["organizations"] = [fixed_args["organizations"]]
+                else:
+                    fixed_args["organizations"] = []
+            if "conflict_types" not in fixed_args:
+                fixed_args["conflict_types"] = []
+                
+        if tool_call["name"] == "get_armed_conflict_data_by_region":
+            if "regions" not in fixed_args or not isinstance(fixed_args["regions"], list):
+                if "regions" in fixed_args and isinstance(fixed_args["regions"], str):
+                    fixed_args["regions"] = [fixed_args["regions"]]
+                else:
+                    fixed_args["regions"] = []
+            if "conflict_types" not in fixed_args:
+                fixed_args["conflict_types"] = []
+                
+        if tool_call["name"] == "get_international_law_framework" and "law_focus" not in fixed_args:
+            fixed_args["law_focus"] = "International Humanitarian Law (IHL)"
+                
+        if tool_call["name"] == "get_human_rights_research_by_country" and "country" not in fixed_args:
+            fixed_args["country"] = "Unknown"
+                
+        if tool_call["name"] == "brave_search" and "query" not in fixed_args:
+            fixed_args["query"] = "Missing query"
+                
+        if tool_call["name"] == "get_combined_news" and "search_query" not in fixed_args:
+            fixed_args["search_query"] = "Current news"
+                
+        # Log if any parameters were fixed
+        if fixed_args != tool_call["args"]:
+            logger.warning(f"Fixed tool arguments for {tool_call['name']}: {tool_call['args']} -> {fixed_args}")
+            # Update the tool_call with fixed arguments for logging/display
+            tool_call["args"] = fixed_args
+
+        # Get tool-specific friendly name for UI status
+        tool_name = tool_call["name"]
+        friendly_description = self.tool_friendly_names.get(
+            tool_name, 
+            f"🔍 Researching with {tool_name}..."
+        )
+
+        # Add detailed tool params to status (optional)
+        if tool_name == "get_armed_conflict_data_by_country" and "countries" in tool_call["args"]:
+            countries = tool_call["args"]["countries"]
+            if isinstance(countries, list) and countries:
+                country_names = " and ".join(countries)
+                friendly_description = f"Analyzing RULAC conflict profiles on '{country_names}'"
+        elif tool_name == "get_human_rights_research_by_country" and "country" in tool_call["args"]:
+            country = tool_call["args"]["country"]
+            friendly_description = f"Analyzing HRW human rights research on '{country}'"
+        elif tool_name == "brave_search" and "query" in tool_call["args"]:
+            query = tool_call["args"]["query"]
+            friendly_description = f"Searching web for '{query}'"
+        elif tool_name == "get_international_law_framework" and "law_focus" in tool_call["args"]:
+            law_focus = tool_call["args"]["law_focus"]
+            friendly_description = f"Analyzing framework on '{law_focus}'"
+        elif tool_name == "get_RULAC_conflict_classification_methodology":
+            friendly_description = f"Analyzing RULAC conflict classification methodology"
+        elif tool_name == "get_combined_news" and "search_query" in tool_call["args"]:
+            query = tool_call["args"]["search_query"]
+            friendly_description = f"Checking developments on '{query}'"
+
+        # Execute the tool and return results
+        try:
+            if prefetched is not None:
+                tool_output = await prefetched
+            else:
+                tool_output = await selected_tool.ainvoke({**fixed_args, **self._rulac_injected_args(tool_call["name"], ctx)})
+                    
+            # Emit tool-specific status update *after* invocation completes
+            # Queue the status update; the event pump paces it so parallel tools never wait on each other
+            ctx.enqueue_event(
+                {
+                    "type": "status",
+                    "data": {
+                        "description": friendly_description,
+                        "done": False,
+                    },
+                }
+            )
+
+            # Process the output
+            if isinstance(tool_output, dict) and "content" in tool_output and "citations" in tool_output:
+                content = tool_output["content"]
+                citations = tool_output["citations"]
+                        
+                # Process citations
+                if citations and isinstance(citations, list):
+                    for citation in citations:
+                        if isinstance(citation, dict) and "url" in citation:
+                            citation_url = citation.get("url", "")
+                            citation_title = citation.get("title", "Source")
+                            formatted_content = citation.get("formatted_content", "")
+                                    
+                            # Only emit new citations to avoid duplicates, unless it's a Brave search result
+                            # The URL is registered before emitting so parallel tools cannot emit the same source twice
+                            if ctx.register_citation(citation_url):
+                                # Create citation event for UI
+                                citation_event = {
+                                    "type": "citation",
+                                    "data": {
+                                        "document": [formatted_content],
+                                        "metadata": [
+                                            {
+                                                "date_accessed": datetime.now().isoformat(),
+                                                "source": citation_title,
+                                            }
+                                        ],
+                                        "source": {
+                                            "name": citation_url.replace('http://www.', '').replace('https://www.', '').replace('http://', '').replace('https://', ''), 
+                                            "url": citation_url
+                                        },
+                                    }
+                                }
+
+                                # Queue citation event for the UI
+                                ctx.enqueue_event(citation_event)
+                        
+                # Return formatted output
+                result = {
+                    "tool_name": tool_call["name"],
+                    "tool_call_id": tool_call["id"],
+                    "content": content,
+                    "args": tool_call["args"],
+                    "reasoning": tool_call["reasoning"]
+                }
+                # RULAC conflict tools also return their summary and shared conflict profiles for the merge stage
+                if "rulac_research" in tool_output:
+                    result["rulac_research"] = tool_output["rulac_research"]
+                return result
+            else:
+                # Handle non-standard tool outputs
+                return {
+                    "tool_name": tool_call["name"],
+                    "tool_call_id": tool_call["id"],
+                    "content": tool_output,
+                    "args": tool_call["args"],
+                    "reasoning": tool_call["reasoning"]
+                }
+        except Exception as e:
+            # Handle tool execution errors
+            panel = Panel.fit(
+                f"❌ Error invoking tool {tool_call['name']}:\n{e}",
+                style="white on red",
+                border_style="red",
+            )
+            console.print(panel)
+            logger.error(f"Tool execution error: {e}")
+                    
+            # Return error information
+            return {
+                "tool_name": tool_call["name"],
+                "tool_call_id": tool_call["id"],
+                "content": f"Error executing tool: {str(e)}",
+                "error": True,
+                "args": tool_call["args"],
+                "reasoning": tool_call["reasoning"]
+            }
+
+    async def _select_tools_with_llm(self, structured_messages: list[dict], ctx: RequestContext, on_tool_call: Optional[Callable[[dict], None]] = None) -> list[dict]:
+        """
+        Ask the tool-selection LLM which research tools to run.
+        
+        With the stream_tool_selection valve on, the completion is streamed and each tool object
+        is handed to on_tool_call as soon as its closing brace arrives, so tools start while the
+        model is still writing the rest of the plan. The full response is parsed at the end to pick
+        up anything the stream parser could not (non-standard formats, fallbacks).
+        
+        Each attempt is bounded by the tool_selection_timeout valve and by the time left before the
+        request deadline; 503 errors and timeouts are retried with exponential backoff (only while
+        no tool has been dispatched yet and the deadline leaves room for another attempt), and
+        get_information_about_Argos is used as a fallback.
+        
+        Args:
+            structured_messages: Messages containing the tool-selection prompt
+            ctx: Per-request context for the current pipe run
+            on_tool_call: Optional callback; every returned tool call is passed to it exactly once
+            
+        Returns:
+            List of tool call dictionaries with id, name, args and reasoning
+        """
+        # Get tool selection decisions from the LLM using direct Groq client instead of instructor
+        model_name = self.tool_model_name
+        log_api_request("Tool Model", model_name, {
+            "message_count": len(structured_messages),
+            "prompt_tokens_estimate": sum(len(m.get("content", "")) for m in structured_messages) // 4,
+            "stream": self.valves.stream_tool_selection
+        })
+        
+        start_time = time.time()
+        logger.info(f"Invoking Tool Selection LLM ({model_name})")
+        
+        # Shared async Groq client so the tool-selection round trip does not block the event loop for other chats
+        async_client = get_async_groq_client(self.valves.groq_api_key)
+        
+        # Tool calls already handed to on_tool_call, so nothing is dispatched twice
+        dispatched_calls = []
+        
+        def dispatch(tool_call: dict):
+            # Only recorded once it was handed over, so a failed dispatch is not mistaken for a running tool
+            if on_tool_call is not None:
+                on_tool_call(tool_call)
+            dispatched_calls.append(tool_call)
+        
+        async def stream_attempt() -> str:
+            # Groq's JSON mode does not support streaming, so the streamed request relies on the prompt's JSON-only instruction
+            parser = ToolCallStreamParser()
+            stream = await async_client.chat.completions.create(
+                model=model_name,
+                messages=structured_messages,
+                temperature=self.tool_temperature,
+                reasoning_format="parsed",
+                stream=True
+            )
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                content = chunk.choices[0].delta.content
+                if not content:
+                    continue
+                for tool_call in parser.feed(content):
+                    if not dispatched_calls:
+                        ctx.timings["first_tool_selected"] = time.time() - start_time
+                    logger.info(f"Streamed tool selection: {tool_call['name']} ({tool_call['id']})")
+                    dispatch(tool_call)
+            return parser.json_text
+        
+        async def json_attempt() -> str:
+            completion = await async_client.chat.completions.create(
+                model=model_name,
+                messages=structured_messages,
+                temperature=self.tool_temperature,
+                response_format={"type": "json_object"}
+            )
+            # Print raw API response details (more verbose)
+            if logger.getEffectiveLevel() == logging.DEBUG:
+                console.print(Panel(
+                    Pretty(completion.model_dump()),
+                    title="Debug: Raw Groq API Response",
+                    border_style="magenta",
+                    expand=False
+                ))
+            return completion.choices[0].message.content
+        
+        # Add retry logic for 503 errors and per-attempt timeouts
+        max_retries = 3
+        retry_count = 0
+        backoff_time = 1  # Initial backoff in seconds
+        json_response = None
+        
+        while retry_count <= max_retries:
+            # Never let tool selection use up the whole request budget, retries included
+            attempt_timeout = self.valves.tool_selection_timeout
+            time_remaining = ctx.time_remaining()
+            if time_remaining is not None:
+                if retry_count > 0 and time_remaining < 1.0:
+                    logger.warning("Request deadline reached during tool selection retries, using fallback tool")
+                    break
+                attempt_timeout = max(1.0, min(attempt_timeout, time_remaining))
+            
+            try:
+                attempt = stream_attempt() if self.valves.stream_tool_selection else json_attempt()
+                json_response = await asyncio.wait_for(attempt, timeout=attempt_timeout)
+                
+                log_api_response_time("Tool Model", model_name, start_time)
+                
+                # Extract the raw JSON response
+                logger.debug(f"Raw JSON response: {json_response}")
+                
+                # Successfully got a response, break out of retry loop
+                break
+                
+            except Exception as tool_e:
+                retry_count += 1
+                log_api_response_time("Tool Model", model_name, start_time, status="error")
+                error_type = type(tool_e).__name__
+                error_details = str(tool_e)
+                
+                # Check if this is a 503 error or an attempt timeout that we should retry
+                is_503_error = error_type == "InternalServerError" and "503" in error_details
+                is_timeout = isinstance(tool_e, asyncio.TimeoutError)
+                if is_timeout:
+                    error_details = f"No complete response within {attempt_timeout}s"
+                
+                # Log detailed error information
+                logger.error(f"Tool Model API Error ({error_type}): {error_details}")
+                
+                # Create a detailed error panel for inspection
+                error_panel = Panel(
+                    f"Error Type: {error_type}\nDetails: {error_details}",
+                    title="Tool Model LLM API Error",
+                    border_style="red",
+                    expand=False
+                )
+                console.print(error_panel)
+                
+                # Tools are already running from a partial stream, so keep them rather than re-planning
+                if dispatched_calls:
+                    ctx.tool_plan_complete = False
+                    logger.warning(f"Tool selection stream failed after {len(dispatched_calls)} tools were dispatched, continuing with those")
+                    break
+                
+                # For 503 errors and timeouts, retry if we haven't exceeded max retries
+                if (is_503_error or is_timeout) and retry_count <= max_retries:
+                    wait_time = backoff_time * (2 ** (retry_count - 1))
+                    time_remaining = ctx.time_remaining()
+                    if time_remaining is not None and wait_time + 1.0 > time_remaining:
+                        logger.warning("No time left before the request deadline to retry tool selection, using fallback tool")
+                        break
+                    logger.warning(f"Got {'timeout' if is_timeout else '503 error'}, retrying in {wait_time}s (attempt {retry_count}/{max_retries})")
+                    # Wait before retry with exponential backoff, without blocking the event loop
+                    await asyncio.sleep(wait_time)
+                    continue
+                
+                # If we've used all retries or the error is not retryable, use the fallback
+                if retry_count > max_retries:
+                    logger.warning(f"Max retries ({max_retries}) exceeded, using fallback tool")
+                else:
+                    logger.warning(f"Non-retryable error occurred, using fallback tool")
+                break
+
+        if json_response is not None:
+            tool_calls = self._parse_tool_selection_response(json_response)
+            if dispatched_calls:
+                # Streamed tools are authoritative; only add what the stream parser missed, never a fallback
+                dispatched_ids = {call["id"] for call in dispatched_calls}
+                for tool_call in tool_calls:
+                    if tool_call["id"] not in dispatched_ids and tool_call["id"] != "fallback_tool":
+                        dispatch(tool_call)
+            else:
+                for tool_call in tool_calls:
+                    dispatch(tool_call)
+        elif not dispatched_calls:
+            # Fallback to basic tool call for get_information_about_Argos
+            dispatch({
+                "id": "fallback_tool",
+                "name": "get_information_about_Argos",
+                "args": {},
+                "reasoning": "Fallback to general information about Argos due to an error in tool selection"
+            })
+            logger.warning("Using fallback tool call due to API error")
+
+        return dispatched_calls
+
+    def _parse_tool_selection_response(self, json_response: str) -> list[dict]:
+        """
+        Parse the raw JSON returned by the tool-selection model into tool call dicts.
+        
+        Handles the expected {"tools": [...]} format, tries to recover tool definitions
+        from non-standard responses, and falls back to get_information_about_Argos.
+        
+        Args:
+            json_response: Raw JSON string returned by the tool-selection model
+            
+        Returns:
+            List of tool call dictionaries with id, name, args and reasoning
+        """
+        try:
+            parsed_response = json.loads(json_response)
+            logger.debug(f"Parsed response: {json.dumps(parsed_response, indent=2)}")
+            
+            # Debug panel for full response structure
+            if logger.getEffectiveLevel() == logging.DEBUG:
+                console.print(Panel(
+                    Pretty(parsed_response),
+                    title="Debug: Full Parsed Response",
+                    border_style="green"
+                ))
+            
+            # Extract tool calls from the parsed response
+            tool_calls = []
+            if "tools" in parsed_response and isinstance(parsed_response["tools"], list):
+                for i, tool_info in enumerate(parsed_response["tools"]):
+                    # Numbered by array position, including non-tool elements, like the stream parser's ids
+                    if isinstance(tool_info, dict) and "name" in tool_info and "args" in tool_info:
+                        tool_calls.append({
+                            "id": f"tool_{i}",
+                            "name": tool_info["name"],
+                            "args": tool_info["args"],
+                            "reasoning": tool_info.get("reasoning", "No reasoning provided")
+                        })
+            else:
+                logger.warning(f"Unexpected response structure. No 'tools' array found.")
+                # Try to extract any tool-like information from the response
+                if isinstance(parsed_response, dict):
+                    for key, value in parsed_response.items():
+                        logger.debug(f"Checking field: {key} = {value}")
+                    
+                    # Try to find any field that looks like it might contain tools
+                    potential_tool_fields = []
+                    for key, value in parsed_response.items():
+                        if isinstance(value, list) and len(value) > 0:
+                            potential_tool_fields.append((key, value))
+                    
+                    if potential_tool_fields:
+                        logger.info(f"Found potential tool fields: {[f[0] for f in potential_tool_fields]}")
+                        # Use the first list field as potential tools
+                        field_name, field_value = potential_tool_fields[0]
+                        logger.info(f"Using '{field_name}' as tools array")
+                        
+                        for i, item in enumerate(field_value):
+                            if isinstance(item, dict):
+                                # Check if this looks like a tool definition
+                                if "name" in item or "tool" in item:
+                                    tool_name = item.get("name") or item.get("tool")
+                                    # Extract args if available or default to empty dict
+                                    args = {}
+                                    for arg_key in ["args", "arguments", "parameters"]:
+                                        if arg_key in item and isinstance(item[arg_key], dict):
+                                            args = item[arg_key]
+                                            break
+                                    
+                                    reasoning = "Extracted from non-standard response"
+                                    for reason_key in ["reasoning", "reason", "description", "explanation"]:
+                                        if reason_key in item and isinstance(item[reason_key], str):
+                                            reasoning = item[reason_key]
+                                            break
+                                    
+                                    tool_calls.append({
+                                        "id": f"extracted_tool_{i}",
+                                        "name": tool_name,
+                                        "args": args,
+                                        "reasoning": reasoning
+                                    })
+                        
+                        if tool_calls:
+                            logger.info(f"Successfully extracted {len(tool_calls)} tools from non-standard response")
+                        else:
+                            # No valid tools found, use fallback
+                            logger.warning("No valid tools could be extracted, using fallback")
+                            tool_calls = [{
+                                "id": "fallback_tool",
+                                "name": "get_information_about_Argos",
+                                "args": {},
+                                "reasoning": "Non-standard response format, fallback to general information"
+                            }]
+                    else:
+                        # No potential tool fields found, use fallback
+                        logger.warning("No potential tool fields found, using fallback")
+                        tool_calls = [{
+                            "id": "fallback_tool",
+                            "name": "get_information_about_Argos",
+                            "args": {},
+                            "reasoning": "Non-standard response format, fallback to general information"
+                        }]
+        except json.JSONDecodeError as json_e:
+            logger.error(f"Failed to parse JSON: {json_e}")
+            logger.debug(f"Problematic JSON string: {json_response}")
+            # Fallback: try to extract tool names with regex
+            tool_regex = r'"name":\s*"([^"]+)"'
+            tool_matches = re.findall(tool_regex, json_response)
+            logger.debug(f"Found tool names with regex: {tool_matches}")
+            
+            # Create fallback tool call
+            tool_calls = [{
+                "id": "fallback_tool",
+                "name": "get_information_about_Argos",
+                "args": {},
+                "reasoning": "JSON parsing error, fallback to general information"
+            }]
+        
+        return tool_calls
+
+    def _build_final_messages(self, tool_outputs: list[dict], original_messages: list[dict]) -> tuple[str, list[dict]]:
+        """
+        Builds the final LLM messages from the research outputs and the conversation.
         
         This function:
         1. Processes and organizes research outputs by category (RULAC, HRW, News, etc.)
         2. Combines all research into a structured format
         3. Creates a comprehensive system prompt with the research results
-        4. Sends the prompt and original conversation to the final LLM
-        5. Streams the generated response back to the user
         
         Args:
             tool_outputs: List of dictionaries containing tool outputs and metadata
             original_messages: Original conversation messages from the user
             
         Returns:
-            Generator that streams the final response tokens
+            Tuple of the final model name and the messages to send to it
         """
         logger.debug("Inside final tool query response function...")
         logger.debug(f"Processing {len(tool_outputs)} tool outputs with {len(original_messages)} original messages")
@@ -1956,12 +2345,15 @@ Return only valid JSON without any other text. Be concise.
             for tool_name in rulac_order:
                 for output in rulac_outputs:
                     if output["tool_name"] == tool_name:
-                        ordered_rulac_outputs.append(output["content"])
+                        ordered_rulac_outputs.append(output)
             
             # Add any remaining outputs not in the predefined order
             for output in rulac_outputs:
                 if output["tool_name"] not in rulac_order:
-                    ordered_rulac_outputs.append(output["content"])
+                    ordered_rulac_outputs.append(output)
+
+            # Keep one copy of each conflict profile across the conflict tools
+            ordered_rulac_outputs = merge_rulac_sections(ordered_rulac_outputs)
             
             # Add RULAC section with header
             combined_research += "<RULAC_research>\n## Rule of Law in Armed Conflict (RULAC) research\n\n" 
@@ -2099,9 +2491,32 @@ Return only valid JSON without any other text. Be concise.
         
         # Log final prompt with all messages
         # log_final_messages(final_messages, "Research Agent Complete Messages")
+
+        return model_name, final_messages
+
+    def handle_tool_query_final_response(self, tool_outputs: list[dict], original_messages: list[dict], ctx: Optional[RequestContext] = None) -> Generator[str, None, None]:
+        """
+        Generates the final response after all research tools have been executed.
+        
+        This function:
+        1. Processes and organizes research outputs by category (RULAC, HRW, News, etc.)
+        2. Combines all research into a structured format
+        3. Creates a comprehensive system prompt with the research results
+        4. Sends the prompt and original conversation to the final LLM
+        5. Streams the generated response back to the user
         
+        Args:
+            tool_outputs: List of dictionaries containing tool outputs and metadata
+            original_messages: Original conversation messages from the user
+            ctx: Optional per-request context used to record response timings
+            
+        Returns:
+            Generator that streams the final response tokens
+        """
+        model_name, final_messages = self._build_final_messages(tool_outputs, original_messages)
+
         # STEP 5: Set up the LLM client for generating the final response
-        chat_client = Groq(api_key=self.valves.groq_api_key)
+        chat_client = get_groq_client(self.valves.groq_api_key)
         logger.debug("Starting final tool use LLM response synchronous streaming...")
 
         # STEP 6: Set up the LLM client for generating and streaming the final response
@@ -2152,6 +2567,8 @@ Return only valid JSON without any other text. Be concise.
                         first_token_time = time.time()
                         time_to_first_token = first_token_time - start_time
                         logger.info(f"Time to first token: {time_to_first_token:.2f}s")
+                        if ctx:
+                            ctx.record_timing("time_to_first_token", ctx.start_time)
                     
                     # Log chunk progress periodically
                     if chunk_count % 10 == 0:
@@ -2168,6 +2585,8 @@ Return only valid JSON without any other text. Be concise.
                 completion_time = time.time() - start_time
                 log_api_response_time("Groq", model_name, start_time)
                 logger.info(f"Finished streaming: processed {chunk_count} chunks in {completion_time:.2f}s")
+                if ctx:
+                    ctx.record_timing("final_response", ctx.start_time)
                 
                 # Successful completion, break out of retry loop
                 break
@@ -2240,6 +2659,158 @@ Return only valid JSON without any other text. Be concise.
                     )
                     yield error_message
 
+    async def handle_tool_query_final_response_async(self, tool_outputs: list[dict], original_messages: list[dict], ctx: RequestContext) -> AsyncGenerator[str, None]:
+        """
+        Async variant of handle_tool_query_final_response, streaming through AsyncGroq.
+        
+        Token delivery and retry backoff never block the event loop, so the worker can
+        interleave many concurrent response streams. Retries, the fallback model and
+        time-to-first-token logging behave as in the synchronous version.
+        
+        Args:
+            tool_outputs: List of dictionaries containing tool outputs and metadata
+            original_messages: Original conversation messages from the user
+            ctx: Per-request context used to record response timings
+            
+        Returns:
+            Async generator that streams the final response tokens
+        """
+        model_name, final_messages = self._build_final_messages(tool_outputs, original_messages)
+
+        # STEP 5: Set up the async LLM client for generating the final response
+        chat_client = get_async_groq_client(self.valves.groq_api_key)
+        logger.debug("Starting final tool use LLM response asynchronous streaming...")
+
+        # STEP 6: Set up the LLM client for generating and streaming the final response
+        # Add detailed tracking of API call
+        api_params = {
+            "model": model_name,
+            "temperature": 0.6,
+            "max_completion_tokens": 4096,
+            "top_p": 0.95,
+            "stream": True,
+            "reasoning_format": "parsed", #this is the default for qwen/qwen3-32b
+            "message_count": len(final_messages),
+            "prompt_tokens_estimate": sum(len(m.get("content", "")) for m in final_messages) // 4
+        }
+        
+        log_api_request("Groq", model_name, api_params)
+
+        # STEP 7: Stream the final response from the LLM with retries and a fallback model
+        max_retries = 3
+        retry_count = 0
+        backoff_time = 1  # Initial backoff in seconds
+        
+        while retry_count <= max_retries:
+            try:
+                start_time = time.time()
+                logger.info(f"Invoking Groq LLM ({model_name}) - Attempt {retry_count + 1}/{max_retries + 1}")
+                
+                completion = await chat_client.chat.completions.create(
+                    model=model_name,
+                    messages=final_messages,
+                    temperature=0.6,
+                    max_completion_tokens=4096,
+                    top_p=0.95,
+                    stream=True,
+                    reasoning_format="raw"
+                )
+                
+                # Process streaming chunks and yield to caller
+                chunk_count = 0
+                
+                async for chunk in completion:
+                    chunk_count += 1
+                    
+                    # Record time to first token
+                    if chunk_count == 1:
+                        time_to_first_token = time.time() - start_time
+                        logger.info(f"Time to first token: {time_to_first_token:.2f}s")
+                        ctx.record_timing("time_to_first_token", ctx.start_time)
+                    
+                    if chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+                    else:
+                        logger.debug(f"Chunk {chunk_count} has no content.")
+                
+                # Log successful completion metrics
+                completion_time = time.time() - start_time
+                log_api_response_time("Groq", model_name, start_time)
+                logger.info(f"Finished streaming: processed {chunk_count} chunks in {completion_time:.2f}s")
+                ctx.record_timing("final_response", ctx.start_time)
+                
+                # Successful completion, break out of retry loop
+                break
+                
+            except Exception as e:
+                retry_count += 1
+                log_api_response_time("Groq", model_name, start_time, status="error")
+                
+                error_type = type(e).__name__
+                error_details = str(e)
+                logger.error(f"API Error ({error_type}): {error_details}")
+                
+                # Create a detailed error panel for inspection
+                error_panel = Panel(
+                    f"Error Type: {error_type}\nDetails: {error_details}",
+                    title="LLM API Error",
+                    border_style="red",
+                    expand=False
+                )
+                console.print(error_panel)
+                
+                # Check if we should retry
+                if retry_count <= max_retries:
+                    # Calculate backoff with exponential increase
+                    wait_time = backoff_time * (2 ** (retry_count - 1))
+                    logger.warning(f"Retrying in {wait_time:.1f}s (attempt {retry_count}/{max_retries})")
+                    
+                    # Yield a message to the user about the retry
+                    yield f"\n[Experiencing a temporary issue. Retrying... ({retry_count}/{max_retries})]\n"
+                    
+                    # Wait before retry without blocking other streams
+                    await asyncio.sleep(wait_time)
+                    
+                    # Try alternative model if available and we're on the last retry
+                    if retry_count == max_retries:
+                        alt_model = "llama-3.1-8b-instant"
+                        logger.info(f"Trying alternative model: {alt_model}")
+                        yield f"\n[Switching to alternative model due to service issues...]\n"
+                        
+                        try:
+                            log_api_request("Groq", alt_model)
+                            alt_start_time = time.time()
+                            
+                            alt_completion = await chat_client.chat.completions.create(
+                                model=alt_model,
+                                messages=final_messages,
+                                temperature=0.2,
+                                stream=True
+                            )
+                            
+                            alt_chunk_count = 0
+                            async for chunk in alt_completion:
+                                alt_chunk_count += 1
+                                if alt_chunk_count == 1:
+                                    logger.info(f"Time to first token ({alt_model}): {time.time() - alt_start_time:.2f}s")
+                                if chunk.choices[0].delta.content:
+                                    yield chunk.choices[0].delta.content
+                            
+                            log_api_response_time("Groq", alt_model, alt_start_time)
+                            break
+                            
+                        except Exception as alt_e:
+                            log_api_response_time("Groq", alt_model, alt_start_time, "error")
+                            logger.error(f"Alternative model also failed: {alt_e}")
+                else:
+                    # If all retries failed, yield a helpful error message
+                    error_message = (
+                        f"\n\nI apologize, but I'm experiencing technical difficulties connecting to my knowledge services. "
+                        f"Error details: {error_type} - {error_details}\n\n"
+                        f"Please try again in a few moments. If the problem persists, it may indicate an issue with the external API service."
+                    )
+                    yield error_message
+
 
 
 
@@ -2386,7 +2957,7 @@ def test_pipe():
         # Collect and display response
         final_answer = ""
         print("\nStreaming response:")
-        for token in response:
+        async for token in response:
             # print(token, end="")
             final_answer += token
 
@@ -2400,6 +2971,7 @@ def test_pipe():
         )
         console.print("\n")
         console.print(panel)
+        await pipe.on_shutdown()
 
     # Run the test
     asyncio.run(run_test())
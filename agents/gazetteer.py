@@ -0,0 +1,312 @@
+"""
+Gazetteer module for Beacon
+
+This module provides a small, local entity gazetteer for the countries, non-state actors,
+regions and organizations that the RULAC tools know about. The vocabularies mirror the
+ones enumerated in fine_tuning/4_generatePlaceholderQuestions.py and the RULAC tool
+docstrings, plus common aliases and acronyms. It is used to recognise entities in a
+user query without an LLM round trip.
+"""
+import re
+import unicodedata
+from typing import Dict, List, Tuple
+
+# // VOCABULARIES //
+
+# Countries (state actors), using the names from the RULAC graph / UN M49
+COUNTRIES = [
+    "Afghanistan", "Albania", "Algeria", "American Samoa", "Andorra", "Angola",
+    "Anguilla", "Antigua and Barbuda", "Argentina", "Armenia", "Aruba",
+    "Australia", "Austria", "Azerbaijan", "Bahamas", "Bahrain", "Bangladesh", "Barbados",
+    "Belarus", "Belgium", "Belize", "Benin", "Bermuda", "Bhutan", "Bolivia",
+    "Bosnia and Herzegovina", "Botswana", "Bouvet Island", "Brazil",
+    "British Indian Ocean Territory", "British Virgin Islands", "Brunei Darussalam",
+    "Bulgaria", "Burkina Faso", "Burundi", "Cabo Verde", "Cambodia", "Cameroon", "Canada",
+    "Cayman Islands", "Central African Republic", "Chad", "Chile", "China",
+    "Colombia", "Comoros", "Congo",
+    "Cook Islands", "Costa Rica", "Côte d'Ivoire", "Croatia", "Cuba", "Curaçao", "Cyprus",
+    "Czechia", "Democratic People's Republic of Korea", "Democratic Republic of the Congo",
+    "Denmark", "Djibouti", "Dominica", "Dominican Republic", "Ecuador", "Egypt",
+    "El Salvador", "Equatorial Guinea", "Eritrea", "Estonia", "Eswatini", "Ethiopia",
+    "Falkland Islands (Malvinas)", "Fiji", "Finland", "France", "French Guiana",
+    "French Polynesia", "French Southern Territories", "Gabon", "Gambia", "Georgia", "Germany",
+    "Ghana", "Gibraltar", "Greece", "Greenland", "Grenada", "Guadeloupe", "Guam", "Guatemala",
+    "Guernsey", "Guinea", "Guinea-Bissau", "Guyana", "Haiti", "Heard Island and McDonald Islands",
+    "Holy See", "Honduras", "Hungary", "Iceland", "India", "Indonesia", "Iran",
+    "Iraq", "Ireland", "Israel", "Italy", "Jamaica", "Japan", "Jersey", "Jordan",
+    "Kazakhstan", "Kenya", "Kiribati", "Kuwait", "Kyrgyzstan", "Lao People's Democratic Republic",
+    "Latvia", "Lebanon", "Lesotho", "Liberia", "Libya", "Liechtenstein", "Lithuania",
+    "Luxembourg", "Madagascar", "Malawi", "Malaysia", "Maldives", "Mali", "Malta",
+    "Marshall Islands", "Martinique", "Mauritania", "Mauritius", "Mayotte", "Mexico",
+    "Micronesia (Federated States of)", "Monaco", "Mongolia", "Montenegro", "Montserrat",
+    "Morocco", "Mozambique", "Myanmar", "Namibia", "Nauru", "Nepal",
+    "Netherlands", "New Caledonia", "New Zealand", "Nicaragua", "Niger",
+    "Nigeria", "Niue", "Norfolk Island", "North Macedonia", "Northern Mariana Islands",
+    "Norway", "Oman", "Pakistan", "Palau", "Panama", "Papua New Guinea", "Paraguay",
+    "Peru", "Philippines", "Pitcairn", "Poland", "Portugal", "Puerto Rico", "Qatar",
+    "Republic of Korea", "Republic of Moldova", "Réunion", "Romania", "Russian Federation",
+    "Rwanda", "Saint Barthélemy", "Saint Helena", "Saint Kitts and Nevis", "Saint Lucia",
+    "Saint Martin (French Part)", "Saint Pierre and Miquelon", "Saint Vincent and the Grenadines",
+    "Samoa", "San Marino", "Sao Tome and Principe", "Saudi Arabia", "Senegal", "Serbia",
+    "Seychelles", "Sierra Leone", "Singapore", "Sint Maarten (Dutch part)", "Slovakia",
+    "Slovenia", "Solomon Islands", "Somalia", "South Africa",
+    "South Georgia and the South Sandwich Islands", "South Sudan", "Spain", "Sri Lanka",
+    "State of Palestine", "Sudan", "Suriname", "Svalbard and Jan Mayen Islands", "Sweden",
+    "Switzerland", "Syrian Arab Republic", "Tajikistan", "Thailand", "Timor-Leste", "Togo",
+    "Tokelau", "Tonga", "Trinidad and Tobago", "Tunisia", "Türkiye", "Turkmenistan",
+    "Turks and Caicos Islands", "Tuvalu", "Uganda", "Ukraine", "United Arab Emirates",
+    "United Kingdom of Great Britain and Northern Ireland", "United Republic of Tanzania",
+    "United States of America", "United States Virgin Islands",
+    "Uruguay", "Uzbekistan", "Vanuatu", "Venezuela", "Viet Nam",
+    "Wallis and Futuna Islands", "Western Sahara", "Yemen", "Zambia", "Zimbabwe",
+]
+
+# Common names and abbreviations that users type instead of the official names
+COUNTRY_ALIASES = {
+    "Bolivia": ["Plurinational State of Bolivia"],
+    "Brunei Darussalam": ["Brunei"],
+    "Cabo Verde": ["Cape Verde"],
+    "Côte d'Ivoire": ["Ivory Coast", "Cote d'Ivoire"],
+    "Czechia": ["Czech Republic"],
+    "Democratic People's Republic of Korea": ["North Korea", "DPRK"],
+    "Democratic Republic of the Congo": ["Democratic Republic of Congo", "DR Congo", "DRC", "Congo-Kinshasa"],
+    "Congo": ["Republic of the Congo", "Congo-Brazzaville"],
+    "Eswatini": ["Swaziland"],
+    "Iran": ["Islamic Republic of Iran"],
+    "Lao People's Democratic Republic": ["Laos"],
+    "Micronesia (Federated States of)": ["Micronesia"],
+    "Myanmar": ["Burma"],
+    "Netherlands": ["Holland"],
+    "Republic of Korea": ["South Korea"],
+    "Republic of Moldova": ["Moldova"],
+    "Russian Federation": ["Russia"],
+    "State of Palestine": ["Palestine", "Gaza", "West Bank", "Occupied Palestinian Territories"],
+    "Syrian Arab Republic": ["Syria"],
+    "Timor-Leste": ["East Timor"],
+    "Türkiye": ["Turkey", "Turkiye"],
+    "United Kingdom of Great Britain and Northern Ireland": ["United Kingdom", "UK", "Great Britain", "Britain"],
+    "United Republic of Tanzania": ["Tanzania"],
+    "United States of America": ["United States", "USA", "US", "U.S.", "U.S.A.", "America"],
+    "Venezuela": ["Bolivarian Republic of Venezuela"],
+    "Viet Nam": ["Vietnam"],
+}
+
+NON_STATE_ACTORS = [
+    "Abu Sayyaf Group", "African Union Mission in Somalia (AMISOM)", "Ahrar al-Sham",
+    "Al-Qaeda in the Arabian Peninsula", "Al-Shabaab", "Allied Democratic Forces (ADF)",
+    "Anglophone separatist groups", "Ansaroul Islam", "Anti-Balaka armed group", "Arakan Army (AA)",
+    "Arakan Rohingya Salvation Army (ARSA)", "Bangsamoro Islamic Freedom Fighters (BIFF)", "Boko Haram",
+    "CODECO", "Central African Liberators for Justice Movement (MLCJ)", "Central African Patriotic Movement (MPC)",
+    "Communist Party of India - Maoist (Naxalites)", "Democratic Forces for the Liberation of Rwanda (FDLR)",
+    "Derna Protection Force (DPF)", "Group for the Support of Islam and Muslims (JNIM)", "Hamas",
+    "Hay'at Tahrir al-Sham", "Hezbollah", "Houthi", "IS-K", "ISWAP", "Islamic State group",
+    "Islamic State in Somalia (ISS)", "Islamic State in West Africa Province (ISWAP)",
+    "Islamic State in the Greater Sahara (ISGS)", "Jama'at Nusrat al-Islam wal-Muslimin (JNIM)",
+    "Jamaat-ul-Ahrar", "Kurdistan Workers' Party (PKK)", "Lashkar-e-Jhangvi", "Libyan National Army", "M23",
+    "MFDC- Front Sud", "Mai-Mai Yakutumba", "Maute Group", "Moro Islamic Liberation Front (MILF)",
+    "Moro National Liberation Front (MNLF)", "Myanmar National Democratic Alliance Army (MNDAA)",
+    "National Liberation Army (ELN)", "National Resistance Front (NRF)", "New People's Army (NPA)",
+    "Oromo Liberation Army (OLA)", "Palestinian Islamic Jihad", "Polisario Front",
+    "Popular Front for the Renaissance in the Central African Republic (FPRC)", "Rapid Support Forces (RSF)",
+    "Return, Reclamation and Rehabilitation (3R)", "Russian-backed militias", "Southern Transitional Council (STC)",
+    "Syrian Democratic Forces (including YPG)", "Séléka/ Ex-Séléka coalition group",
+    "Ta'ang National Liberation Army (TNLA)", "Tehrik-i-Taliban (TTP)", "The Baloch Liberation Army",
+    "The Barisan Revolusi Nasional (BRN)", "The Benghazi Revolutionaries Shura Council (BRSC)",
+    "The Haqqani network", "The Islamic State group's Khorasan province branch (IS-KP)",
+    "The National Salvation Front (NAS)", "The Sudan Liberation Movement/Army-Abdel Wahid (SLM/A-AW)",
+    "The Sudan People's Liberation Movement/Army-in-Opposition (SPLM/A-IO)",
+    "The Sudan People's Liberation Movement/Army - North Agar (SPLM-North Agar)",
+    "The Sudan People's Liberation Movement/Army North Hilu (SPLM/AN Hilu)",
+    "The Syrian National Army (SNA), former Free Syrian Army (FSA)",
+    "The former Bloque Oriental (Eastern Bloc) of the Fuerzas Armadas Revolucionarias de Colombia Ejército del Pueblo (Revolutionary Armed Forces of Colombia - People's Army) (FARC-EP)",
+    "Tigray People's Liberation Front (TPLF)", "Ukrainian separatist groups",
+    "Union for Peace in the Central African Republic (UPC)",
+    "United Nations Multidimensional Integrated Mission (MINUSCA)", "Wilayat Sinai (Sinai Province)",
+    "Multinational Joint Task Force (MNJTF)",
+]
+
+# Extra spellings and aliases, in the style of the get_armed_conflict_data_by_non_state_actor docstring
+NON_STATE_ACTOR_ALIASES = {
+    "Hezbollah": ["Hizbollah", "Hizbullah", "Hizballah", "Party of God"],
+    "Houthi": ["Houthis", "Ansar Allah", "Ansarallah"],
+    "Islamic State group": ["Islamic State", "ISIS", "ISIL", "Daesh"],
+    "Hay'at Tahrir al-Sham": ["HTS", "Hayat Tahrir al-Sham"],
+    "Al-Shabaab": ["Al Shabaab", "Shabaab"],
+    "The Islamic State group's Khorasan province branch (IS-KP)": ["ISKP", "ISIS-K", "Islamic State Khorasan"],
+    "Tehrik-i-Taliban (TTP)": ["Pakistani Taliban", "Tehrik-i-Taliban Pakistan"],
+    "Syrian Democratic Forces (including YPG)": ["Syrian Democratic Forces", "SDF", "YPG"],
+    "The former Bloque Oriental (Eastern Bloc) of the Fuerzas Armadas Revolucionarias de Colombia Ejército del Pueblo (Revolutionary Armed Forces of Colombia - People's Army) (FARC-EP)": [
+        "FARC", "Revolutionary Armed Forces of Colombia", "Fuerzas Armadas Revolucionarias de Colombia"
+    ],
+    "Kurdistan Workers' Party (PKK)": ["Kurdistan Workers Party"],
+    "M23": ["March 23 Movement"],
+}
+
+REGIONS = [
+    "Africa", "Northern Africa", "Sub-Saharan Africa", "Eastern Africa", "Middle Africa",
+    "Southern Africa", "Western Africa", "Americas", "Northern America", "Caribbean",
+    "Central America", "Latin America and the Caribbean", "South America", "Antarctica",
+    "Asia", "Central Asia", "Eastern Asia", "South-Eastern Asia", "Southern Asia", "Western Asia",
+    "Europe", "Eastern Europe", "Northern Europe", "Southern Europe", "Western Europe", "Oceania",
+]
+
+SPECIAL_REGIONS = [
+    "Great Lakes Region", "Horn of Africa Region", "Sahel Region", "Baltic States",
+    "Arctic Region", "Levant Region", "Caucasus Region", "Balkan Region",
+]
+
+REGION_ALIASES = {
+    "Northern Africa": ["North Africa"],
+    "Eastern Africa": ["East Africa"],
+    "Western Africa": ["West Africa"],
+    "Middle Africa": ["Central Africa"],
+    "Northern America": ["North America"],
+    "Latin America and the Caribbean": ["Latin America"],
+    "South-Eastern Asia": ["South-East Asia", "Southeast Asia", "South East Asia"],
+    "Southern Asia": ["South Asia"],
+    "Eastern Asia": ["East Asia"],
+    "Eastern Europe": ["East Europe"],
+    "Great Lakes Region": ["Great Lakes"],
+    "Horn of Africa Region": ["Horn of Africa"],
+    "Sahel Region": ["Sahel"],
+    "Levant Region": ["Levant"],
+    "Caucasus Region": ["Caucasus"],
+    "Balkan Region": ["Balkans"],
+    "Arctic Region": ["Arctic"],
+}
+
+# The only organizations the get_armed_conflict_data_by_organization tool supports
+ORGANIZATIONS = ["European Union", "African Union", "G7", "BRICS", "NATO", "ASEAN"]
+
+ORGANIZATION_ALIASES = {
+    "European Union": ["EU"],
+    "African Union": ["AU"],
+    "G7": ["Group of Seven", "G-7"],
+    "NATO": ["North Atlantic Treaty Organization", "North Atlantic Treaty Organisation"],
+    "ASEAN": ["Association of Southeast Asian Nations"],
+}
+
+ENTITY_TYPES = ("countries", "non_state_actors", "regions", "organizations")
+
+# // NORMALIZATION //
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for matching: strip accents, lowercase, turn punctuation into spaces
+    and collapse whitespace. Apostrophes are dropped so "Hay'at" matches "Hayat".
+    """
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    text = text.lower().replace("'", "").replace("’", "")
+    text = re.sub(r"[^a-z0-9]+", " ", text)
+    return text.strip()
+
+
+def _is_acronym(surface: str) -> bool:
+    """Short all-caps forms (ADF, US, AA) are matched case-sensitively to avoid clashing with ordinary words"""
+    letters = re.sub(r"[^A-Za-z0-9]", "", surface)
+    return len(letters) <= 5 and letters.isupper()
+
+
+def _surface_forms(name: str, aliases: List[str]) -> List[str]:
+    """All the surface forms for an entity: its name, its aliases and, for names like 'Allied Democratic Forces (ADF)', the parts in and outside the parentheses"""
+    forms = [name] + list(aliases)
+    for paren in re.findall(r"\(([^)]+)\)", name):
+        forms.append(paren)
+    base = re.sub(r"\s*\([^)]*\)", "", name).strip()
+    if base and base != name:
+        forms.append(base)
+    if "/" in name and "(" not in name:
+        forms.extend(part.strip() for part in name.split("/") if part.strip())
+    return forms
+
+
+def _build_index() -> Tuple[Dict[str, Tuple[str, str]], Dict[str, Tuple[str, str]]]:
+    """
+    Build the lookup tables from surface form to (entity type, canonical name).
+    Returns (case-insensitive index on normalized text, case-sensitive acronym index).
+    """
+    sources = [
+        ("countries", COUNTRIES, COUNTRY_ALIASES),
+        ("non_state_actors", NON_STATE_ACTORS, NON_STATE_ACTOR_ALIASES),
+        ("regions", REGIONS + SPECIAL_REGIONS, REGION_ALIASES),
+        ("organizations", ORGANIZATIONS, ORGANIZATION_ALIASES),
+    ]
+    phrase_index = {}
+    acronym_index = {}
+    for entity_type, names, aliases in sources:
+        for name in names:
+            for form in _surface_forms(name, aliases.get(name, [])):
+                if _is_acronym(form):
+                    acronym_index.setdefault(re.sub(r"[^A-Za-z0-9]", "", form), (entity_type, name))
+                    continue
+                key = normalize_text(form)
+                # Ignore fragments that are too generic to identify an entity on their own
+                if len(key) < 3 or key in ("the", "group"):
+                    continue
+                phrase_index.setdefault(key, (entity_type, name))
+    return phrase_index, acronym_index
+
+
+_PHRASE_INDEX, _ACRONYM_INDEX = _build_index()
+_MAX_PHRASE_TOKENS = max(len(key.split()) for key in _PHRASE_INDEX)
+
+# // LOOKUP //
+
+def extract_entities(text: str) -> Dict[str, List[str]]:
+    """
+    Find the known countries, non-state actors, regions and organizations mentioned in text.
+
+    Matching is whole-word and longest-first, so "Nigeria" does not also match "Niger" and
+    "South Sudan" does not also match "Sudan". Short acronyms only match when written in capitals.
+
+    Args:
+        text: Free text, usually the latest user query
+
+    Returns:
+        Dictionary with "countries", "non_state_actors", "regions" and "organizations" lists of
+        canonical names, in order of first mention
+    """
+    entities = {entity_type: [] for entity_type in ENTITY_TYPES}
+    if not text:
+        return entities
+
+    def add(entity_type: str, name: str):
+        if name not in entities[entity_type]:
+            entities[entity_type].append(name)
+
+    # Phrase matches on normalized tokens, longest window first
+    tokens = normalize_text(text).split()
+    i = 0
+    while i < len(tokens):
+        for size in range(min(_MAX_PHRASE_TOKENS, len(tokens) - i), 0, -1):
+            match = _PHRASE_INDEX.get(" ".join(tokens[i:i + size]))
+            if match:
+                add(*match)
+                i += size
+                break
+        else:
+            i += 1
+
+    # Acronym matches on the original text, case-sensitive
+    for raw_token in re.findall(r"[A-Za-z0-9][A-Za-z0-9.\-]*", text):
+        match = _ACRONYM_INDEX.get(re.sub(r"[^A-Za-z0-9]", "", raw_token))
+        if match and raw_token.upper() == raw_token:
+            add(*match)
+
+    return entities
+
+
+def get_aliases(entity_type: str, name: str) -> List[str]:
+    """Return the canonical name followed by the known aliases and acronyms for an entity"""
+    alias_tables = {
+        "countries": COUNTRY_ALIASES,
+        "non_state_actors": NON_STATE_ACTOR_ALIASES,
+        "regions": REGION_ALIASES,
+        "organizations": ORGANIZATION_ALIASES,
+    }
+    forms = []
+    for form in _surface_forms(name, alias_tables.get(entity_type, {}).get(name, [])):
+        if form not in forms:
+            forms.append(form)
+    return forms
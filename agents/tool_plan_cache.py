@@ -0,0 +1,89 @@
+"""
+Tool plan cache module for Beacon
+
+This module provides an in-memory LRU + TTL cache for tool-selection plans. Repeated and
+popular questions produce the same plan, so caching it in front of the tool-selection
+stage lets them skip both the fast-path planner and the tool-selection LLM.
+"""
+import copy
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from agents.gazetteer import normalize_text
+
+# Number of previous conversation turns that are part of the cache key
+CONTEXT_TURNS_IN_KEY = 2
+
+
+def trim_conversation_context(conversation_context: str, turns: int = CONTEXT_TURNS_IN_KEY) -> str:
+    """Keep only the last few turns of a formatted conversation context ("\\n\\n**User**: ..." blocks)"""
+    if not conversation_context:
+        return ""
+    blocks = [block for block in conversation_context.split("\n\n**") if block.strip()]
+    return "\n\n**".join(blocks[-turns:])
+
+
+def make_plan_cache_key(latest_user_query: str, conversation_context: str = "") -> str:
+    """Hash the normalized latest query together with the normalized, trimmed conversation context"""
+    normalized_query = normalize_text(latest_user_query or "")
+    normalized_context = normalize_text(trim_conversation_context(conversation_context))
+    return hashlib.sha256(f"{normalized_query}\x1f{normalized_context}".encode("utf-8")).hexdigest()
+
+
+class ToolPlanCache:
+    """
+    LRU cache of tool plans (lists of tool call dicts) with a per-entry time to live.
+    Plans are copied on the way in and out, since callers fix up tool arguments in place.
+    """
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 3600):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple[float, List[Dict]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, latest_user_query: str, conversation_context: str = "") -> Optional[List[Dict]]:
+        """Return a copy of the cached plan for this query and context, or None on a miss"""
+        key = make_plan_cache_key(latest_user_query, conversation_context)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, tool_calls = entry
+        if time.time() >= expires_at:
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(tool_calls)
+
+    def put(self, latest_user_query: str, conversation_context: str, tool_calls: List[Dict], ttl_seconds: Optional[float] = None):
+        """Store a plan, evicting the least recently used plans beyond max_entries"""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0 or not tool_calls:
+            return
+        key = make_plan_cache_key(latest_user_query, conversation_context)
+        self._entries[key] = (time.time() + ttl, copy.deepcopy(tool_calls))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached plans (counters are kept)"""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters and current size"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+        }
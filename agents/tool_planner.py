@@ -0,0 +1,292 @@
+"""
+Tool planner module for Beacon
+
+This module provides a deterministic, rule- and gazetteer-based fast path for tool
+selection. For common questions ("what conflicts involve X", "human rights in Y",
+"latest news on Z") it builds the tool calls directly, skipping the tool-selection LLM
+round trip. When the question is not clearly one of those patterns it returns None and
+the pipeline falls back to the LLM planner.
+
+It also guesses the RULAC lookups the LLM planner is likely to choose, so the pipeline can
+prefetch them while the LLM is still planning.
+"""
+import json
+import logging
+import re
+from typing import Dict, List, Optional
+
+from agents.gazetteer import extract_entities, get_aliases, normalize_text
+
+logger = logging.getLogger("Argos")
+
+# // INTENT VOCABULARIES //
+
+CONFLICT_KEYWORDS = [
+    "conflict", "conflicts", "war", "wars", "armed", "fighting", "hostilities", "classified",
+    "classification", "classify", "iac", "niac", "occupation", "occupied", "party to", "parties to",
+    "belligerent", "belligerents", "insurgency", "rulac",
+]
+
+HUMAN_RIGHTS_KEYWORDS = [
+    "human rights", "hrw", "human rights watch", "abuses", "rights abuses", "rights violations",
+    "freedom of expression", "press freedom", "freedom of speech", "lgbt", "torture",
+    "arbitrary detention", "civil liberties",
+]
+
+NEWS_KEYWORDS = [
+    "news", "latest", "recent", "recently", "update", "updates", "developments", "today",
+    "this week", "this month", "current situation", "ceasefire", "happening",
+]
+
+# Words that ask for counts of something; the fast path only plans them when they count conflicts
+STATISTICS_KEYWORDS = [
+    "how many", "number of", "count", "counts", "total number", "statistics", "stats",
+]
+
+# Count questions about conflicts ("how many armed conflicts", "number of NIACs", "conflict
+# statistics"), answered by the RULAC tools' statistics-only mode (a table of conflict counts)
+_CONFLICT_QUALIFIERS = r"(?: (?:active|ongoing|current|armed|international|non|internal|classified|distinct|separate|different))*"
+_CONFLICT_NOUNS = r" (?:conflicts?|wars?|iacs?|niacs?|occupations?)"
+CONFLICT_COUNT_PATTERN = re.compile(
+    r"\b(?:how many|(?:total )?number of|counts? of|(?:statistics|stats) (?:on|of|for|about)|most|fewest|more|fewer)"
+    + _CONFLICT_QUALIFIERS + _CONFLICT_NOUNS + r"\b"
+    + r"|\b(?:conflicts?|wars?) (?:statistics|stats|counts?)\b"
+)
+
+# Comparisons the fast path only plans when they compare conflict counts
+COMPARISON_KEYWORDS = ["compare", "compares", "compared", "comparison", "versus", "vs"]
+
+# Questions that need tools or reasoning the fast path does not cover (legal frameworks,
+# methodology, people, qualitative comparisons, questions about Argos or RULAC themselves)
+UNSUPPORTED_KEYWORDS = [
+    "methodology", "framework", "international law", "humanitarian law", "ihl", "ihrl",
+    "rome statute", "geneva", "treaty", "treaties", "icc", "tribunal", "war crime", "war crimes",
+    "who is", "who are", "president", "prime minister", "leader", "minister",
+    "difference", "differences", "similarities",
+    "argos", "your name", "who are you", "what can you", "what is rulac", "about rulac", "timeline", "history of",
+]
+
+# Words that refer back to earlier turns; with a conversation history the query then needs the LLM to resolve them
+ANAPHORA_KEYWORDS = ["there", "they", "them", "their", "it", "its", "that", "those", "these", "this country", "same"]
+
+CONFLICT_TYPE_KEYWORDS = {
+    "International Armed Conflict (IAC)": ["international armed conflict", "international armed conflicts", "iac", "iacs"],
+    "Non-International Armed Conflict (NIAC)": [
+        "non international armed conflict", "non international armed conflicts", "niac", "niacs",
+        "internal armed conflict", "internal armed conflicts", "civil war", "civil wars",
+    ],
+    "Military Occupation": ["military occupation", "occupation", "occupied"],
+}
+
+# Limits that keep the fast path to simple, unambiguous questions
+MAX_QUERY_WORDS = 40
+MAX_ENTITIES = 4
+MAX_HRW_COUNTRIES = 3
+
+# // HELPERS //
+
+def _contains_any(normalized_query: str, keywords: List[str]) -> bool:
+    """Whole-word / whole-phrase keyword match on a normalized query"""
+    padded = f" {normalized_query} "
+    return any(f" {normalize_text(keyword)} " in padded for keyword in keywords)
+
+
+def _asks_for_conflict_counts(normalized_query: str) -> bool:
+    """True when a count phrase refers to conflicts, not to casualties or anything else"""
+    return CONFLICT_COUNT_PATTERN.search(normalized_query) is not None
+
+
+def _detect_conflict_types(normalized_query: str) -> List[str]:
+    """Return the RULAC conflict classifications explicitly asked for, or [] for all types"""
+    conflict_types = []
+    # Check NIAC before IAC, since "non-international armed conflict" contains "international armed conflict"
+    if _contains_any(normalized_query, CONFLICT_TYPE_KEYWORDS["Non-International Armed Conflict (NIAC)"]):
+        conflict_types.append("Non-International Armed Conflict (NIAC)")
+        stripped = normalized_query.replace("non international armed conflict", " ")
+    else:
+        stripped = normalized_query
+    if _contains_any(stripped, CONFLICT_TYPE_KEYWORDS["International Armed Conflict (IAC)"]):
+        conflict_types.insert(0, "International Armed Conflict (IAC)")
+    if _contains_any(normalized_query, CONFLICT_TYPE_KEYWORDS["Military Occupation"]):
+        conflict_types.append("Military Occupation")
+    return conflict_types
+
+
+def _tool_call(index: int, name: str, args: Dict, reasoning: str, id_prefix: str = "planned_tool", reasoning_prefix: str = "Fast-path planner") -> Dict:
+    """Build a tool call dict in the same shape as the LLM tool-selection output"""
+    return {
+        "id": f"{id_prefix}_{index}",
+        "name": name,
+        "args": args,
+        "reasoning": f"{reasoning_prefix}: {reasoning}",
+    }
+
+
+def _conflict_tool_calls(entities: Dict[str, List[str]], conflict_types: List[str], statistics_only: bool = False, **tool_call_kwargs) -> List[Dict]:
+    """Build the get_armed_conflict_data_by_* calls for the named entities, asking only for counts when statistics_only"""
+    tool_calls = []
+    countries = entities["countries"]
+    non_state_actors = entities["non_state_actors"]
+    organizations = entities["organizations"]
+    regions = entities["regions"]
+
+    if countries:
+        tool_calls.append(_tool_call(len(tool_calls), "get_armed_conflict_data_by_country", {
+            "countries": countries,
+            "conflict_types": conflict_types,
+        }, f"Conflict question about {', '.join(countries)}", **tool_call_kwargs))
+    if non_state_actors:
+        actor_names = []
+        for actor in non_state_actors:
+            actor_names.extend(get_aliases("non_state_actors", actor))
+        tool_calls.append(_tool_call(len(tool_calls), "get_armed_conflict_data_by_non_state_actor", {
+            "non_state_actors": actor_names,
+        }, f"Conflict question about {', '.join(non_state_actors)}", **tool_call_kwargs))
+    if organizations:
+        tool_calls.append(_tool_call(len(tool_calls), "get_armed_conflict_data_by_organization", {
+            "organizations": organizations,
+            "conflict_types": conflict_types,
+        }, f"Conflict question about {', '.join(organizations)}", **tool_call_kwargs))
+    if regions:
+        tool_calls.append(_tool_call(len(tool_calls), "get_armed_conflict_data_by_region", {
+            "regions": regions,
+            "conflict_types": conflict_types,
+        }, f"Conflict question about {', '.join(regions)}", **tool_call_kwargs))
+    if statistics_only:
+        for call in tool_calls:
+            call["args"]["statistics_only"] = True
+    return tool_calls
+
+
+def make_tool_call_key(tool_name: str, args: Dict) -> str:
+    """
+    Key for a tool call, equal for calls whose results render the same: argument names are
+    sorted, single strings count as one-element lists and flags left false or unset are
+    dropped. List values keep the caller's order and spelling, since the rendered summaries
+    list the requested names in that order (like make_result_cache_key), so a prefetched
+    result is only reused for a call asking for exactly the same names.
+    """
+    canonical_args = []
+    for arg_name in sorted(args or {}):
+        value = args[arg_name]
+        if value is None or value is False:
+            continue
+        if isinstance(value, str):
+            value = [value]
+        canonical_args.append(f"{arg_name}={json.dumps(value, default=str)}")
+    return f"{tool_name}({'; '.join(canonical_args)})"
+
+# // PLANNER //
+
+def plan_tool_calls(latest_user_query: str, conversation_context: str = "") -> Optional[List[Dict]]:
+    """
+    Build tool calls for common question patterns without calling the tool-selection LLM.
+
+    The planner is deliberately conservative: it only answers when the latest query names
+    at least one known entity, expresses a conflict, human rights or news intent, and does
+    not ask for anything the fast path cannot plan (legal frameworks, people, comparisons...).
+    Questions counting conflicts, including comparisons of counts, use the RULAC tools'
+    statistics-only mode; other count questions ("how many civilians died") go to the LLM.
+
+    Args:
+        latest_user_query: The latest user message
+        conversation_context: Formatted previous conversation, if any
+
+    Returns:
+        List of tool call dicts (id, name, args, reasoning), or None to fall back to the LLM
+    """
+    if not latest_user_query or not latest_user_query.strip():
+        return None
+
+    normalized_query = normalize_text(latest_user_query)
+    if len(normalized_query.split()) > MAX_QUERY_WORDS:
+        logger.debug("Fast-path planner: query too long, deferring to LLM")
+        return None
+
+    if _contains_any(normalized_query, UNSUPPORTED_KEYWORDS):
+        logger.debug("Fast-path planner: query needs tools outside the fast path, deferring to LLM")
+        return None
+
+    wants_statistics = _asks_for_conflict_counts(normalized_query)
+    if _contains_any(normalized_query, STATISTICS_KEYWORDS) and not wants_statistics:
+        logger.debug("Fast-path planner: count that is not about conflicts, deferring to LLM")
+        return None
+    if _contains_any(normalized_query, COMPARISON_KEYWORDS) and not wants_statistics:
+        logger.debug("Fast-path planner: comparison that is not about conflict counts, deferring to LLM")
+        return None
+
+    if conversation_context and _contains_any(normalized_query, ANAPHORA_KEYWORDS):
+        logger.debug("Fast-path planner: follow-up refers to earlier turns, deferring to LLM")
+        return None
+
+    entities = extract_entities(latest_user_query)
+    entity_count = sum(len(names) for names in entities.values())
+    if entity_count == 0 or entity_count > MAX_ENTITIES:
+        logger.debug(f"Fast-path planner: {entity_count} entities found, deferring to LLM")
+        return None
+
+    wants_conflicts = _contains_any(normalized_query, CONFLICT_KEYWORDS)
+    wants_human_rights = _contains_any(normalized_query, HUMAN_RIGHTS_KEYWORDS)
+    wants_news = _contains_any(normalized_query, NEWS_KEYWORDS)
+    if not (wants_conflicts or wants_human_rights or wants_news):
+        logger.debug("Fast-path planner: no recognised intent, deferring to LLM")
+        return None
+
+    countries = entities["countries"]
+
+    # Human rights research is only available per country
+    if wants_human_rights and not countries:
+        logger.debug("Fast-path planner: human rights question without a country, deferring to LLM")
+        return None
+
+    tool_calls = []
+
+    if wants_conflicts:
+        tool_calls.extend(_conflict_tool_calls(entities, _detect_conflict_types(normalized_query), statistics_only=wants_statistics))
+
+    if wants_human_rights:
+        for country in countries[:MAX_HRW_COUNTRIES]:
+            tool_calls.append(_tool_call(len(tool_calls), "get_human_rights_research_by_country", {
+                "country": country,
+            }, f"Human rights question about {country}"))
+
+    # Latest developments accompany every fast-path plan, as in the LLM planner's examples
+    topic = "human rights" if wants_human_rights and not wants_conflicts else "conflict" if wants_conflicts else "latest news"
+    named_entities = [name for names in entities.values() for name in names]
+    search_entities = [re.sub(r"\s*\([^)]*\)", "", name) for name in named_entities]
+    tool_calls.append(_tool_call(len(tool_calls), "get_combined_news", {
+        "search_query": f"{' '.join(search_entities)} {topic}".strip(),
+    }, "Latest news and developments"))
+
+    logger.info(f"Fast-path planner selected {len(tool_calls)} tools: {[call['name'] for call in tool_calls]}")
+    return tool_calls
+
+
+def plan_speculative_rulac_calls(latest_user_query: str, max_entities: int = MAX_ENTITIES) -> List[Dict]:
+    """
+    Guess the RULAC conflict lookups the tool-selection LLM is likely to ask for.
+
+    Used to prefetch RULAC data while the LLM is still planning: every entity named in the
+    query gets its get_armed_conflict_data_by_* call, whether or not the question turns out to
+    be about armed conflicts. Results that do not match the real plan are simply discarded.
+
+    Args:
+        latest_user_query: The latest user message
+        max_entities: Skip speculation for queries naming more entities than this
+
+    Returns:
+        List of tool call dicts (id, name, args, reasoning), possibly empty
+    """
+    if not latest_user_query or not latest_user_query.strip():
+        return []
+
+    entities = extract_entities(latest_user_query)
+    entity_count = sum(len(names) for names in entities.values())
+    if entity_count == 0 or entity_count > max_entities:
+        return []
+
+    normalized_query = normalize_text(latest_user_query)
+    return _conflict_tool_calls(
+        entities, _detect_conflict_types(normalized_query), statistics_only=_asks_for_conflict_counts(normalized_query),
+        id_prefix="speculative_tool", reasoning_prefix="Speculative prefetch"
+    )
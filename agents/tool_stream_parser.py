@@ -0,0 +1,134 @@
+"""
+Streaming tool-selection parser module for Beacon
+
+The tool-selection LLM answers with {"tools": [{...}, {...}]}. Instead of waiting for the
+whole completion, this module scans the streamed text and hands back each tool object as
+soon as its closing brace arrives, so the pipeline can start that tool while the model is
+still writing the next one. Anything it cannot recognise is left to the full-response
+parser once the stream ends.
+"""
+import json
+import logging
+from typing import Dict, List
+
+logger = logging.getLogger("Argos")
+
+
+class ToolCallStreamParser:
+    """
+    Incremental, string-aware brace matcher for the streamed {"tools": [...]} JSON.
+
+    feed() returns the tool calls completed by the new chunk, numbered "tool_{i}" by their
+    position in the array like the full-response parser does: every element counts, including
+    strings, numbers and other non-tool values.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self._pos = 0              # Next buffer index to scan
+        self._started = False      # True once the root object's opening brace is found
+        self._start_index = 0      # Buffer index of the root object's opening brace
+        self._end_index = None     # Buffer index just past the root object's closing brace
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_key = None      # Last string seen directly inside the root object
+        self._in_tools_array = False
+        self._item_index = 0       # Position of the current element of the tools array
+        self._item_start = None    # Buffer index where the current tool object starts
+
+    @property
+    def json_text(self) -> str:
+        """The root JSON object as received so far, without leading reasoning or trailing code fences"""
+        if not self._started:
+            return self.buffer
+        return self.buffer[self._start_index:self._end_index]
+
+    def _find_start(self) -> bool:
+        """Locate the root object's opening brace, skipping a leading <think> block if present"""
+        search_from = 0
+        if "<think>" in self.buffer:
+            think_end = self.buffer.find("</think>")
+            if think_end == -1:
+                return False
+            search_from = think_end + len("</think>")
+        brace = self.buffer.find("{", search_from)
+        if brace == -1:
+            return False
+        self._started = True
+        self._start_index = brace
+        self._pos = brace
+        return True
+
+    def feed(self, chunk: str) -> List[Dict]:
+        """Add a streamed chunk and return the tool calls it completed"""
+        if not chunk:
+            return []
+        self.buffer += chunk
+        if not self._started and not self._find_start():
+            return []
+
+        completed = []
+        while self._end_index is None and self._pos < len(self.buffer):
+            i = self._pos
+            char = self.buffer[i]
+            self._pos += 1
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._stack == ["{"]:
+                        self._last_key = self.buffer[self._string_start + 1:i]
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = i
+            elif char == "," and self._in_tools_array and len(self._stack) == 2:
+                # Elements are counted by their separators, so scalars take a position too
+                self._item_index += 1
+            elif char in "{[":
+                if char == "[" and self._stack == ["{"] and self._last_key == "tools":
+                    self._in_tools_array = True
+                elif char == "{" and self._in_tools_array and len(self._stack) == 2:
+                    self._item_start = i
+                elif char == "[" and self._in_tools_array and len(self._stack) == 2:
+                    self._item_start = None
+                self._stack.append(char)
+            elif char in "}]":
+                if not self._stack:
+                    continue
+                self._stack.pop()
+                if not self._stack:
+                    self._end_index = i + 1
+                elif self._in_tools_array and len(self._stack) == 2:
+                    # Closed a direct element of the tools array
+                    if char == "}" and self._item_start is not None:
+                        tool_call = self._parse_item(self.buffer[self._item_start:i + 1])
+                        if tool_call:
+                            completed.append(tool_call)
+                    self._item_start = None
+                elif self._in_tools_array and len(self._stack) == 1:
+                    self._in_tools_array = False
+        return completed
+
+    def _parse_item(self, item_text: str) -> Dict:
+        """Turn one complete tool object into a tool call dict, or None if it is not a tool"""
+        try:
+            tool_info = json.loads(item_text)
+        except json.JSONDecodeError:
+            logger.debug(f"Streamed tool object is not valid JSON: {item_text}")
+            return None
+        if not isinstance(tool_info, dict) or "name" not in tool_info or "args" not in tool_info:
+            return None
+        return {
+            "id": f"tool_{self._item_index}",
+            "name": tool_info["name"],
+            "args": tool_info["args"],
+            "reasoning": tool_info.get("reasoning", "No reasoning provided"),
+        }
@@ -0,0 +1,191 @@
+# helpers/article_summary_cache.py
+"""
+Persistent cache of news article summaries.
+
+Popular stories are searched for by user after user, and every request used to scrape each
+article again and have the 70B model summarize it again, the largest latency and cost item
+of the news tools. An ArticleSummaryCache keeps summaries in a local SQLite file, keyed by
+the article's canonical URL and a hash of its scraped text:
+
+- latest(url) returns the newest summary of a URL stored within the TTL, so a request can
+  skip both the scrape and the LLM call;
+- get(url, content_hash) returns the summary of exactly this article text, so an article
+  re-scraped after its URL entry expired is only summarized again if its text changed.
+
+Entries older than the TTL are dropped, and the least recently used entries are evicted
+once the cache holds more than max_entries summaries or max_bytes of summary data.
+
+SQLite calls block; async callers run them through asyncio.to_thread.
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+logger = logging.getLogger("Argos")
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMETERS = frozenset({"fbclid", "gclid", "ocid", "at_medium", "at_campaign", "at_link_origin", "at_ptr_name"})
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS article_summaries (
+    url TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (url, content_hash)
+);
+CREATE INDEX IF NOT EXISTS article_summaries_by_url ON article_summaries (url, created_at);
+CREATE INDEX IF NOT EXISTS article_summaries_by_use ON article_summaries (last_used);
+"""
+
+
+def canonical_url(url: str) -> str:
+    """
+    URL with the parts that do not change the article normalized away: lowercase scheme and
+    host, no fragment, no tracking parameters (utm_* and the like), sorted query parameters
+    and no trailing slash.
+    """
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.lower().startswith("utm_") and name.lower() not in TRACKING_PARAMETERS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
+
+
+def content_hash(text: str) -> str:
+    """Hash of the scraped article text, ignoring whitespace differences"""
+    return hashlib.sha256(" ".join(text.split()).encode("utf-8")).hexdigest()
+
+
+class ArticleSummaryCache:
+    """
+    SQLite-backed summary cache, safe to share between threads.
+
+    Args:
+        path: SQLite database file, created if missing
+        ttl_seconds: Seconds a summary is served before the article is scraped again
+        max_entries: Summaries kept before the least recently used are evicted
+        max_bytes: Bytes of summary data kept before the least recently used are evicted
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 6 * 3600, max_entries: int = 2000, max_bytes: int = 50_000_000):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.content_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(SCHEMA)
+
+    def _touch(self, url: str, digest: str, summary: str, now: float) -> Dict[str, Any]:
+        self._connection.execute(
+            "UPDATE article_summaries SET last_used = ? WHERE url = ? AND content_hash = ?", (now, url, digest)
+        )
+        return json.loads(summary)
+
+    def latest(self, url: str) -> Optional[Dict[str, Any]]:
+        """Newest summary of url stored within the TTL, or None"""
+        url = canonical_url(url)
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT content_hash, summary FROM article_summaries WHERE url = ? AND created_at >= ? "
+                "ORDER BY created_at DESC LIMIT 1",
+                (url, now - self.ttl_seconds),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return self._touch(url, row[0], row[1], now)
+
+    def get(self, url: str, digest: str) -> Optional[Dict[str, Any]]:
+        """Summary of the article text with this content hash, or None"""
+        url = canonical_url(url)
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT summary FROM article_summaries WHERE url = ? AND content_hash = ?", (url, digest)
+            ).fetchone()
+            if row is None:
+                return None
+            self.content_hits += 1
+            # The text is unchanged, so the summary counts as fresh again
+            self._connection.execute(
+                "UPDATE article_summaries SET created_at = ? WHERE url = ? AND content_hash = ?", (now, url, digest)
+            )
+            return self._touch(url, digest, row[0], now)
+
+    def put(self, url: str, digest: str, summary: Dict[str, Any]):
+        """Store the summary of an article text, then evict expired and least recently used entries"""
+        url = canonical_url(url)
+        now = time.time()
+        data = json.dumps(summary, default=str)
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO article_summaries (url, content_hash, summary, size, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (url, digest, data, len(data.encode("utf-8")), now, now),
+            )
+            self._evict(now)
+
+    def _evict(self, now: float):
+        evicted = self._connection.execute(
+            "DELETE FROM article_summaries WHERE created_at < ?", (now - self.ttl_seconds,)
+        ).rowcount
+        entries, size = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM article_summaries"
+        ).fetchone()
+        if entries > self.max_entries or size > self.max_bytes:
+            rows = self._connection.execute(
+                "SELECT url, content_hash, size FROM article_summaries ORDER BY last_used"
+            ).fetchall()
+            for url, digest, entry_size in rows:
+                if entries <= self.max_entries and size <= self.max_bytes:
+                    break
+                self._connection.execute(
+                    "DELETE FROM article_summaries WHERE url = ? AND content_hash = ?", (url, digest)
+                )
+                entries -= 1
+                size -= entry_size
+                evicted += 1
+        self.evictions += evicted
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit counters, size and evictions"""
+        with self._lock:
+            entries, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM article_summaries"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "content_hits": self.content_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "bytes": size,
+            "evictions": self.evictions,
+        }
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,276 @@
+# helpers/groq_scheduler.py
+"""
+Process-wide Groq rate-limit scheduler.
+
+get_combined_news fans out to several news sources, each summarizing a handful of articles
+with the same Groq model, and concurrent users multiply that. Firing every summary as soon
+as it is ready runs into 429s under load, and an article whose summary fails is lost. A
+GroqRateScheduler admits calls through two token buckets, requests per minute and tokens per
+minute, shared by every caller of the same (api key, model) in the process.
+
+The buckets start from configured limits and follow what Groq reports: the pooled clients of
+helpers/llm_clients.py pass the x-ratelimit-* headers of every chat completion response to
+record_rate_limit_headers(), which resizes the token bucket to the account's limit, caps both
+buckets at the remaining budget Groq reports, and pauses the scheduler on a 429 retry-after.
+
+Waiting calls are admitted in arrival order; every summary is made for a user waiting on
+the answer, so there is no lower-priority work to hold back.
+
+The buckets are shared by the whole process and guarded by a lock, since the sync clients
+report headers from whatever thread made the call. The queues of waiting calls hold
+loop-bound futures, so each event loop has its own queue, only ever touched on its own
+thread: headers reported from elsewhere wake a loop's queue with call_soon_threadsafe.
+"""
+import asyncio
+import logging
+import re
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Any, Deque, Dict, Mapping, Optional, Tuple
+
+logger = logging.getLogger("Argos")
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """Seconds of a Groq reset/retry-after value such as "7.66s", "2m59.56s", "120ms" or "3" """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    seconds = 0.0
+    matched = False
+    for amount, unit in _DURATION_PART.findall(value):
+        matched = True
+        seconds += float(amount) * {"ms": 0.001, "s": 1, "m": 60, "h": 3600}[unit]
+    return seconds if matched else None
+
+
+def _header_number(headers: Mapping[str, str], name: str) -> Optional[float]:
+    try:
+        value = headers.get(name)
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class TokenBucket:
+    """A bucket of capacity units refilled evenly over period seconds"""
+
+    def __init__(self, capacity: float, period: float = 60.0):
+        self.capacity = float(capacity)
+        self.period = period
+        self.level = float(capacity)
+        self.updated = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        """Units refilled per second"""
+        return self.capacity / self.period
+
+    def _refill(self, now: float):
+        if now > self.updated:
+            self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def delay(self, amount: float, now: float) -> float:
+        """Seconds until amount units are available (0 if they are now)"""
+        self._refill(now)
+        missing = min(amount, self.capacity) - self.level
+        return missing / self.rate if missing > 0 and self.rate > 0 else 0.0
+
+    def take(self, amount: float, now: float):
+        self._refill(now)
+        self.level -= min(amount, self.capacity)
+
+    def observe(self, now: float, limit: Optional[float] = None, remaining: Optional[float] = None):
+        """Follow a reported limit and remaining budget, never raising the level above what is left locally"""
+        self._refill(now)
+        if limit and limit > 0:
+            self.capacity = float(limit)
+            self.level = min(self.level, self.capacity)
+        if remaining is not None:
+            self.level = min(self.level, remaining)
+
+
+class _LoopQueue:
+    """Calls of one event loop waiting for admission, and that loop's wake-up timer"""
+    __slots__ = ("waiting", "timer")
+
+    def __init__(self):
+        self.waiting: Deque[Tuple[float, asyncio.Future]] = deque()
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class GroqRateScheduler:
+    """
+    Admits Groq calls for one (api key, model) through request and token buckets, in arrival order.
+
+    Args:
+        requests_per_minute: Requests admitted per minute
+        tokens_per_minute: Starting tokens per minute, until Groq reports the account's limit
+        name: Label used in logs
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float, name: str = "groq"):
+        self.name = name
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.paused_until = 0.0
+        self._lock = threading.Lock()  # Guards the buckets, the pause and the counters
+        self._queues: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopQueue]" = weakref.WeakKeyDictionary()
+        self.admitted = 0
+        self.waited = 0
+        self.wait_seconds = 0.0
+        self.throttled = 0
+
+    async def acquire(self, tokens: float):
+        """
+        Wait until a call estimated at tokens tokens (prompt plus completion) may be sent.
+        """
+        loop = asyncio.get_running_loop()
+        queue = self._queues.get(loop)
+        if queue is None:
+            queue = self._queues[loop] = _LoopQueue()
+        future = loop.create_future()
+        queue.waiting.append((float(tokens), future))
+        start = time.monotonic()
+        try:
+            self._dispatch(loop)
+            if not future.done():
+                with self._lock:
+                    self.waited += 1
+            await future
+        finally:
+            # Cancelled while queued (awaiting cancels the future too): let the next caller through
+            if future.cancelled() or not future.done():
+                future.cancel()
+                self._dispatch(loop)
+        waited = time.monotonic() - start
+        with self._lock:
+            self.wait_seconds += waited
+        if waited >= 0.5:
+            logger.debug(f"{self.name}: call waited {waited:.2f}s for its rate limit ({len(queue.waiting)} still queued)")
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop):
+        """Admit the queued calls of loop while the buckets allow, and schedule a wake-up for the next one (runs on loop)"""
+        queue = self._queues.get(loop)
+        if queue is None:
+            return
+        if queue.timer is not None:
+            queue.timer.cancel()
+            queue.timer = None
+        while queue.waiting:
+            tokens, future = queue.waiting[0]
+            if future.done():
+                queue.waiting.popleft()
+                continue
+            with self._lock:
+                now = time.monotonic()
+                delay = max(self.paused_until - now, self.requests.delay(1, now), self.tokens.delay(tokens, now))
+                if delay <= 0:
+                    self.requests.take(1, now)
+                    self.tokens.take(tokens, now)
+                    self.admitted += 1
+            if delay > 0:
+                queue.timer = loop.call_later(delay, self._dispatch, loop)
+                return
+            queue.waiting.popleft()
+            future.set_result(None)
+
+    def record_headers(self, headers: Mapping[str, str], status_code: int = 200):
+        """
+        Follow the x-ratelimit-* (and retry-after) headers of a Groq response.
+        Safe to call from any thread: waiting loops are woken with call_soon_threadsafe.
+        """
+        remaining_requests = _header_number(headers, "x-ratelimit-remaining-requests")
+        pause = None
+        if status_code == 429:
+            pause = parse_duration(headers.get("retry-after")) or parse_duration(headers.get("x-ratelimit-reset-tokens")) or 1.0
+        elif remaining_requests is not None and remaining_requests <= 0:
+            pause = parse_duration(headers.get("x-ratelimit-reset-requests"))
+
+        with self._lock:
+            now = time.monotonic()
+            self.tokens.observe(
+                now,
+                limit=_header_number(headers, "x-ratelimit-limit-tokens"),
+                remaining=_header_number(headers, "x-ratelimit-remaining-tokens"),
+            )
+            # Groq reports requests per day; only the remaining budget caps the per-minute bucket
+            self.requests.observe(now, remaining=remaining_requests)
+            if status_code == 429:
+                self.throttled += 1
+            if pause:
+                self.paused_until = max(self.paused_until, now + pause)
+        if pause:
+            logger.warning(f"{self.name}: Groq rate limit reached, pausing calls for {pause:.2f}s")
+
+        # Re-plan each loop's queue on its own thread, since limits may have been raised or paused
+        for loop, queue in list(self._queues.items()):
+            if queue.waiting and not loop.is_closed():
+                try:
+                    loop.call_soon_threadsafe(self._dispatch, loop)
+                except RuntimeError:
+                    pass  # The loop closed in the meantime
+
+    def stats(self) -> Dict[str, Any]:
+        """Current limits, queue length and admission counters"""
+        queued = sum(
+            1 for queue in list(self._queues.values()) for _, future in list(queue.waiting) if not future.done()
+        )
+        with self._lock:
+            now = time.monotonic()
+            self.requests._refill(now)
+            self.tokens._refill(now)
+            return {
+                "requests_per_minute": self.requests.capacity,
+                "tokens_per_minute": self.tokens.capacity,
+                "available_requests": round(self.requests.level, 2),
+                "available_tokens": round(self.tokens.level),
+                "queued": queued,
+                "admitted": self.admitted,
+                "waited": self.waited,
+                "mean_wait": self.wait_seconds / self.admitted if self.admitted else 0.0,
+                "throttled": self.throttled,
+            }
+
+
+_schedulers: Dict[Tuple[str, str], GroqRateScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_groq_scheduler(api_key: str, model: str, requests_per_minute: float = 30, tokens_per_minute: float = 12000) -> GroqRateScheduler:
+    """Shared scheduler of (api key, model), created with the given starting limits on first use"""
+    key = (api_key, model)
+    scheduler = _schedulers.get(key)
+    if scheduler is None:
+        with _schedulers_lock:
+            scheduler = _schedulers.get(key)
+            if scheduler is None:
+                scheduler = _schedulers[key] = GroqRateScheduler(requests_per_minute, tokens_per_minute, name=f"groq:{model}")
+    return scheduler
+
+
+def has_schedulers() -> bool:
+    """Whether any scheduler exists, so response hooks can skip parsing requests otherwise"""
+    return bool(_schedulers)
+
+
+def record_rate_limit_headers(api_key: str, model: Optional[str], headers: Mapping[str, str], status_code: int = 200):
+    """Pass the rate-limit headers of a response to the scheduler of (api key, model), if one exists"""
+    scheduler = _schedulers.get((api_key, model)) if model else None
+    if scheduler is not None:
+        scheduler.record_headers(headers, status_code)
+
+
+def clear_schedulers():
+    """Drop every scheduler, e.g. after API keys are rotated"""
+    with _schedulers_lock:
+        _schedulers.clear()
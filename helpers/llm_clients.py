@@ -0,0 +1,171 @@
+# helpers/llm_clients.py
+"""
+Process-wide registry of pooled LLM API clients.
+
+Creating a new Groq client per call means a new HTTP connection pool and a new TLS
+handshake every time. The registry hands out one client per (provider, api key, mode),
+each backed by a keep-alive httpx pool, so the pipeline and the tool modules all reuse
+warm connections.
+
+Modes:
+    "sync"                 groq.Groq
+    "async"                groq.AsyncGroq
+    "instructor_sync"      instructor wrapper around the shared groq.Groq
+    "instructor_async"     instructor wrapper around the shared groq.AsyncGroq
+
+Async clients are additionally scoped to the running event loop, since an httpx
+async pool cannot be shared across loops (e.g. between separate asyncio.run() calls).
+They are keyed on the loop object itself, not its id(), which a later loop can reuse,
+and the clients of loops that have closed are dropped from the registry.
+
+Every pool reports the rate-limit headers of its chat completion responses to the Groq
+rate scheduler of the calling (api key, model), see helpers/groq_scheduler.py.
+"""
+import asyncio
+import json
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+import groq
+import instructor
+
+from helpers.groq_scheduler import has_schedulers, record_rate_limit_headers
+
+logger = logging.getLogger("Argos")
+
+# Keep-alive pool settings shared by every client in the registry
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+KEEPALIVE_EXPIRY = 60  # seconds an idle connection is kept open
+
+SUPPORTED_MODES = ("sync", "async", "instructor_sync", "instructor_async")
+
+_clients: Dict[Tuple[Any, ...], Any] = {}
+_clients_lock = threading.RLock()  # Re-entrant: instructor clients fetch their base client while holding it
+
+
+def _http_limits() -> httpx.Limits:
+    """Connection pool limits used for every registry client"""
+    return httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+
+
+def _record_rate_limits(response: httpx.Response):
+    """Response hook: feed the x-ratelimit-* headers of a chat completion to its rate scheduler"""
+    if not has_schedulers() or not response.request.url.path.endswith("/chat/completions"):
+        return
+    api_key = response.request.headers.get("authorization", "").removeprefix("Bearer ").strip()
+    try:
+        model = json.loads(response.request.content).get("model")
+    except (ValueError, AttributeError, httpx.RequestNotRead):
+        return
+    record_rate_limit_headers(api_key, model, response.headers, response.status_code)
+
+
+async def _arecord_rate_limits(response: httpx.Response):
+    _record_rate_limits(response)
+
+
+def _registry_key(provider: str, api_key: str, mode: str) -> Tuple[Any, ...]:
+    """Build the registry key, scoping async clients to the running event loop"""
+    if mode.endswith("async"):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        return (provider, api_key, mode, loop)
+    return (provider, api_key, mode)
+
+
+def _drop_closed_loop_clients():
+    """Forget the async clients of loops that have closed; their connections died with the loop"""
+    stale_keys = [
+        key for key in _clients
+        if len(key) > 3 and isinstance(key[3], asyncio.AbstractEventLoop) and key[3].is_closed()
+    ]
+    for key in stale_keys:
+        del _clients[key]
+
+
+def _create_client(provider: str, api_key: str, mode: str, instructor_mode: Optional[instructor.Mode]) -> Any:
+    """Create a new pooled client for the given provider and mode"""
+    if provider != "groq":
+        raise ValueError(f"Unsupported LLM provider: {provider}")
+
+    if mode == "sync":
+        return groq.Groq(
+            api_key=api_key,
+            http_client=httpx.Client(limits=_http_limits(), event_hooks={"response": [_record_rate_limits]}),
+        )
+    if mode == "async":
+        return groq.AsyncGroq(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(limits=_http_limits(), event_hooks={"response": [_arecord_rate_limits]}),
+        )
+
+    # Instructor wrappers reuse the pooled base client of the same key
+    base_client = get_client(provider, api_key, "sync" if mode == "instructor_sync" else "async")
+    if instructor_mode is None:
+        return instructor.from_groq(base_client)
+    return instructor.from_groq(base_client, mode=instructor_mode)
+
+
+def get_client(provider: str, api_key: str, mode: str = "sync", instructor_mode: Optional[instructor.Mode] = None) -> Any:
+    """
+    Get the shared client for (provider, api key, mode), creating it on first use.
+
+    Args:
+        provider: LLM provider name, currently only "groq"
+        api_key: API key the client authenticates with
+        mode: One of SUPPORTED_MODES
+        instructor_mode: Optional instructor.Mode for the instructor modes
+
+    Returns:
+        The pooled client instance
+    """
+    if mode not in SUPPORTED_MODES:
+        raise ValueError(f"Unsupported client mode: {mode}")
+
+    key = _registry_key(provider, api_key, mode)
+    if instructor_mode is not None:
+        key = key + (instructor_mode,)
+
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            _drop_closed_loop_clients()
+            logger.debug(f"Creating pooled {provider} client (mode={mode})")
+            client = _create_client(provider, api_key, mode, instructor_mode)
+            _clients[key] = client
+    return client
+
+
+def get_groq_client(api_key: str) -> groq.Groq:
+    """Shared synchronous Groq client for api_key"""
+    return get_client("groq", api_key, "sync")
+
+
+def get_async_groq_client(api_key: str) -> groq.AsyncGroq:
+    """Shared asynchronous Groq client for api_key, bound to the running event loop"""
+    return get_client("groq", api_key, "async")
+
+
+def get_groq_instructor_client(api_key: str, async_client: bool = True, instructor_mode: Optional[instructor.Mode] = None) -> Any:
+    """Shared instructor wrapper around the pooled Groq client for api_key"""
+    mode = "instructor_async" if async_client else "instructor_sync"
+    return get_client("groq", api_key, mode, instructor_mode)
+
+
+def clear_clients():
+    """Drop every client from the registry, e.g. after API keys are rotated"""
+    with _clients_lock:
+        _clients.clear()
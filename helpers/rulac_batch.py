@@ -0,0 +1,149 @@
+# helpers/rulac_batch.py
+"""
+Batched RULAC conflict queries.
+
+A plan with several RULAC conflict tools (country + non-state actor + region, or a
+multi-country comparison) used to run one Neo4j query per tool, each with its own
+connection checkout and transaction. A RULACQueryBatch collects the conflict queries of
+one plan and runs them as the statements of a single read transaction, then hands each
+tool its own rows back.
+
+The pipeline creates a batch for the number of RULAC conflict tools it is about to
+dispatch and makes it current with use_rulac_batch() while creating the tool tasks; the
+tasks inherit it through their context. Tools send their query with run() (or call skip()
+when the snapshot answered without Neo4j). The batch runs once every expected tool has
+reported, or after a short window, so a slow tool never holds the others back for long.
+"""
+import asyncio
+import json
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("Argos")
+
+# Batch of the plan being dispatched, inherited by the tool tasks created under use_rulac_batch()
+current_rulac_batch: ContextVar[Optional["RULACQueryBatch"]] = ContextVar("current_rulac_batch", default=None)
+
+Statement = Tuple[str, Dict[str, Any]]
+
+
+@contextmanager
+def use_rulac_batch(batch: Optional["RULACQueryBatch"]) -> Iterator[Optional["RULACQueryBatch"]]:
+    """Make batch current for the tasks created inside the block (a None batch disables batching)"""
+    token = current_rulac_batch.set(batch)
+    try:
+        yield batch
+    finally:
+        current_rulac_batch.reset(token)
+
+
+def statement_key(query: str, params: Dict[str, Any]) -> str:
+    """Identity of a statement, so identical sub-requests run once"""
+    return query + "\x1f" + json.dumps(params, sort_keys=True, default=str)
+
+
+class RULACQueryBatch:
+    """
+    Collects the RULAC conflict queries of one plan and runs them in one read transaction.
+
+    Args:
+        run_statements: Runs a list of (query, params) in one transaction, returning the rows of each
+        run_query: Runs a single (query, params); used when the batched transaction fails
+        expected: Number of tools expected to report with run() or skip()
+        window: Seconds to wait for the remaining tools after the first query arrives
+    """
+
+    def __init__(
+        self,
+        run_statements: Callable[[List[Statement]], Awaitable[List[List[Dict[str, Any]]]]],
+        run_query: Callable[[str, Dict[str, Any]], Awaitable[List[Dict[str, Any]]]],
+        expected: int,
+        window: float = 0.05,
+    ):
+        self.run_statements = run_statements
+        self.run_query = run_query
+        self.remaining = expected
+        self.window = window
+        self.pending: List[Tuple[str, Dict[str, Any], asyncio.Future]] = []
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+        self.tasks = set()
+        self.transactions = 0
+        self.statements = 0
+        self.requests = 0
+
+    async def run(self, query: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Queue a query for the batch and wait for its rows"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((query, params, future))
+        self.requests += 1
+        self.remaining -= 1
+        if self.remaining <= 0:
+            self.flush()
+        elif self.flush_handle is None:
+            self.flush_handle = loop.call_later(self.window, self.flush)
+        return await future
+
+    def skip(self):
+        """Report a tool that answered without a query, so the batch does not wait for it"""
+        self.remaining -= 1
+        if self.remaining <= 0 and self.pending:
+            self.flush()
+
+    def flush(self):
+        """Run the queued queries now"""
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        # Queries of tools cancelled in the meantime (e.g. past their deadline) are dropped
+        pending = [(query, params, future) for query, params, future in self.pending if not future.done()]
+        self.pending = []
+        if pending:
+            task = asyncio.get_running_loop().create_task(self._execute(pending))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def _execute(self, pending: List[Tuple[str, Dict[str, Any], asyncio.Future]]):
+        statements: Dict[str, Statement] = {}
+        for query, params, _ in pending:
+            statements.setdefault(statement_key(query, params), (query, params))
+        keys = list(statements)
+
+        start = time.perf_counter()
+        transactions = 1
+        try:
+            if len(keys) == 1:
+                results = [await self.run_query(*statements[keys[0]])]
+            else:
+                results = await self.run_statements([statements[key] for key in keys])
+        except Exception as e:
+            if len(keys) == 1:
+                results = [e]
+            else:
+                # One failing statement aborts the transaction; run them separately so the others still answer
+                logger.warning(f"Batched RULAC transaction failed, running its {len(keys)} queries separately: {e}")
+                results = await asyncio.gather(*(self.run_query(*statements[key]) for key in keys), return_exceptions=True)
+                transactions = len(keys)
+        self.transactions += transactions
+        self.statements += len(keys)
+        logger.info(
+            f"Ran {len(keys)} RULAC queries for {len(pending)} tool calls in {transactions} transaction(s) "
+            f"({(time.perf_counter() - start) * 1000:.1f} ms)"
+        )
+
+        by_key = dict(zip(keys, results))
+        for query, params, future in pending:
+            if future.done():
+                continue
+            result = by_key[statement_key(query, params)]
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def stats(self) -> Dict[str, int]:
+        """Tool queries received, distinct statements run and transactions used"""
+        return {"requests": self.requests, "statements": self.statements, "transactions": self.transactions}
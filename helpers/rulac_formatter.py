@@ -0,0 +1,318 @@
+# helpers/rulac_formatter.py
+"""
+Client-side rendering of RULAC conflict lookups.
+
+The RULAC conflict queries (prompts/indv_tool_prompts/tool_cypher_RULAC_conflict_by_*) and
+RULACSnapshot both return flat conflict rows, one per (group_name, conflict):
+
+    group_name         State actor, organization member or country name; None if nothing matched
+    region_name        Region the country was matched through (region lookups only)
+    conflict_id        Conflict node id; None for a group without matching conflicts
+    conflict_name, conflict_overview, applicable_law, conflict_citation
+    conflict_types     Classifications of the conflict
+    state_parties      Names of the state actors party to the conflict
+    non_state_parties  Names of the non-state actors party to the conflict
+
+The render_* functions turn those rows into the {"summary": ..., "conflict_details": [...]}
+map read by process_rulac_data. Summary text is built here once, in Python, instead of with
+nested apoc.text.join calls on the database, and the structured rows can be cached as is.
+
+Statistics-only lookups (count and comparison questions) use the queries' STATS_PROMPT, which
+returns aggregate rows without any conflict text, one per (group_name, conflict type):
+
+    group_name, region_name   As above
+    conflict_type             Classification; None for a group without matching conflicts
+    conflict_ids              Ids of the group's conflicts with that classification
+
+render_statistics turns them into a compact table of counts, with no conflict profiles.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Number of state actors listed when neither countries nor conflict types narrow the lookup
+TOP_STATE_ACTORS = 10
+
+NO_STATE_PARTIES = "No state actors recorded"
+NO_NON_STATE_PARTIES = "No non-state actors recorded"
+
+# Column order of the statistics table; other classifications follow in first-seen order
+CONFLICT_TYPE_ORDER = ["International Armed Conflict (IAC)", "Non-International Armed Conflict (NIAC)", "Military Occupation"]
+
+
+class ConflictRows:
+    """Flat conflict rows grouped by (group, region) in first-seen order, with each conflict kept once"""
+
+    def __init__(self, rows: Iterable[Dict[str, Any]]):
+        self.groups: Dict[Tuple[Optional[str], Optional[str]], List[str]] = {}
+        self.conflicts: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            conflict_ids = self.groups.setdefault((row.get("group_name"), row.get("region_name")), [])
+            conflict_id = row.get("conflict_id")
+            if conflict_id is None:
+                continue
+            self.conflicts.setdefault(conflict_id, row)
+            if conflict_id not in conflict_ids:
+                conflict_ids.append(conflict_id)
+
+    def named_groups(self) -> List[Tuple[str, Optional[str], List[str]]]:
+        """(group, region, conflict ids) for every group that matched a node"""
+        return [(group, region, conflict_ids) for (group, region), conflict_ids in self.groups.items() if group is not None]
+
+    def all_conflict_ids(self) -> List[str]:
+        """Distinct conflict ids across all groups, in first-seen order"""
+        return list(dict.fromkeys(conflict_id for conflict_ids in self.groups.values() for conflict_id in conflict_ids))
+
+    def names(self, conflict_ids: Iterable[str]) -> List[str]:
+        return [self.conflicts[conflict_id]["conflict_name"] for conflict_id in conflict_ids if self.conflicts[conflict_id].get("conflict_name")]
+
+    def with_type(self, conflict_ids: List[str], conflict_type: str) -> List[str]:
+        """Conflicts classified as conflict_type, compared case-insensitively"""
+        conflict_type = conflict_type.lower()
+        return [
+            conflict_id for conflict_id in conflict_ids
+            if any(t.lower() == conflict_type for t in self.conflicts[conflict_id].get("conflict_types") or [])
+        ]
+
+
+def classification(row: Dict[str, Any], conflict_types: List[str]) -> str:
+    """First classification of the conflict allowed by the conflict type filter"""
+    for conflict_type in row.get("conflict_types") or []:
+        if not conflict_types or conflict_type in conflict_types:
+            return conflict_type
+    return "Unclassified"
+
+
+def party_names(names: Optional[Iterable[str]], empty_text: str) -> str:
+    names = list(dict.fromkeys(name for name in names or [] if name))
+    return ", ".join(names) if names else empty_text
+
+
+def conflict_detail(row: Dict[str, Any], conflict_types: List[str]) -> Dict[str, str]:
+    """One conflict_details entry"""
+    return {
+        "conflict_id": row.get("conflict_id"),
+        "conflict_name": row.get("conflict_name") or "Unknown",
+        "conflict_classification": classification(row, conflict_types),
+        "conflict_overview": row.get("conflict_overview") or "No Overview Available",
+        "applicable_ihl_law": row.get("applicable_law") or "Not Specified",
+        "conflict_citation": row.get("conflict_citation") or "No Citation Available",
+        "state_parties": party_names(row.get("state_parties"), NO_STATE_PARTIES),
+        "non_state_parties": party_names(row.get("non_state_parties"), NO_NON_STATE_PARTIES),
+    }
+
+
+def conflict_details(grouped: ConflictRows, conflict_ids: Iterable[str], conflict_types: List[str]) -> List[Dict[str, str]]:
+    return [conflict_detail(grouped.conflicts[conflict_id], conflict_types) for conflict_id in dict.fromkeys(conflict_ids)]
+
+
+def ranked_groups(grouped: ConflictRows, limit_to_top: bool) -> List[Tuple[str, List[str]]]:
+    """(group, conflict ids) sorted by conflict count, highest first, optionally cut to the top state actors"""
+    group_data = [(group, conflict_ids) for group, _, conflict_ids in grouped.named_groups()]
+    group_data.sort(key=lambda item: len(item[1]), reverse=True)
+    return group_data[:TOP_STATE_ACTORS] if limit_to_top else group_data
+
+# // RENDERERS //
+
+def render_by_country(rows: List[Dict[str, Any]], countries: List[str], conflict_types: List[str]) -> Optional[Dict[str, Any]]:
+    """Render get_armed_conflict_data_by_country rows; None if no state actor matched"""
+    grouped = ConflictRows(rows)
+    actor_data = ranked_groups(grouped, limit_to_top=not countries and not conflict_types)
+    if not actor_data:
+        return None
+
+    actor_summaries = []
+    for actor, conflict_ids in actor_data:
+        if conflict_types:
+            classification_details = [(t, grouped.with_type(conflict_ids, t)) for t in conflict_types]
+        else:
+            classification_details = [(None, conflict_ids)]
+        actor_summaries.append(". ".join(
+            f"{actor} is involved as a state actor to {len(ids)} armed conflict{'' if len(ids) == 1 else 's'}"
+            + (f' classified as "{conflict_type}"' if conflict_type is not None else "")
+            + (f": {', '.join(grouped.names(ids))}" if ids else "")
+            for conflict_type, ids in classification_details
+        ))
+
+    return {
+        "summary": "According to RULAC, " + ". ".join(actor_summaries) + ".",
+        "conflict_details": conflict_details(grouped, (conflict_id for _, ids in actor_data for conflict_id in ids), conflict_types),
+    }
+
+
+def render_by_non_state_actor(rows: List[Dict[str, Any]], non_state_actors: List[str]) -> Dict[str, Any]:
+    """Render get_armed_conflict_data_by_non_state_actor rows; always returns a map, possibly with no conflicts"""
+    grouped = ConflictRows(rows)
+    global_conflicts = grouped.all_conflict_ids()
+    actor_names = ", ".join(non_state_actors)
+
+    if not global_conflicts:
+        summary = f"According to RULAC, there are currently no recorded armed conflicts involving {actor_names}."
+    else:
+        summary = (
+            f"According to RULAC, there are currently {len(global_conflicts)} total distinct armed conflict(s) involving "
+            f"{actor_names} as a non-state actor. These conflicts are: {', '.join(grouped.names(global_conflicts))}."
+        )
+    return {
+        "summary": summary,
+        "conflict_details": conflict_details(grouped, global_conflicts, []),
+    }
+
+
+def render_by_organization(rows: List[Dict[str, Any]], organizations: List[str], conflict_types: List[str]) -> Optional[Dict[str, Any]]:
+    """Render get_armed_conflict_data_by_organization rows; None if no organization matched"""
+    if not rows:
+        return None
+    grouped = ConflictRows(rows)
+    actor_data = ranked_groups(grouped, limit_to_top=not conflict_types)
+
+    breakdown = "; ".join(
+        f"{actor} is a state actor to {len(conflict_ids)} distinct armed conflict(s) ({', '.join(grouped.names(conflict_ids))})"
+        for actor, conflict_ids in actor_data if conflict_ids
+    )
+    global_conflicts = list(dict.fromkeys(conflict_id for _, conflict_ids in actor_data for conflict_id in conflict_ids))
+    classified_as = ", ".join(f"'{t}'" for t in conflict_types)
+    organization_names = ", ".join(organizations)
+
+    if not global_conflicts:
+        summary = (
+            f"According to RULAC, there are currently no recorded armed conflicts classified as {classified_as} "
+            f"involving state actors that are members of the '{organization_names}' organization."
+        )
+    else:
+        summary = (
+            f"According to RULAC, there are currently {len(global_conflicts)} total distinct armed conflict(s) classified as "
+            f"{classified_as} involving state actors that are members of the '{organization_names}' organization. "
+            f"Breakdown by state actor: {breakdown}."
+        )
+    return {
+        "summary": summary,
+        "conflict_details": conflict_details(grouped, global_conflicts, conflict_types),
+    }
+
+
+def render_by_region(rows: List[Dict[str, Any]], regions: List[str], conflict_types: List[str]) -> Optional[Dict[str, Any]]:
+    """Render get_armed_conflict_data_by_region rows (one group per country and region); None if no country matched"""
+    grouped = ConflictRows(rows)
+    country_data = grouped.named_groups()
+    if not country_data:
+        return None
+
+    region_counts = []
+    for region in regions:
+        region_conflicts = {
+            conflict_id for _, country_region, conflict_ids in country_data if country_region == region for conflict_id in conflict_ids
+        }
+        region_counts.append((region, len(region_conflicts)))
+
+    max_count = max(count for _, count in region_counts)
+    leading_regions = [region for region, count in region_counts if count == max_count]
+    if len(region_counts) == 1 or max_count == 0:
+        dominant_region_summary = ""
+    elif len(leading_regions) > 1:
+        dominant_region_summary = f"Both {' and '.join(leading_regions)} regions have the same number of recorded conflicts."
+    else:
+        dominant_region_summary = f"{leading_regions[0]} has the most recorded conflicts."
+
+    breakdown_parts = []
+    for country, region, conflict_ids in country_data:
+        if not conflict_ids:
+            breakdown_parts.append(f"No recorded conflicts in {country} ({region})")
+        elif len(conflict_ids) == 1:
+            breakdown_parts.append(f"1 conflict taking place in {country} ({region}): {', '.join(grouped.names(conflict_ids))}")
+        else:
+            breakdown_parts.append(f"{len(conflict_ids)} conflicts taking place in {country} ({region}): {', '.join(grouped.names(conflict_ids))}")
+
+    if conflict_types:
+        initial_conflicts_string = "According to RULAC, among recorded conflicts classified as " + " and/or ".join(f"'{t}'" for t in conflict_types)
+    else:
+        initial_conflicts_string = "According to RULAC, among recorded conflicts"
+
+    region_summaries = []
+    for region, count in region_counts:
+        if count == 0:
+            region_summaries.append(f"No conflicts taking place in {region} region")
+        elif count == 1:
+            region_summaries.append(f"1 conflict is taking place in {region} region")
+        else:
+            region_summaries.append(f"{count} total distinct conflicts are currently taking place in {region} region")
+
+    summary = (
+        f"{initial_conflicts_string} taking place in {' and/or '.join(region for region, _ in region_counts)} --> "
+        f"{', '.join(region_summaries)}. {dominant_region_summary} Breakdown by country: {'; '.join(breakdown_parts)}"
+    )
+    return {
+        "summary": summary,
+        "conflict_details": conflict_details(grouped, grouped.all_conflict_ids(), conflict_types),
+    }
+
+# // STATISTICS //
+
+def statistics_rows(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Aggregate flat conflict rows (e.g. from RULACSnapshot) into the statistics row layout"""
+    aggregated: Dict[Tuple[Optional[str], Optional[str], Optional[str]], List[str]] = {}
+    for row in rows:
+        conflict_id = row.get("conflict_id")
+        conflict_types = (row.get("conflict_types") or [None]) if conflict_id is not None else [None]
+        for conflict_type in conflict_types:
+            conflict_ids = aggregated.setdefault((row.get("group_name"), row.get("region_name"), conflict_type), [])
+            if conflict_id is not None and conflict_id not in conflict_ids:
+                conflict_ids.append(conflict_id)
+    return [
+        {"group_name": group, "region_name": region, "conflict_type": conflict_type, "conflict_ids": conflict_ids}
+        for (group, region, conflict_type), conflict_ids in aggregated.items()
+    ]
+
+
+def render_statistics(rows: List[Dict[str, Any]], group_label: str, conflict_types: List[str]) -> Optional[Dict[str, Any]]:
+    """
+    Render statistics rows as a markdown table of conflict counts per group and classification.
+
+    Counts are distinct conflicts: a conflict is counted once per classification it holds, and
+    once in each total even when several groups are party to it. Region lookups get a total row
+    per region, and lookups over several groups an overall total. Returns None if there are no rows.
+    """
+    groups: Dict[Tuple[str, Optional[str]], Dict[str, set]] = {}
+    for row in rows:
+        group = row.get("group_name")
+        if group is None:
+            continue
+        by_type = groups.setdefault((group, row.get("region_name")), {})
+        conflict_type = row.get("conflict_type")
+        if conflict_type is not None and (not conflict_types or conflict_type in conflict_types):
+            by_type.setdefault(conflict_type, set()).update(row.get("conflict_ids") or [])
+    classified_as = " classified as " + " and/or ".join(f"'{t}'" for t in conflict_types) if conflict_types else ""
+    if not groups:
+        if not rows:
+            return None
+        # The lookup matched (e.g. an organization) but none of the requested groups
+        return {"summary": f"According to RULAC, there are no recorded armed conflicts{classified_as} for the requested {group_label}s.", "conflict_details": []}
+
+    seen_types = {conflict_type for by_type in groups.values() for conflict_type in by_type}
+    columns = conflict_types or [t for t in CONFLICT_TYPE_ORDER if t in seen_types] + sorted(seen_types - set(CONFLICT_TYPE_ORDER))
+    with_regions = any(region is not None for _, region in groups)
+
+    def table_row(label: str, region: Optional[str], by_type: Dict[str, set]) -> str:
+        total = set().union(*by_type.values()) if by_type else set()
+        cells = [label] + ([region or ""] if with_regions else []) + [str(len(total))] + [str(len(by_type.get(t, ()))) for t in columns]
+        return "| " + " | ".join(cells) + " |"
+
+    def merged(selected: Iterable[Dict[str, set]]) -> Dict[str, set]:
+        by_type: Dict[str, set] = {}
+        for group_types in selected:
+            for conflict_type, conflict_ids in group_types.items():
+                by_type.setdefault(conflict_type, set()).update(conflict_ids)
+        return by_type
+
+    header = [group_label.capitalize()] + (["Region"] if with_regions else []) + ["Conflicts"] + columns
+    lines = ["| " + " | ".join(header) + " |", "|" + "---|" * len(header)]
+    lines.extend(table_row(group, region, by_type) for (group, region), by_type in groups.items())
+
+    regions = list(dict.fromkeys(region for _, region in groups if region is not None))
+    for region in regions:
+        lines.append(table_row("**Total**", region, merged(by_type for (_, r), by_type in groups.items() if r == region)))
+    if len(groups) > 1 and len(regions) != 1:
+        lines.append(table_row("**Total (distinct)**", None, merged(groups.values())))
+
+    return {
+        "summary": f"According to RULAC, number of recorded armed conflicts{classified_as} by {group_label}:\n\n" + "\n".join(lines),
+        "conflict_details": [],
+    }
@@ -0,0 +1,249 @@
+# helpers/rulac_profiles.py
+"""
+Precomputed RULAC conflict profiles.
+
+Every RULAC conflict tool turns each conflict_details entry into two near-identical texts:
+the citation shown in the UI and the "##### Conflict Name" block of the system prompt. The
+same conflicts (e.g. the Russia/Ukraine IAC) come back in request after request and from
+several tools, so a ConflictProfileStore renders both once per graph version and hands out
+the same ConflictProfile (and citation dict) on every later lookup.
+
+Profiles are keyed by conflict id and classification, since the classification shown
+depends on the conflict type filter of the lookup. A store lives as long as the RULAC
+snapshot it belongs to (or the refresh interval, without a snapshot), so a graph refresh
+starts an empty store.
+
+Large region and organization lookups can return dozens of long profiles. With a token
+budget, fit_profiles_to_budget keeps full profiles for the conflicts most relevant to the
+question and condenses the rest to their one-line form.
+
+When several conflict tools return the same conflicts (e.g. by country and by region),
+merge_rulac_sections lists every profile once, after the tool sections.
+"""
+import logging
+import time
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from agents.gazetteer import extract_entities, get_aliases, normalize_text
+
+logger = logging.getLogger("Argos")
+
+# Question words too common to tell conflicts apart
+STOP_WORDS = frozenset({
+    "the", "and", "are", "for", "what", "which", "who", "how", "many", "does", "that", "this", "with", "from",
+    "about", "there", "their", "they", "any", "all", "has", "have", "been", "was", "were", "into", "involved",
+    "conflict", "conflicts", "armed", "war", "wars", "rulac", "taking", "place", "currently", "classified", "classification",
+})
+
+
+def relevance_terms(query: Optional[str]) -> FrozenSet[str]:
+    """Words of the question, plus the words of the gazetteer names and aliases of the entities it mentions"""
+    if not query:
+        return frozenset()
+    texts = [query]
+    for entity_type, names in extract_entities(query).items():
+        for name in names:
+            texts.extend(get_aliases(entity_type, name))
+    return frozenset(
+        word for text in texts for word in normalize_text(text).split()
+        if len(word) > 2 and word not in STOP_WORDS
+    )
+
+
+def _terms(*texts: Optional[str]) -> FrozenSet[str]:
+    return frozenset(word for text in texts if text for word in normalize_text(text).split() if len(word) > 2)
+
+
+class ConflictProfile:
+    """A conflict's rendered system prompt block and UI citation"""
+    __slots__ = ("conflict_id", "conflict_name", "prompt_block", "one_line", "tokens", "citation", "name_terms", "party_terms")
+
+    def __init__(self, conflict: Dict[str, str]):
+        self.conflict_id = conflict.get("conflict_id")
+        self.conflict_name = conflict.get("conflict_name", "Unnamed Conflict")
+
+        self.prompt_block = (
+            f"##### Conflict Name: {self.conflict_name}\n"
+            f"Conflict Classification under IHL: {conflict.get('conflict_classification', 'N/A')}\n"
+            f"Overview: {conflict.get('conflict_overview', 'N/A')}\n"
+            f"Applicable IHL Law: {conflict.get('applicable_ihl_law', 'N/A')}\n"
+            f"State Parties: {conflict.get('state_parties', 'None recorded')}\n"
+            f"Non-State Parties: {conflict.get('non_state_parties', 'None recorded')}"
+        )
+        # Condensed form used when the full profile does not fit the token budget
+        self.one_line = (
+            f"- {self.conflict_name} ({conflict.get('conflict_classification', 'N/A')}); "
+            f"state parties: {conflict.get('state_parties', 'None recorded')}; "
+            f"non-state parties: {conflict.get('non_state_parties', 'None recorded')}"
+        )
+        # Estimated prompt tokens of the full profile (characters / 4)
+        self.tokens = len(self.prompt_block) // 4
+        self.name_terms = _terms(self.conflict_name)
+        self.party_terms = _terms(conflict.get("state_parties"), conflict.get("non_state_parties"))
+
+        # Citation dict in the tools' Citation layout; None when the conflict has no citation URL
+        self.citation: Optional[Dict[str, str]] = None
+        if "conflict_citation" in conflict and "conflict_name" in conflict:
+            self.citation = {
+                "title": "RULAC - " + self.conflict_name,
+                "url": conflict.get("conflict_citation", "https://www.rulac.org"),
+                "formatted_content": (
+                    f"{self.conflict_name}\n\n"
+                    f"Conflict Classification under IHL: {conflict.get('conflict_classification', 'N/A')}\n\n"
+                    f"Overview: {conflict.get('conflict_overview', 'N/A')}\n\n"
+                    f"Applicable IHL Law: {conflict.get('applicable_ihl_law', 'N/A')}\n\n"
+                    f"State Parties: {conflict.get('state_parties', 'None recorded')}\n\n"
+                    f"Non-State Parties: {conflict.get('non_state_parties', 'None recorded')}"
+                ),
+            }
+
+
+class ConflictProfileStore:
+    """
+    Conflict profiles rendered once per graph version, keyed by (conflict id, classification).
+
+    Profiles and their citation dicts are shared between requests and must be treated as read-only.
+    """
+
+    def __init__(self, version: Optional[str] = None):
+        self.created_at = time.time()
+        self.version = version or str(self.created_at)
+        self._profiles: Dict[Tuple[str, str], ConflictProfile] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def get(self, conflict: Dict[str, str]) -> ConflictProfile:
+        """Profile of a conflict_details entry, rendered on first use"""
+        key = (conflict.get("conflict_id") or conflict.get("conflict_name", ""), conflict.get("conflict_classification", ""))
+        profile = self._profiles.get(key)
+        if profile is None:
+            self.misses += 1
+            profile = self._profiles[key] = ConflictProfile(conflict)
+        else:
+            self.hits += 1
+        return profile
+
+    def stats(self) -> Dict[str, object]:
+        """Store size and hit counts"""
+        return {"version": self.version, "profiles": len(self._profiles), "hits": self.hits, "misses": self.misses}
+
+
+def relevance_score(profile: ConflictProfile, terms: FrozenSet[str]) -> int:
+    """Overlap between the question and the conflict, weighting the conflict name above its parties"""
+    return 3 * len(terms & profile.name_terms) + 2 * len(terms & profile.party_terms)
+
+
+def fit_profiles_to_budget(profiles: List[ConflictProfile], token_budget: Optional[int], query: Optional[str] = None) -> Tuple[List[ConflictProfile], List[ConflictProfile]]:
+    """
+    Split profiles into those shown in full and those condensed to one line.
+
+    When all profiles fit the budget (or there is no budget) they are all kept in full, in
+    their original order. Otherwise profiles are ranked by relevance to the query, keeping
+    the original order among equals, and full profiles are taken in rank order while they
+    fit; the most relevant profile is always shown in full.
+
+    Args:
+        profiles: Conflict profiles in lookup order
+        token_budget: Estimated tokens available for full profiles; None or <= 0 for no limit
+        query: The user question the profiles are ranked against
+
+    Returns:
+        (full profiles in rank order, condensed profiles in rank order)
+    """
+    if not token_budget or token_budget <= 0 or sum(profile.tokens for profile in profiles) <= token_budget:
+        return profiles, []
+
+    terms = relevance_terms(query)
+    ranked = sorted(profiles, key=lambda profile: relevance_score(profile, terms), reverse=True)
+    full, condensed = [], []
+    used_tokens = 0
+    for profile in ranked:
+        if not full or used_tokens + profile.tokens <= token_budget:
+            full.append(profile)
+            used_tokens += profile.tokens
+        else:
+            condensed.append(profile)
+    return full, condensed
+
+
+def elision_note(condensed_profiles: List[ConflictProfile], profile_count: int, token_budget: Optional[int]) -> str:
+    """Note telling the final LLM how many profiles were shortened to one line, and how much was left out"""
+    elided_tokens = sum(profile.tokens - len(profile.one_line) // 4 for profile in condensed_profiles)
+    return (
+        f"_{len(condensed_profiles)} of {profile_count} conflict profiles were shortened to one line to fit the "
+        f"{token_budget}-token budget (~{elided_tokens} tokens of overviews and applicable law elided)._"
+    )
+
+
+def _conflict_key(profile: ConflictProfile) -> str:
+    return profile.conflict_id or profile.conflict_name
+
+
+def merge_rulac_sections(rulac_outputs: List[Dict[str, Any]]) -> List[str]:
+    """
+    Keep one copy of each conflict profile across RULAC tool outputs.
+
+    Conflict tools (get_armed_conflict_data_by_*) return their research summary and the shared
+    conflict profiles next to the content (see process_rulac_data in tools/RULAC_tools.py). When
+    the same profile comes back from several of them, each tool section is reduced to its
+    summary plus the names of its conflicts, and every profile is listed once under "Shared
+    conflict profiles" after the sections: in full if any tool showed it in full, otherwise as
+    its one-line entry, with an elision note counting the merged profiles. Outputs without
+    duplicates, and other RULAC tools, are passed through unchanged.
+
+    Args:
+        rulac_outputs: RULAC tool outputs in prompt order, with "content" and optionally "rulac_research"
+
+    Returns:
+        The content of each section, in order, followed by the shared profiles section if merged
+    """
+    researched = [output["rulac_research"] for output in rulac_outputs if isinstance(output.get("rulac_research"), dict)]
+    all_profiles = [
+        profile for research in researched
+        for profile in research.get("conflict_profiles", []) + research.get("condensed_profiles", [])
+    ]
+    if len({_conflict_key(profile) for profile in all_profiles}) == len(all_profiles):
+        return [output["content"] for output in rulac_outputs]
+
+    # A conflict shown in full by any tool is shown in full once; the others keep one line each
+    full_profiles = {
+        profile.prompt_block: profile for research in researched for profile in research.get("conflict_profiles", [])
+    }
+    full_conflicts = {_conflict_key(profile) for profile in full_profiles.values()}
+    condensed_profiles = {
+        profile.one_line: profile for research in researched for profile in research.get("condensed_profiles", [])
+        if _conflict_key(profile) not in full_conflicts
+    }
+
+    sections = []
+    for output in rulac_outputs:
+        research = output.get("rulac_research")
+        if not isinstance(research, dict):
+            sections.append(output["content"])
+            continue
+        conflict_names = list(dict.fromkeys(
+            profile.conflict_name for profile in research.get("conflict_profiles", []) + research.get("condensed_profiles", [])
+        ))
+        if conflict_names:
+            pointer = "Conflict profiles (see Shared conflict profiles below): " + "; ".join(conflict_names)
+        else:
+            pointer = "No conflict details available."
+        sections.append(f"{research['summary']}\n\n{pointer}")
+    shared_blocks = [profile.prompt_block for profile in full_profiles.values()]
+    if condensed_profiles:
+        shared_blocks.append("##### Other conflicts (one line each)\n" + "\n".join(condensed_profiles))
+        # Counted on the merged profiles, not copied from the tools, whose counts include duplicates and promoted profiles
+        token_budget = max((research["token_budget"] for research in researched if research.get("token_budget")), default=None)
+        shared_blocks.append(elision_note(list(condensed_profiles.values()), len(full_profiles) + len(condensed_profiles), token_budget))
+    sections.append("### Shared conflict profiles\n\n" + "\n\n".join(shared_blocks))
+
+    original_tokens = sum(len(output["content"]) for output in rulac_outputs) // 4
+    merged_tokens = sum(len(section) for section in sections) // 4
+    logger.info(
+        f"Merged RULAC conflict profiles across {len(researched)} tools: {len(all_profiles)} -> {len(full_profiles) + len(condensed_profiles)} profiles, "
+        f"~{original_tokens - merged_tokens} tokens saved ({original_tokens} -> {merged_tokens} estimated tokens)"
+    )
+    return sections
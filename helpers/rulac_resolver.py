@@ -0,0 +1,238 @@
+# helpers/rulac_resolver.py
+"""
+Name and alias resolution for RULAC graph nodes.
+
+The conflict queries used to match actors with `toLower(sa.name) CONTAINS toLower(x)` over
+every StateActor, which is a full label scan and over-matches ("Niger" also matches
+"Nigeria"). A NameResolver is built once from all StateActor, NonStateActor and Country
+names and aliases and maps user strings to canonical nodes, so the queries can look
+actors up by UN M49 code instead (`sa.UN_M49Code IN $codes`).
+
+A user string is resolved in order of decreasing confidence, stopping at the first step
+that finds anything:
+    1. UN M49 code ("804")
+    2. Exact normalized name or alias ("russian federation")
+    3. Gazetteer aliases of the string ("USA" -> "United States of America", "US", ...)
+    4. Whole-token containment ("Congo" -> "Democratic Republic of the Congo", "Congo")
+    5. Optional fuzzy match for misspellings ("Ukriane" -> "Ukraine"): candidates sharing
+       trigrams with the string, scored by edit similarity and close to it in length
+
+Region names never fall through to steps 4 and 5, so "Africa" does not resolve to South
+Africa, and a longer name is not fuzzy-matched to a state it contains ("Somaliland" is not
+Somalia).
+"""
+import logging
+import time
+from difflib import SequenceMatcher
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from agents.gazetteer import REGION_ALIASES, REGIONS, SPECIAL_REGIONS, extract_entities, get_aliases, normalize_text
+
+logger = logging.getLogger("Argos")
+
+# Node kinds indexed by the resolver
+STATE_ACTOR = "state_actor"
+NON_STATE_ACTOR = "non_state_actor"
+COUNTRY = "country"
+
+# Kinds that identify a state: StateActor and Country nodes share UN M49 codes
+STATE_KINDS = (STATE_ACTOR, COUNTRY)
+
+# Minimum edit similarity (difflib ratio) for a fuzzy match; one transposed letter pair in a
+# 7-letter name scores 0.86
+FUZZY_THRESHOLD = 0.8
+
+# Largest length difference of a fuzzy match, as a share of the longer string (at least one character)
+FUZZY_MAX_LENGTH_DIFFERENCE = 0.2
+
+# Region names and their words, which must not resolve to a state containing them
+# ("Africa" -> "South Africa", "America" -> "United States of America")
+REGION_FORMS = frozenset(
+    normalize_text(name) for name in [*REGIONS, *SPECIAL_REGIONS, *(alias for aliases in REGION_ALIASES.values() for alias in aliases)]
+)
+REGION_TOKENS = frozenset(token for form in REGION_FORMS for token in form.split())
+
+# Names query used when no RULAC snapshot is available to build the resolver from
+NAMES_QUERY = """
+MATCH (n)
+WHERE n:StateActor OR n:NonStateActor OR n:Country
+RETURN elementId(n) AS id, labels(n) AS labels, n.name AS name, n.UN_M49Code AS code, n.aliases AS aliases
+"""
+
+LABEL_KINDS = {"StateActor": STATE_ACTOR, "NonStateActor": NON_STATE_ACTOR, "Country": COUNTRY}
+
+
+def trigrams(normalized: str) -> Set[str]:
+    """Character trigrams of a normalized string, padded so short words still produce some"""
+    padded = f"  {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameEntry:
+    """One resolvable node: its kind, node id, UN M49 code (if any) and canonical name"""
+    __slots__ = ("kind", "node_id", "code", "name")
+
+    def __init__(self, kind: str, node_id: str, code: Optional[str], name: str):
+        self.kind = kind
+        self.node_id = node_id
+        self.code = code
+        self.name = name
+
+    def __repr__(self):
+        return f"NameEntry({self.kind}, {self.name!r}, code={self.code})"
+
+
+class NameResolver:
+    """
+    Index of node names and aliases for resolving user strings to canonical RULAC nodes.
+
+    Build it with NameResolver(records) from (kind, node_id, code, name, aliases) tuples,
+    with NameResolver.load(run_query) from Neo4j, or from a RULACSnapshot.
+    """
+
+    def __init__(self, records: Iterable[Tuple[str, str, Optional[str], Optional[str], Optional[Iterable[str]]]]):
+        self.loaded_at = time.time()
+        self.entries: List[NameEntry] = []
+        self._by_name: Dict[str, List[int]] = {}   # normalized name/alias -> entry indexes
+        self._by_code: Dict[str, List[int]] = {}   # UN M49 code -> entry indexes
+        self._by_token: Dict[str, Set[int]] = {}   # token -> entry indexes, for whole-token containment
+        self._by_trigram: Dict[str, Set[int]] = {} # trigram -> entry indexes, for fuzzy matching
+        self._forms: List[List[str]] = []          # normalized names/aliases per entry
+
+        for kind, node_id, code, name, aliases in records:
+            if not name:
+                continue
+            index = len(self.entries)
+            self.entries.append(NameEntry(kind, node_id, str(code) if code else None, name))
+            forms = list(dict.fromkeys(normalize_text(form) for form in (name, *(aliases or [])) if form and normalize_text(form)))
+            self._forms.append(forms)
+            if code:
+                self._by_code.setdefault(str(code), []).append(index)
+            for form in forms:
+                self._by_name.setdefault(form, []).append(index)
+                for token in form.split():
+                    self._by_token.setdefault(token, set()).add(index)
+                for trigram in trigrams(form):
+                    self._by_trigram.setdefault(trigram, set()).add(index)
+
+    @classmethod
+    async def load(cls, run_query: Callable[[str, dict], Awaitable[List[Dict[str, Any]]]]) -> "NameResolver":
+        """Build a resolver from the names and aliases of all StateActor, NonStateActor and Country nodes in Neo4j"""
+        rows = await run_query(NAMES_QUERY, {})
+        records = []
+        for row in rows:
+            for label in row.get("labels") or []:
+                if label in LABEL_KINDS:
+                    records.append((LABEL_KINDS[label], row["id"], row.get("code"), row.get("name"), row.get("aliases")))
+        resolver = cls(records)
+        logger.info(f"Built RULAC name resolver with {len(resolver.entries)} names")
+        return resolver
+
+    def _filter(self, indexes: Iterable[int], kinds: Iterable[str]) -> List[int]:
+        kinds = set(kinds)
+        return sorted({index for index in indexes if self.entries[index].kind in kinds})
+
+    def _exact(self, normalized: str, kinds: Iterable[str]) -> List[int]:
+        return self._filter(self._by_name.get(normalized, []), kinds)
+
+    def _token_containment(self, normalized: str, kinds: Iterable[str]) -> List[int]:
+        """Entries with a name or alias containing the query as a run of whole tokens"""
+        tokens = normalized.split()
+        if not tokens:
+            return []
+        candidates = set.intersection(*(self._by_token.get(token, set()) for token in tokens))
+        padded_query = f" {normalized} "
+        return self._filter(
+            (index for index in candidates if any(padded_query in f" {form} " for form in self._forms[index])),
+            kinds
+        )
+
+    def _fuzzy(self, normalized: str, kinds: Iterable[str], threshold: float) -> List[int]:
+        """Entries whose best name or alias of a similar length is the most similar to the query by edit similarity"""
+        candidates = set()
+        for trigram in trigrams(normalized):
+            candidates |= self._by_trigram.get(trigram, set())
+
+        best_score, best = 0.0, []
+        for index in self._filter(candidates, kinds):
+            scores = [
+                SequenceMatcher(None, normalized, form).ratio() for form in self._forms[index]
+                if abs(len(form) - len(normalized)) <= max(1, FUZZY_MAX_LENGTH_DIFFERENCE * max(len(form), len(normalized)))
+            ]
+            if not scores:
+                continue
+            score = max(scores)
+            if score > best_score:
+                best_score, best = score, [index]
+            elif score == best_score:
+                best.append(index)
+        return best if best_score >= threshold else []
+
+    def resolve(self, text: str, kinds: Iterable[str] = STATE_KINDS, fuzzy: bool = True, threshold: float = FUZZY_THRESHOLD) -> List[NameEntry]:
+        """
+        Resolve one user string to the matching nodes of the given kinds.
+
+        Args:
+            text: Name, alias, acronym or UN M49 code as written by the user or the LLM
+            kinds: Node kinds to consider
+            fuzzy: Allow fuzzy matching as a last resort
+            threshold: Minimum edit similarity for fuzzy matches
+
+        Returns:
+            Matching NameEntry objects, most confident step only; [] if nothing matched
+        """
+        kinds = tuple(kinds)
+        text = str(text or "").strip()
+        if not text:
+            return []
+
+        # 1. UN M49 code
+        if text.isdigit():
+            return [self.entries[index] for index in self._filter(self._by_code.get(text, []), kinds)]
+
+        normalized = normalize_text(text)
+
+        # 2. Exact normalized name or alias
+        matches = self._exact(normalized, kinds)
+
+        # 3. Gazetteer aliases ("USA", "DRC", "Russia" / "Russian Federation")
+        if not matches:
+            gazetteer_names = []
+            entities = extract_entities(text)
+            for entity_type in ("countries", "non_state_actors"):
+                for name in entities[entity_type]:
+                    gazetteer_names.extend(get_aliases(entity_type, name))
+            matches = sorted({index for name in gazetteer_names for index in self._exact(normalize_text(name), kinds)})
+
+        # Region names stop here: they are contained in, or close to, the names of states in the region
+        is_region = normalized in REGION_FORMS or (" " not in normalized and normalized in REGION_TOKENS)
+
+        # 4. Whole-token containment, never partial words ("Niger" does not match "Nigeria")
+        if not matches and not is_region:
+            matches = self._token_containment(normalized, kinds)
+
+        # 5. Fuzzy match for misspellings
+        if not matches and fuzzy and not is_region:
+            matches = self._fuzzy(normalized, kinds, threshold)
+            if matches:
+                logger.debug(f"Fuzzy-resolved '{text}' to {[self.entries[index].name for index in matches]}")
+
+        return [self.entries[index] for index in matches]
+
+    def resolve_codes(self, texts: Iterable[str], kinds: Iterable[str] = STATE_KINDS, fuzzy: bool = True) -> List[str]:
+        """UN M49 codes of the nodes matching any of texts, in first-match order"""
+        codes = []
+        for text in texts:
+            for entry in self.resolve(text, kinds, fuzzy):
+                if entry.code and entry.code not in codes:
+                    codes.append(entry.code)
+        return codes
+
+    def resolve_ids(self, texts: Iterable[str], kinds: Iterable[str], fuzzy: bool = True) -> List[str]:
+        """Node ids of the nodes matching any of texts, in first-match order"""
+        node_ids = []
+        for text in texts:
+            for entry in self.resolve(text, kinds, fuzzy):
+                if entry.node_id not in node_ids:
+                    node_ids.append(entry.node_id)
+        return node_ids
@@ -0,0 +1,104 @@
+# helpers/rulac_result_cache.py
+"""
+Versioned cache of RULAC conflict lookups.
+
+RULAC answers only change when the graph is reloaded, yet identical calls (e.g.
+countries=["Ukraine"], conflict_types=[]) used to query Neo4j every time. A
+RULACResultCache keeps the rendered RULAC_research maps of recent lookups, keyed by tool
+and canonicalized parameters, in an LRU scoped to a graph version token (see
+GRAPH_VERSION_QUERY in helpers/rulac_snapshot.py). Looking up or storing under a new
+version drops every entry of the previous one, so a graph refresh invalidates the cache
+without any explicit call.
+"""
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# Returned by RULACResultCache.get on a miss, since None (nothing found) is a cacheable answer
+MISSING = object()
+
+
+def make_result_cache_key(tool_name: str, query: str, params: Dict[str, Any]) -> str:
+    """
+    Canonical key of a conflict lookup: the tool, a hash of the Cypher query (which tells apart
+    statistics-only and code/CONTAINS variants) and the query parameters. The research_task
+    label is not part of the key. List values keep the caller's order, since the rendered
+    summaries list countries, regions and actors in that order.
+    """
+    canonical_params = {name: value for name, value in sorted(params.items()) if name != "research_task"}
+    query_hash = hashlib.sha1(query.encode("utf-8")).hexdigest()[:12]
+    return f"{tool_name}:{query_hash}:{json.dumps(canonical_params, sort_keys=True, default=str)}"
+
+
+class RULACResultCache:
+    """
+    LRU cache of RULAC_research maps for one graph version at a time.
+
+    Cached maps are shared between requests and must be treated as read-only. Memory use is
+    estimated from the JSON size of each entry when it is stored.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self.version: Optional[str] = None
+        self._entries: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _use_version(self, version: str):
+        """Drop all entries when the graph version changes"""
+        if version != self.version:
+            if self._entries:
+                self.invalidations += 1
+            self.clear()
+            self.version = version
+
+    def get(self, version: str, key: str) -> Any:
+        """Cached research map (possibly None) for key under this graph version, or MISSING"""
+        self._use_version(version)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return MISSING
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, version: str, key: str, value: Optional[Dict[str, Any]]):
+        """Store a research map, evicting the least recently used entries beyond max_entries"""
+        self._use_version(version)
+        if self.max_entries <= 0:
+            return
+        size = len(json.dumps(value, default=str))
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.bytes -= previous[1]
+        self._entries[key] = (value, size)
+        self.bytes += size
+        while len(self._entries) > self.max_entries:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.bytes -= evicted_size
+
+    def clear(self):
+        """Drop all cached results (counters are kept)"""
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Graph version, hit/miss counters, size and estimated memory use"""
+        lookups = self.hits + self.misses
+        return {
+            "version": self.version,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "invalidations": self.invalidations,
+        }
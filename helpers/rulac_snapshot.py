@@ -0,0 +1,356 @@
+# helpers/rulac_snapshot.py
+"""
+In-memory snapshot of the RULAC graph.
+
+The RULAC graph (state and non-state actors, conflicts, conflict types, countries,
+regions and organizations) is small and changes rarely, yet every conflict question used
+to run an apoc-heavy Cypher query against Neo4j. A RULACSnapshot loads the whole graph
+once with a handful of flat queries into compact records and indexes (actor code,
+region, conflict type, organization), and answers the four get_armed_conflict_data_by_*
+lookups in memory.
+
+The rows_by_* methods return the same flat conflict rows as the matching
+prompts/indv_tool_prompts/tool_cypher_RULAC_conflict_by_* query, which the tools render with
+helpers/rulac_formatter, so they can switch between the snapshot and Neo4j freely.
+Neo4j stays the source of truth: snapshots are rebuilt from it periodically.
+"""
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from helpers.rulac_resolver import NameResolver, COUNTRY, NON_STATE_ACTOR, STATE_ACTOR, STATE_KINDS
+from helpers.rulac_profiles import ConflictProfileStore
+
+logger = logging.getLogger("Argos")
+
+# // LOAD QUERIES //
+
+# Flat, apoc-free queries; the snapshot is assembled from their rows in Python
+CONFLICTS_QUERY = """
+MATCH (c:Conflict)
+OPTIONAL MATCH (c)-[:IS_CLASSIFIED_AS_CONFLICT_TYPE]->(ct:ConflictType)
+RETURN elementId(c) AS id, c.name AS name, c.overview AS overview, c.applicable_law AS applicable_law,
+       c.citation AS citation, [t IN collect(DISTINCT ct.type) WHERE t IS NOT NULL] AS types
+"""
+
+STATE_ACTORS_QUERY = """
+MATCH (sa:StateActor)
+OPTIONAL MATCH (sa)-[:IS_PARTY_TO_CONFLICT]->(c:Conflict)
+RETURN elementId(sa) AS id, sa.name AS name, sa.UN_M49Code AS code, sa.aliases AS aliases,
+       collect(DISTINCT elementId(c)) AS conflict_ids
+"""
+
+NON_STATE_ACTORS_QUERY = """
+MATCH (nsa:NonStateActor)
+OPTIONAL MATCH (nsa)-[:IS_PARTY_TO_CONFLICT]->(c:Conflict)
+RETURN elementId(nsa) AS id, nsa.name AS name, nsa.aliases AS aliases,
+       collect(DISTINCT elementId(c)) AS conflict_ids
+"""
+
+ORGANIZATIONS_QUERY = """
+MATCH (org:Organization)
+OPTIONAL MATCH (sa:StateActor)-[:IS_MEMBER]->(org)
+RETURN org.name AS name, collect(DISTINCT elementId(sa)) AS member_ids
+"""
+
+COUNTRIES_QUERY = """
+MATCH (co:Country)
+OPTIONAL MATCH (co)-[:BELONGS_TO]->(gr:GeoRegion)
+OPTIONAL MATCH (co)<-[:IS_TAKING_PLACE_IN_COUNTRY]-(c:Conflict)
+RETURN elementId(co) AS id, co.name AS name, co.UN_M49Code AS code,
+       collect(DISTINCT gr.name) AS regions, collect(DISTINCT elementId(c)) AS conflict_ids
+"""
+
+REGIONS_QUERY = """
+MATCH (gr:GeoRegion)
+RETURN gr.name AS name, gr.UN_M49Code AS code
+"""
+
+# Cheap fingerprint of the graph, polled to detect reloads: a version/checksum written by the import on
+# a GraphVersion node when there is one, plus node and relationship counts (answered from the count store)
+GRAPH_VERSION_QUERY = """
+CALL { MATCH (n) RETURN count(n) AS nodes }
+CALL { MATCH ()-[r]->() RETURN count(r) AS relationships }
+CALL { OPTIONAL MATCH (v:GraphVersion) RETURN max(v.version) AS version }
+RETURN nodes, relationships, version
+"""
+
+
+def graph_version_token(rows: List[Dict[str, Any]]) -> str:
+    """Version token of the graph from the GRAPH_VERSION_QUERY rows"""
+    row = rows[0] if rows else {}
+    token = f"n{row.get('nodes', 0)}-r{row.get('relationships', 0)}"
+    return f"{row['version']}-{token}" if row.get("version") is not None else token
+
+# // RECORDS //
+
+class ConflictRecord:
+    """A Conflict node with its classifications and parties"""
+    __slots__ = ("id", "name", "overview", "applicable_law", "citation", "types", "state_party_ids", "non_state_party_ids")
+
+    def __init__(self, id: str, name: Optional[str], overview: Optional[str], applicable_law: Optional[str], citation: Optional[str], types: Iterable[str]):
+        self.id = id
+        self.name = name
+        self.overview = overview
+        self.applicable_law = applicable_law
+        self.citation = citation
+        self.types = tuple(types)
+        self.state_party_ids: List[str] = []
+        self.non_state_party_ids: List[str] = []
+
+
+class ActorRecord:
+    """A StateActor or NonStateActor node with the conflicts it is a party to"""
+    __slots__ = ("id", "name", "code", "aliases", "conflict_ids", "search_names")
+
+    def __init__(self, id: str, name: Optional[str], code: Optional[str], aliases: Optional[Iterable[str]], conflict_ids: Iterable[str]):
+        self.id = id
+        self.name = name
+        self.code = code
+        self.aliases = tuple(alias for alias in (aliases or []) if alias)
+        self.conflict_ids = tuple(conflict_ids)
+        # Lower-cased name and aliases, matched with CONTAINS semantics like the Cypher queries
+        self.search_names = tuple(value.lower() for value in (name, *self.aliases) if value)
+
+
+class CountryRecord:
+    """A Country node with its regions and the conflicts taking place in it"""
+    __slots__ = ("id", "name", "code", "regions", "conflict_ids")
+
+    def __init__(self, id: str, name: Optional[str], code: Optional[str], regions: Iterable[str], conflict_ids: Iterable[str]):
+        self.id = id
+        self.name = name
+        self.code = code
+        self.regions = tuple(region for region in regions if region)
+        self.conflict_ids = tuple(conflict_ids)
+
+# // SNAPSHOT //
+
+class RULACSnapshot:
+    """
+    Indexed, read-only copy of the RULAC graph.
+
+    Build it with RULACSnapshot.load(run_query) from Neo4j, or RULACSnapshot(rows) from
+    already fetched rows. A snapshot is never mutated after construction; refreshing means
+    building a new one and swapping it in.
+    """
+
+    def __init__(self, rows: Dict[str, List[Dict[str, Any]]], version: Optional[str] = None):
+        self.loaded_at = time.time()
+        self.version = version or str(self.loaded_at)
+
+        self.conflicts: Dict[str, ConflictRecord] = {}
+        for row in rows.get("conflicts", []):
+            self.conflicts[row["id"]] = ConflictRecord(
+                row["id"], row.get("name"), row.get("overview"), row.get("applicable_law"), row.get("citation"), row.get("types") or []
+            )
+
+        self.state_actors: Dict[str, ActorRecord] = {}
+        for row in rows.get("state_actors", []):
+            self.state_actors[row["id"]] = self._actor(row)
+        self.non_state_actors: Dict[str, ActorRecord] = {}
+        for row in rows.get("non_state_actors", []):
+            self.non_state_actors[row["id"]] = self._actor(row)
+
+        # Conflict parties, in actor load order
+        for actor in self.state_actors.values():
+            for conflict_id in actor.conflict_ids:
+                self.conflicts[conflict_id].state_party_ids.append(actor.id)
+        for actor in self.non_state_actors.values():
+            for conflict_id in actor.conflict_ids:
+                self.conflicts[conflict_id].non_state_party_ids.append(actor.id)
+
+        self.countries: Dict[str, CountryRecord] = {}
+        for row in rows.get("countries", []):
+            self.countries[row["id"]] = CountryRecord(
+                row["id"], row.get("name"), row.get("code"), row.get("regions") or [],
+                [conflict_id for conflict_id in row.get("conflict_ids") or [] if conflict_id in self.conflicts]
+            )
+
+        # // INDEXES //
+        self.state_actors_by_code: Dict[str, str] = {
+            actor.code: actor.id for actor in self.state_actors.values() if actor.code
+        }
+        self.region_names = {row["name"] for row in rows.get("regions", []) if row.get("name")}
+        self.countries_by_region: Dict[str, List[str]] = {}
+        for country in self.countries.values():
+            for region in country.regions:
+                self.countries_by_region.setdefault(region, []).append(country.id)
+        self.conflicts_by_type: Dict[str, set] = {}
+        for conflict in self.conflicts.values():
+            for conflict_type in conflict.types:
+                self.conflicts_by_type.setdefault(conflict_type, set()).add(conflict.id)
+        self.organization_members: Dict[str, List[str]] = {
+            row["name"]: [member_id for member_id in row.get("member_ids") or [] if member_id in self.state_actors]
+            for row in rows.get("organizations", []) if row.get("name")
+        }
+
+        # Memo of CONTAINS matches per (actor kind, lower-cased target)
+        self._match_cache: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+        self._resolver: Optional[NameResolver] = None
+        # Conflict profiles rendered for this graph version
+        self.profiles = ConflictProfileStore(self.version)
+
+    def _actor(self, row: Dict[str, Any]) -> ActorRecord:
+        conflict_ids = [conflict_id for conflict_id in row.get("conflict_ids") or [] if conflict_id in self.conflicts]
+        return ActorRecord(row["id"], row.get("name"), row.get("code"), row.get("aliases"), conflict_ids)
+
+    @classmethod
+    async def load(cls, run_query: Callable[[str, dict], Awaitable[List[Dict[str, Any]]]]) -> "RULACSnapshot":
+        """
+        Load the whole RULAC graph from Neo4j.
+
+        Args:
+            run_query: Coroutine function (query, params) -> list of record dicts
+
+        Returns:
+            A new RULACSnapshot
+        """
+        start_time = time.time()
+        version = graph_version_token(await run_query(GRAPH_VERSION_QUERY, {}))
+        rows = {
+            "conflicts": await run_query(CONFLICTS_QUERY, {}),
+            "state_actors": await run_query(STATE_ACTORS_QUERY, {}),
+            "non_state_actors": await run_query(NON_STATE_ACTORS_QUERY, {}),
+            "organizations": await run_query(ORGANIZATIONS_QUERY, {}),
+            "countries": await run_query(COUNTRIES_QUERY, {}),
+            "regions": await run_query(REGIONS_QUERY, {}),
+        }
+        snapshot = cls(rows, version=version)
+        logger.info(
+            f"Loaded RULAC snapshot (graph version {version}) in {time.time() - start_time:.2f}s: {len(snapshot.conflicts)} conflicts, "
+            f"{len(snapshot.state_actors)} state actors, {len(snapshot.non_state_actors)} non-state actors, "
+            f"{len(snapshot.countries)} countries"
+        )
+        return snapshot
+
+    @property
+    def resolver(self) -> NameResolver:
+        """Name resolver over this snapshot's state actors, non-state actors and countries, built on first use"""
+        if self._resolver is None:
+            records = [(STATE_ACTOR, actor.id, actor.code, actor.name, actor.aliases) for actor in self.state_actors.values()]
+            records += [(NON_STATE_ACTOR, actor.id, None, actor.name, actor.aliases) for actor in self.non_state_actors.values()]
+            records += [(COUNTRY, country.id, country.code, country.name, None) for country in self.countries.values()]
+            self._resolver = NameResolver(records)
+        return self._resolver
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot size and age"""
+        return {
+            "version": self.version,
+            "age_seconds": time.time() - self.loaded_at,
+            "conflicts": len(self.conflicts),
+            "state_actors": len(self.state_actors),
+            "non_state_actors": len(self.non_state_actors),
+            "countries": len(self.countries),
+            "regions": len(self.region_names),
+            "organizations": len(self.organization_members),
+            "profiles": len(self.profiles),
+        }
+
+    # // MATCHING HELPERS //
+
+    def match_actors(self, kind: str, targets: List[str]) -> List[ActorRecord]:
+        """
+        Actors whose name or an alias contains any target, case-insensitively, in load order.
+
+        Keeps the Cypher CONTAINS semantics ("Niger" also matches "Nigeria"); each target's
+        scan over the small actor tables is memoized for the life of the snapshot.
+        """
+        actors = self.state_actors if kind == "state" else self.non_state_actors
+        matched = set()
+        for target in targets:
+            needle = str(target).lower()
+            key = (kind, needle)
+            if key not in self._match_cache:
+                self._match_cache[key] = tuple(
+                    actor.id for actor in actors.values() if any(needle in search_name for search_name in actor.search_names)
+                )
+            matched.update(self._match_cache[key])
+        return [actor for actor in actors.values() if actor.id in matched]
+
+    def resolve_state_actors(self, names: List[str]) -> List[ActorRecord]:
+        """State actors the resolver maps the names to, directly or through a Country with the same UN M49 code"""
+        matched = set()
+        for name in names:
+            for entry in self.resolver.resolve(name, STATE_KINDS):
+                if entry.kind == STATE_ACTOR:
+                    matched.add(entry.node_id)
+                elif entry.code in self.state_actors_by_code:
+                    matched.add(self.state_actors_by_code[entry.code])
+        return [actor for actor in self.state_actors.values() if actor.id in matched]
+
+    def _filter_conflicts(self, conflict_ids: Iterable[str], conflict_types: List[str]) -> List[str]:
+        """Conflicts (deduplicated, order kept) classified as any of conflict_types, or all if none"""
+        seen = set()
+        filtered = []
+        allowed = set().union(*(self.conflicts_by_type.get(t, set()) for t in conflict_types)) if conflict_types else None
+        for conflict_id in conflict_ids:
+            if conflict_id in seen or (allowed is not None and conflict_id not in allowed):
+                continue
+            seen.add(conflict_id)
+            filtered.append(conflict_id)
+        return filtered
+
+    def conflict_row(self, group: Optional[str], region: Optional[str], conflict_id: Optional[str]) -> Dict[str, Any]:
+        """One flat conflict row in the helpers/rulac_formatter layout"""
+        if conflict_id is None:
+            return {"group_name": group, "region_name": region, "conflict_id": None}
+        conflict = self.conflicts[conflict_id]
+        return {
+            "group_name": group,
+            "region_name": region,
+            "conflict_id": conflict.id,
+            "conflict_name": conflict.name,
+            "conflict_overview": conflict.overview,
+            "applicable_law": conflict.applicable_law,
+            "conflict_citation": conflict.citation,
+            "conflict_types": list(conflict.types),
+            "state_parties": [self.state_actors[actor_id].name for actor_id in conflict.state_party_ids],
+            "non_state_parties": [self.non_state_actors[actor_id].name for actor_id in conflict.non_state_party_ids],
+        }
+
+    def _group_rows(self, group: Optional[str], conflict_ids: List[str], region: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Rows of one group, or a single row without a conflict so the group still shows up, as with OPTIONAL MATCH"""
+        return [self.conflict_row(group, region, conflict_id) for conflict_id in conflict_ids or [None]]
+
+    # // ROWS //
+
+    def rows_by_country(self, countries: List[str], conflict_types: List[str]) -> List[Dict[str, Any]]:
+        """Rows of tool_cypher_RULAC_conflict_by_StateActor, with countries resolved by the name resolver"""
+        actors = list(self.state_actors.values()) if not countries else self.resolve_state_actors(countries)
+        return [
+            row for actor in actors
+            for row in self._group_rows(actor.name, self._filter_conflicts(actor.conflict_ids, conflict_types))
+        ]
+
+    def rows_by_non_state_actor(self, non_state_actors: List[str]) -> List[Dict[str, Any]]:
+        """Rows of tool_cypher_RULAC_conflict_by_NonStateActor"""
+        actors = self.match_actors("non_state", non_state_actors)
+        return [row for actor in actors for row in self._group_rows(actor.name, list(actor.conflict_ids))]
+
+    def rows_by_organization(self, organizations: List[str], conflict_types: List[str]) -> List[Dict[str, Any]]:
+        """Rows of tool_cypher_RULAC_conflict_by_org; no rows if no organization matched"""
+        matched_organizations = [name for name in self.organization_members if name in organizations]
+        if not matched_organizations:
+            return []
+        member_ids = list(dict.fromkeys(
+            member_id for name in matched_organizations for member_id in self.organization_members[name]
+        ))
+        if not member_ids:
+            return [self.conflict_row(None, None, None)]
+        return [
+            row for member_id in member_ids
+            for row in self._group_rows(
+                self.state_actors[member_id].name, self._filter_conflicts(self.state_actors[member_id].conflict_ids, conflict_types)
+            )
+        ]
+
+    def rows_by_region(self, regions: List[str], conflict_types: List[str]) -> List[Dict[str, Any]]:
+        """Rows of tool_cypher_RULAC_conflict_by_Region, one group per (country, region)"""
+        rows = []
+        for region in dict.fromkeys(region for region in regions if region in self.region_names):
+            for country_id in self.countries_by_region.get(region, []):
+                country = self.countries[country_id]
+                rows.extend(self._group_rows(country.name, self._filter_conflicts(country.conflict_ids, conflict_types), region))
+        return rows
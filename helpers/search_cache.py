@@ -0,0 +1,129 @@
+# helpers/search_cache.py
+"""
+Shared cache of Brave Search API responses.
+
+NEWS_tools, HRW_tools and BRAVE_tools each called the Brave API directly, and a single news
+request issues up to eight searches (web and news for each source). A SearchResponseCache
+keeps the decoded JSON responses of recent searches, keyed by endpoint and request
+parameters, with a TTL per endpoint: short for news searches, which go stale within minutes,
+long for Human Rights Watch World Report lookups, which change once a year.
+
+Concurrent identical searches are de-duplicated: the first caller sends the HTTP request and
+every other caller awaits the same in-flight call, so a burst of users asking about the same
+story costs one API call. Failed calls (exceptions or a None response) are not cached.
+
+All three tool modules share brave_search_cache. Cached responses are shared between
+callers and must be treated as read-only.
+"""
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger("Argos")
+
+# Seconds a Brave response is served from the cache, per endpoint label
+BRAVE_CACHE_TTLS = {
+    "news": 5 * 60,  # news search: new articles appear within minutes
+    "web": 15 * 60,  # web search used for recent news articles of a site
+    "summarizer": 30 * 60,  # web search summaries
+    "hrw_world_report": 24 * 3600,  # site:hrw.org/world-report lookups, published yearly
+}
+
+
+def make_search_cache_key(endpoint: str, params: Dict[str, Any]) -> str:
+    """Canonical key of a search: the endpoint label and its parameters, sorted"""
+    return endpoint + "\x1f" + json.dumps(params, sort_keys=True, default=str)
+
+
+class SearchResponseCache:
+    """
+    LRU cache of search responses with per-endpoint TTLs and in-flight de-duplication.
+
+    Args:
+        ttls: Seconds a response is kept, per endpoint label
+        default_ttl: Seconds for endpoints missing from ttls
+        max_entries: Responses kept before the least recently used are evicted
+    """
+
+    def __init__(self, ttls: Dict[str, float], default_ttl: float = 300, max_entries: int = 512):
+        self.ttls = ttls
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        # (event loop id, key) -> task of the HTTP call in flight
+        self._in_flight: Dict[Tuple[int, str], asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def fetch(self, endpoint: str, params: Dict[str, Any], load: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Cached response of a search, calling load() on a miss.
+
+        Args:
+            endpoint: Endpoint label selecting the TTL (e.g. "news", "web", "hrw_world_report")
+            params: Request parameters identifying the search (without credentials)
+            load: Coroutine function sending the request and returning the decoded response
+
+        Returns:
+            The response of load(); its exceptions propagate to every caller waiting on it
+        """
+        key = make_search_cache_key(endpoint, params)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                logger.debug(f"Search cache hit ({endpoint}): {params.get('q', '')}")
+                return entry[1]
+            del self._entries[key]
+
+        loop = asyncio.get_running_loop()
+        in_flight_key = (id(loop), key)
+        task = self._in_flight.get(in_flight_key)
+        if task is None:
+            self.misses += 1
+            task = loop.create_task(self._load(endpoint, key, load))
+            self._in_flight[in_flight_key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(in_flight_key, None))
+        else:
+            self.shared += 1
+            logger.debug(f"Joining in-flight search ({endpoint}): {params.get('q', '')}")
+        # Shielded, so one caller giving up does not cancel the call the others are waiting on
+        return await asyncio.shield(task)
+
+    async def _load(self, endpoint: str, key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+        response = await load()
+        ttl = self.ttls.get(endpoint, self.default_ttl)
+        if response is not None and ttl > 0 and self.max_entries > 0:
+            self._entries[key] = (time.monotonic() + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return response
+
+    def clear(self):
+        """Drop all cached responses (counters are kept)"""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit, miss and de-duplication counters and size"""
+        lookups = self.hits + self.misses + self.shared
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "shared": self.shared,
+            "hit_rate": (self.hits + self.shared) / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "in_flight": len(self._in_flight),
+        }
+
+
+# Brave responses shared by NEWS_tools, HRW_tools and BRAVE_tools
+brave_search_cache = SearchResponseCache(BRAVE_CACHE_TTLS)
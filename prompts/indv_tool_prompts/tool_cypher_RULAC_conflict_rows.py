@@ -0,0 +1,31 @@
+# Shared RETURN clause of the RULAC conflict queries: one flat row per (group, conflict), rendered
+# into summary text by helpers/rulac_formatter.py. Expects `group_name`, `region_name` and an optional `c:Conflict`
+# in scope; a group without matching conflicts returns a single row with a null conflict_id.
+CONFLICT_ROWS_RETURN = """
+RETURN group_name,
+       region_name,
+       elementId(c) AS conflict_id,
+       c.name AS conflict_name,
+       c.overview AS conflict_overview,
+       c.applicable_law AS applicable_law,
+       c.citation AS conflict_citation,
+       CASE WHEN c IS NULL THEN [] ELSE [(c)-[:IS_CLASSIFIED_AS_CONFLICT_TYPE]->(ct:ConflictType) | ct.type] END AS conflict_types,
+       CASE WHEN c IS NULL THEN [] ELSE [(p:StateActor)-[:IS_PARTY_TO_CONFLICT]->(c) | p.name] END AS state_parties,
+       CASE WHEN c IS NULL THEN [] ELSE [(p:NonStateActor)-[:IS_PARTY_TO_CONFLICT]->(c) | p.name] END AS non_state_parties
+"""
+
+# Aggregate RETURN clause for statistics-only lookups: one row per (group, conflict type) with the ids of the
+# group's conflicts of that type, and no conflict text or parties. Same scope as CONFLICT_ROWS_RETURN; a group
+# without matching conflicts returns a single row with a null conflict_type and no ids. Counted by
+# helpers/rulac_formatter.py, which needs the ids for distinct totals across groups sharing a conflict.
+CONFLICT_STATS_RETURN = """
+OPTIONAL MATCH (c)-[:IS_CLASSIFIED_AS_CONFLICT_TYPE]->(ct:ConflictType)
+RETURN group_name,
+       region_name,
+       ct.type AS conflict_type,
+       collect(DISTINCT elementId(c)) AS conflict_ids
+"""
+
+# Conflict type filter for `OPTIONAL MATCH (...)-(c:Conflict) WHERE ...`; keeps every conflict when no types are given
+CONFLICT_TYPE_FILTER = """size(target_conflict_types) = 0
+   OR EXISTS { MATCH (c)-[:IS_CLASSIFIED_AS_CONFLICT_TYPE]->(filter_ct:ConflictType) WHERE filter_ct.type IN target_conflict_types }"""
@@ -0,0 +1,78 @@
+# tests/benchmark_rulac_name_resolution.py
+
+# RUN from root against a live RULAC Neo4j database: python -m tests.benchmark_rulac_name_resolution
+# Not collected by pytest (no test_ prefix); compares the CONTAINS-scan StateActor query with the
+# resolver + UN M49 code lookup that replaced it
+
+import asyncio
+import statistics
+import time
+
+from tools.RULAC_tools import get_async_neo4j_driver, close_async_neo4j_drivers, ensure_rulac_indexes, run_rulac_query
+from helpers.rulac_resolver import NameResolver
+from helpers.rulac_formatter import render_by_country
+from prompts.indv_tool_prompts.tool_cypher_RULAC_conflict_by_StateActor import PROMPT, CONTAINS_PROMPT
+
+RUNS = 20
+
+SCENARIOS = [
+    ["France"],
+    ["United States of America"],
+    ["USA"],
+    ["Niger"],
+    ["France", "Russia"],
+    ["Ukriane"],
+]
+
+
+async def time_query(query, params):
+    """Median and p95 latency in milliseconds over RUNS executions, plus the last result"""
+    timings = []
+    result = None
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        result = await run_rulac_query(query, params)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.95) - 1], result
+
+
+def matched_actors(rows, countries):
+    research = render_by_country(rows, countries, [])
+    return research["summary"][:90] if research else ""
+
+
+async def main():
+    # Same index setup as production, awaited so the timings include the index
+    await ensure_rulac_indexes(get_async_neo4j_driver())
+
+    start = time.perf_counter()
+    resolver = await NameResolver.load(run_rulac_query)
+    print(f"Resolver built in {(time.perf_counter() - start) * 1000:.1f} ms ({len(resolver.entries)} names)\n")
+
+    # Warm up the connection pool and the query plans
+    await run_rulac_query(CONTAINS_PROMPT, {"countries": ["France"], "conflict_types": []})
+    await run_rulac_query(PROMPT, {"countries": ["France"], "state_actor_codes": ["250"], "conflict_types": []})
+
+    for countries in SCENARIOS:
+        start = time.perf_counter()
+        for _ in range(RUNS):
+            codes = resolver.resolve_codes(countries)
+        resolve_ms = (time.perf_counter() - start) * 1000 / RUNS
+
+        contains_median, contains_p95, contains_result = await time_query(
+            CONTAINS_PROMPT, {"countries": countries, "conflict_types": []}
+        )
+        codes_median, codes_p95, codes_result = await time_query(
+            PROMPT, {"countries": countries, "state_actor_codes": codes, "conflict_types": []}
+        )
+
+        print(f"{countries} -> codes {codes} (resolved in {resolve_ms:.3f} ms)")
+        print(f"  CONTAINS scan: median {contains_median:.1f} ms, p95 {contains_p95:.1f} ms | {matched_actors(contains_result, countries)}")
+        print(f"  Code lookup:   median {codes_median:.1f} ms, p95 {codes_p95:.1f} ms | {matched_actors(codes_result, countries)}")
+
+    await close_async_neo4j_drivers()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
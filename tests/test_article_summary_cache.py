@@ -0,0 +1,81 @@
+# tests/test_article_summary_cache.py
+
+# RUN from root: python -m pytest -s tests/test_article_summary_cache.py
+
+import time
+
+import pytest
+from helpers.article_summary_cache import ArticleSummaryCache, canonical_url, content_hash
+
+URL = "https://www.bbc.com/news/articles/c1"
+
+
+def summary(title, content="Summary text"):
+    return {"title": title, "date": "2025-03-01", "content": content, "original_content": "", "url": URL, "source": "BBC"}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ArticleSummaryCache(str(tmp_path / "summaries.sqlite3"), ttl_seconds=3600)
+    yield cache
+    cache.close()
+
+
+def test_canonical_url_drops_what_does_not_change_the_article():
+    assert canonical_url("HTTPS://WWW.BBC.com/news/articles/c1/?utm_source=x&b=2&a=1#top") == \
+        "https://www.bbc.com/news/articles/c1?a=1&b=2"
+    assert canonical_url("https://apnews.com/") == "https://apnews.com/"
+
+
+def test_content_hash_ignores_whitespace():
+    assert content_hash("Kyiv  talks\nresume") == content_hash("Kyiv talks resume")
+    assert content_hash("Kyiv talks resume") != content_hash("Kyiv talks stall")
+
+
+def test_latest_summary_of_a_url_is_served_within_the_ttl(cache):
+    assert cache.latest(URL) is None
+    cache.put(URL, content_hash("old text"), summary("Old"))
+    time.sleep(0.01)
+    cache.put(URL + "?utm_medium=social", content_hash("new text"), summary("New"))
+
+    assert cache.latest(URL)["title"] == "New"
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1 and stats["entries"] == 2
+
+
+def test_expired_summaries_are_only_reused_for_unchanged_text(cache):
+    cache.put(URL, content_hash("article text"), summary("Cached"))
+    cache.ttl_seconds = 0
+
+    assert cache.latest(URL) is None
+    assert cache.get(URL, content_hash("edited article text")) is None
+    assert cache.get(URL, content_hash("article  text"))["title"] == "Cached"
+
+
+def test_summaries_persist_across_instances(tmp_path):
+    path = str(tmp_path / "summaries.sqlite3")
+    first = ArticleSummaryCache(path)
+    first.put(URL, content_hash("article text"), summary("Persisted"))
+    first.close()
+
+    second = ArticleSummaryCache(path)
+    assert second.latest(URL)["title"] == "Persisted"
+    second.close()
+
+
+def test_least_recently_used_summaries_are_evicted_by_count_and_size(cache):
+    cache.max_entries = 2
+    for name in ["a", "b"]:
+        cache.put(f"{URL}{name}", content_hash(name), summary(name))
+        time.sleep(0.01)
+    cache.latest(f"{URL}a")
+    cache.put(f"{URL}c", content_hash("c"), summary("c"))
+
+    assert cache.latest(f"{URL}b") is None
+    assert cache.latest(f"{URL}a") and cache.latest(f"{URL}c")
+
+    cache.max_bytes = cache.stats()["bytes"] + 10
+    cache.put(f"{URL}d", content_hash("d"), summary("d", content="x" * 500))
+    stats = cache.stats()
+    assert stats["bytes"] <= cache.max_bytes
+    assert stats["evictions"] >= 2
@@ -0,0 +1,147 @@
+# tests/test_groq_scheduler.py
+
+# RUN from root: python -m pytest -s tests/test_groq_scheduler.py
+
+import asyncio
+import threading
+import time
+
+import pytest
+from helpers.groq_scheduler import (
+    GroqRateScheduler,
+    get_groq_scheduler,
+    clear_schedulers,
+    parse_duration,
+    record_rate_limit_headers,
+)
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("7.66s", 7.66),
+    ("2m59.56s", 179.56),
+    ("1h2m", 3720.0),
+    ("120ms", 0.12),
+    ("3", 3.0),
+    ("", None),
+    ("soon", None),
+])
+def test_parse_duration(value, expected):
+    assert parse_duration(value) == (pytest.approx(expected) if expected is not None else None)
+
+
+def test_calls_within_the_buckets_are_admitted_at_once():
+    scheduler = GroqRateScheduler(requests_per_minute=3, tokens_per_minute=10000)
+
+    async def run():
+        await asyncio.gather(*(scheduler.acquire(1000) for _ in range(3)))
+
+    asyncio.run(asyncio.wait_for(run(), timeout=1))
+    stats = scheduler.stats()
+    assert stats["admitted"] == 3 and stats["waited"] == 0
+    assert stats["available_tokens"] == pytest.approx(7000, abs=5)
+
+
+def test_queued_calls_are_admitted_in_arrival_order():
+    scheduler = GroqRateScheduler(requests_per_minute=1, tokens_per_minute=10000)
+    admitted = []
+
+    async def call(label):
+        await scheduler.acquire(100)
+        admitted.append(label)
+
+    async def run():
+        await call("first")
+        # The request bucket is empty: both calls queue
+        second = asyncio.create_task(call("second"))
+        third = asyncio.create_task(call("third"))
+        await asyncio.sleep(0)
+        assert scheduler.stats()["queued"] == 2
+        # Refill one request at a time
+        for _ in range(2):
+            scheduler.requests.level = 1
+            scheduler._dispatch(asyncio.get_running_loop())
+            await asyncio.sleep(0)
+        await asyncio.gather(second, third)
+
+    asyncio.run(asyncio.wait_for(run(), timeout=1))
+    assert admitted == ["first", "second", "third"]
+
+
+def test_response_headers_resize_the_token_bucket():
+    scheduler = GroqRateScheduler(requests_per_minute=30, tokens_per_minute=12000)
+    scheduler.record_headers({
+        "x-ratelimit-limit-requests": "14400",
+        "x-ratelimit-remaining-requests": "14399",
+        "x-ratelimit-limit-tokens": "300000",
+        "x-ratelimit-remaining-tokens": "5000",
+        "x-ratelimit-reset-tokens": "1s",
+    })
+    stats = scheduler.stats()
+    assert stats["tokens_per_minute"] == 300000
+    # Capped at what Groq reports is left, and refilled at the reported rate
+    assert 5000 <= stats["available_tokens"] < 5100
+    # The daily request limit does not raise the per-minute bucket
+    assert stats["requests_per_minute"] == 30
+
+
+def test_rate_limited_response_pauses_the_scheduler():
+    scheduler = GroqRateScheduler(requests_per_minute=30, tokens_per_minute=12000)
+    scheduler.record_headers({"retry-after": "0.2"}, status_code=429)
+
+    async def run():
+        start = time.monotonic()
+        await scheduler.acquire(100)
+        return time.monotonic() - start
+
+    waited = asyncio.run(asyncio.wait_for(run(), timeout=2))
+    assert waited >= 0.15
+    assert scheduler.stats()["throttled"] == 1
+
+
+def test_headers_reported_from_another_thread_wake_the_waiting_loop():
+    scheduler = GroqRateScheduler(requests_per_minute=30, tokens_per_minute=1000)
+
+    async def run():
+        await scheduler.acquire(1000)
+        waiting = asyncio.create_task(scheduler.acquire(1000))
+        await asyncio.sleep(0.01)
+        assert not waiting.done()
+        # A sync client call on a worker thread reports a much larger account limit
+        reporter = threading.Thread(target=scheduler.record_headers, args=({
+            "x-ratelimit-limit-tokens": "600000",
+            "x-ratelimit-remaining-tokens": "500000",
+        },))
+        reporter.start()
+        reporter.join()
+        await asyncio.wait_for(waiting, timeout=0.5)
+
+    asyncio.run(asyncio.wait_for(run(), timeout=2))
+    assert scheduler.stats()["admitted"] == 2
+
+
+def test_cancelled_waiter_lets_the_next_call_through():
+    scheduler = GroqRateScheduler(requests_per_minute=1, tokens_per_minute=10000)
+
+    async def run():
+        await scheduler.acquire(100)
+        stuck = asyncio.create_task(scheduler.acquire(100))
+        waiting = asyncio.create_task(scheduler.acquire(100))
+        await asyncio.sleep(0)
+        stuck.cancel()
+        scheduler.requests.level = 1
+        await asyncio.sleep(0)
+        await asyncio.wait_for(waiting, timeout=0.5)
+
+    asyncio.run(asyncio.wait_for(run(), timeout=1))
+    assert scheduler.stats()["admitted"] == 2
+
+
+def test_headers_reach_the_scheduler_of_their_key_and_model():
+    clear_schedulers()
+    scheduler = get_groq_scheduler("key", "llama-3.3-70b-versatile", tokens_per_minute=12000)
+    assert get_groq_scheduler("key", "llama-3.3-70b-versatile") is scheduler
+
+    record_rate_limit_headers("key", "llama-3.1-8b-instant", {"x-ratelimit-limit-tokens": "6000"})
+    record_rate_limit_headers("key", "llama-3.3-70b-versatile", {"x-ratelimit-limit-tokens": "300000"})
+    assert scheduler.stats()["tokens_per_minute"] == 300000
+    clear_schedulers()
@@ -0,0 +1,118 @@
+# tests/test_news_pipeline.py
+
+# RUN from root: python -m pytest -s tests/test_news_pipeline.py
+
+import asyncio
+
+import pytest
+from tools import NEWS_tools
+from tools.NEWS_tools import ArticleSummary, get_latest_news_from_source, iter_article_texts
+
+URLS = [f"https://www.bbc.com/news/articles/c{index}" for index in range(4)]
+
+
+def search_results():
+    # Oldest first, the order the pipeline keeps
+    return [
+        {"link": url, "title": f"Article {index}", "publication_date": f"2025-03-0{index + 1}"}
+        for index, url in enumerate(URLS)
+    ]
+
+
+@pytest.fixture
+def news_pipeline(monkeypatch):
+    """Search, LLM client and summary cache replaced; summaries record their call order"""
+    summarized = []
+
+    async def fake_search_results(query, number_of_results=1, search_type="web"):
+        return search_results() if search_type == "web" else []
+
+    async def fake_summarize(chat, title, date, content, source_name, url):
+        # Later articles are summarized faster, so summaries finish out of order
+        await asyncio.sleep(0.01 * (len(URLS) - URLS.index(url)))
+        summarized.append(url)
+        return ArticleSummary(title=title, date=date, content=f"Summary of {content}", url=url, source=source_name)
+
+    monkeypatch.setattr(NEWS_tools, "get_search_results", fake_search_results)
+    monkeypatch.setattr(NEWS_tools, "ChatGroq", lambda **kwargs: None)
+    monkeypatch.setattr(NEWS_tools, "get_article_summary_cache", lambda: None)
+    monkeypatch.setattr(NEWS_tools, "summarize_individual_article", fake_summarize)
+    monkeypatch.setitem(NEWS_tools.tool_specific_values, "SUMMARY_WORKERS", 2)
+    return summarized
+
+
+async def get_news(scrape_function):
+    return await asyncio.wait_for(get_latest_news_from_source(
+        search_query="Ukraine",
+        source_name="BBC",
+        source_url="www.bbc.com/news",
+        web_results_count=len(URLS),
+        news_results_count=0,
+        scrape_function=scrape_function,
+    ), timeout=2)
+
+
+def test_summaries_keep_the_search_order_when_finishing_out_of_order(news_pipeline):
+    async def scrape_newest_first(urls):
+        for index in reversed(range(len(urls))):
+            await asyncio.sleep(0)
+            yield index, f"text {index}"
+
+    response = asyncio.run(get_news(scrape_newest_first))
+    assert news_pipeline != URLS
+    assert [article.url for article in response.articles] == URLS
+    assert [article.content for article in response.articles] == [f"Summary of text {index}" for index in range(len(URLS))]
+    assert len(response.citations) == len(URLS)
+
+
+def test_failing_scrape_still_releases_every_worker(news_pipeline):
+    async def scrape_then_fail(urls):
+        yield 2, "text 2"
+        yield 0, ""
+        raise RuntimeError("connection reset")
+
+    # Without a stop marker per worker the gather would hang past the timeout
+    response = asyncio.run(get_news(scrape_then_fail))
+    assert [article.url for article in response.articles] == [URLS[2]]
+
+
+def test_scraped_articles_are_yielded_as_they_finish(monkeypatch):
+    delays = {URLS[0]: 0.05, URLS[1]: 0.01, URLS[2]: 0.03}
+
+    async def fake_scrape_article(url, source_name, find_article_content, clean_content):
+        await asyncio.sleep(delays[url])
+        return "" if url == URLS[2] else f"text of {url}"
+
+    monkeypatch.setattr(NEWS_tools, "scrape_article", fake_scrape_article)
+
+    async def run():
+        return [item async for item in iter_article_texts(URLS[:3], "BBC", None, None)]
+
+    assert asyncio.run(asyncio.wait_for(run(), timeout=1)) == [
+        (1, f"text of {URLS[1]}"), (2, ""), (0, f"text of {URLS[0]}"),
+    ]
+
+
+def test_stopping_early_cancels_the_remaining_scrapes(monkeypatch):
+    cancelled = []
+
+    async def fake_scrape_article(url, source_name, find_article_content, clean_content):
+        try:
+            await asyncio.sleep(0 if url == URLS[0] else 10)
+        except asyncio.CancelledError:
+            cancelled.append(url)
+            raise
+        return f"text of {url}"
+
+    monkeypatch.setattr(NEWS_tools, "scrape_article", fake_scrape_article)
+
+    async def run():
+        articles = iter_article_texts(URLS, "BBC", None, None)
+        async for index, text in articles:
+            break
+        await articles.aclose()
+        await asyncio.sleep(0)
+        return index
+
+    assert asyncio.run(asyncio.wait_for(run(), timeout=1)) == 0
+    assert sorted(cancelled) == URLS[1:]
@@ -0,0 +1,438 @@
+# tests/test_rulac_snapshot.py
+
+# RUN from root: python -m pytest -s tests/test_rulac_snapshot.py
+
+import asyncio
+
+import pytest
+from agents.gazetteer import COUNTRIES, COUNTRY_ALIASES
+from helpers.rulac_snapshot import RULACSnapshot, CONFLICTS_QUERY, STATE_ACTORS_QUERY, GRAPH_VERSION_QUERY, graph_version_token
+from helpers.rulac_resolver import NameResolver, NAMES_QUERY, NON_STATE_ACTOR, STATE_ACTOR
+from helpers.rulac_formatter import (
+    render_by_country, render_by_non_state_actor, render_by_organization, render_by_region, render_statistics, statistics_rows
+)
+from helpers.rulac_profiles import elision_note, fit_profiles_to_budget, merge_rulac_sections
+from helpers.rulac_batch import RULACQueryBatch, current_rulac_batch, use_rulac_batch
+from helpers.rulac_result_cache import MISSING, RULACResultCache, make_result_cache_key
+
+IAC = "International Armed Conflict (IAC)"
+NIAC = "Non-International Armed Conflict (NIAC)"
+OCCUPATION = "Military Occupation"
+
+ROWS = {
+    "conflicts": [
+        {"id": "c1", "name": "International armed conflict between Russia and Ukraine", "overview": "Overview 1",
+         "applicable_law": "Law 1", "citation": "https://www.rulac.org/c1", "types": [IAC]},
+        {"id": "c2", "name": "Military occupation of Ukraine by Russia", "overview": None,
+         "applicable_law": None, "citation": "https://www.rulac.org/c2", "types": [OCCUPATION]},
+        {"id": "c3", "name": "Non-international armed conflict in Nigeria", "overview": "Overview 3",
+         "applicable_law": "Law 3", "citation": "https://www.rulac.org/c3", "types": [NIAC]},
+    ],
+    "state_actors": [
+        {"id": "ru", "name": "Russia", "code": "643", "aliases": ["Russian Federation"], "conflict_ids": ["c1", "c2"]},
+        {"id": "ua", "name": "Ukraine", "code": "804", "aliases": None, "conflict_ids": ["c1"]},
+        {"id": "ng", "name": "Nigeria", "code": "566", "aliases": None, "conflict_ids": ["c3"]},
+        {"id": "ne", "name": "Niger", "code": "562", "aliases": None, "conflict_ids": []},
+    ],
+    "non_state_actors": [
+        {"id": "bh", "name": "Boko Haram", "aliases": ["Jama'atu Ahlis Sunna Lidda'awati wal-Jihad"], "conflict_ids": ["c3"]},
+    ],
+    "organizations": [
+        {"name": "BRICS", "member_ids": ["ru"]},
+        {"name": "African Union", "member_ids": ["ng", "ne"]},
+    ],
+    "countries": [
+        {"id": "co_ua", "name": "Ukraine", "code": "804", "regions": ["Eastern Europe", "Europe"], "conflict_ids": ["c1", "c2"]},
+        {"id": "co_ru", "name": "Russia", "code": "643", "regions": ["Eastern Europe", "Europe"], "conflict_ids": []},
+        {"id": "co_ng", "name": "Nigeria", "code": "566", "regions": ["Western Africa", "Africa"], "conflict_ids": ["c3"]},
+    ],
+    "regions": [{"name": name, "code": None} for name in ["Europe", "Eastern Europe", "Africa", "Western Africa"]],
+}
+
+
+def query_by_country(snapshot, countries, conflict_types):
+    return render_by_country(snapshot.rows_by_country(countries, conflict_types), countries, conflict_types)
+
+
+def query_by_non_state_actor(snapshot, non_state_actors):
+    return render_by_non_state_actor(snapshot.rows_by_non_state_actor(non_state_actors), non_state_actors)
+
+
+def query_by_organization(snapshot, organizations, conflict_types):
+    return render_by_organization(snapshot.rows_by_organization(organizations, conflict_types), organizations, conflict_types)
+
+
+def query_by_region(snapshot, regions, conflict_types):
+    return render_by_region(snapshot.rows_by_region(regions, conflict_types), regions, conflict_types)
+
+
+@pytest.fixture
+def snapshot():
+    return RULACSnapshot(ROWS)
+
+
+def conflict_names(research):
+    return [detail["conflict_name"] for detail in research["conflict_details"]]
+
+
+def test_query_by_country_matches_cypher_summary(snapshot):
+    research = query_by_country(snapshot, ["Russian Federation"], [])
+    assert research["summary"] == (
+        "According to RULAC, Russia is involved as a state actor to 2 armed conflicts: "
+        "International armed conflict between Russia and Ukraine, Military occupation of Ukraine by Russia."
+    )
+    occupation = research["conflict_details"][1]
+    assert occupation["conflict_classification"] == OCCUPATION
+    assert occupation["conflict_overview"] == "No Overview Available"
+    assert occupation["applicable_ihl_law"] == "Not Specified"
+    assert research["conflict_details"][0]["state_parties"] == "Russia, Ukraine"
+    assert research["conflict_details"][0]["non_state_parties"] == "No non-state actors recorded"
+
+
+def test_query_by_country_filters_conflict_types_and_resolves_whole_names(snapshot):
+    research = query_by_country(snapshot, ["Russia"], [IAC])
+    assert conflict_names(research) == ["International armed conflict between Russia and Ukraine"]
+    assert 'classified as "International Armed Conflict (IAC)"' in research["summary"]
+
+    # Countries are resolved by whole names, so "Niger" no longer matches Nigeria
+    research = query_by_country(snapshot, ["Niger"], [])
+    assert research["summary"] == "According to RULAC, Niger is involved as a state actor to 0 armed conflicts."
+
+    assert query_by_country(snapshot, ["Atlantis"], []) is None
+
+
+def test_query_by_non_state_actor(snapshot):
+    research = query_by_non_state_actor(snapshot, ["Boko Haram", "JAS"])
+    assert research["summary"].startswith("According to RULAC, there are currently 1 total distinct armed conflict(s) involving Boko Haram, JAS")
+    assert research["conflict_details"][0]["non_state_parties"] == "Boko Haram"
+
+    research = query_by_non_state_actor(snapshot, ["Unknown group"])
+    assert research["summary"] == "According to RULAC, there are currently no recorded armed conflicts involving Unknown group."
+    assert research["conflict_details"] == []
+
+
+def test_query_by_organization(snapshot):
+    research = query_by_organization(snapshot, ["African Union"], [])
+    assert "Breakdown by state actor: Nigeria is a state actor to 1 distinct armed conflict(s)" in research["summary"]
+    assert conflict_names(research) == ["Non-international armed conflict in Nigeria"]
+    assert query_by_organization(snapshot, ["OPEC"], []) is None
+
+
+def test_query_by_region(snapshot):
+    research = query_by_region(snapshot, ["Eastern Europe", "Western Africa"], [])
+    assert "2 total distinct conflicts are currently taking place in Eastern Europe region" in research["summary"]
+    assert "Eastern Europe has the most recorded conflicts." in research["summary"]
+    assert "No recorded conflicts in Russia (Eastern Europe)" in research["summary"]
+    assert len(research["conflict_details"]) == 3
+
+    research = query_by_region(snapshot, ["Europe"], [OCCUPATION])
+    assert conflict_names(research) == ["Military occupation of Ukraine by Russia"]
+    assert query_by_region(snapshot, ["Atlantis"], []) is None
+
+
+def test_load_assembles_snapshot_from_queries():
+    queries = {
+        CONFLICTS_QUERY: ROWS["conflicts"],
+        STATE_ACTORS_QUERY: ROWS["state_actors"],
+        GRAPH_VERSION_QUERY: [{"nodes": 120, "relationships": 300, "version": None}],
+    }
+
+    async def run_query(query, params):
+        return queries.get(query, [])
+
+    snapshot = asyncio.run(RULACSnapshot.load(run_query))
+    assert snapshot.stats()["conflicts"] == 3
+    assert snapshot.state_actors_by_code["804"] == "ua"
+    assert snapshot.conflicts["c1"].state_party_ids == ["ru", "ua"]
+    assert snapshot.version == snapshot.profiles.version == "n120-r300"
+
+
+def test_rows_are_flat_and_render_like_the_lookups(snapshot):
+    rows = snapshot.rows_by_country(["Russia", "Niger"], [])
+    assert [(row["group_name"], row["conflict_id"]) for row in rows] == [("Russia", "c1"), ("Russia", "c2"), ("Niger", None)]
+    assert rows[0]["state_parties"] == ["Russia", "Ukraine"]
+    assert render_by_country(rows, ["Russia", "Niger"], []) == query_by_country(snapshot, ["Russia", "Niger"], [])
+
+
+def test_formatter_handles_neo4j_rows():
+    # Neo4j returns one row per (group, conflict) in any order, with duplicates and nulls for empty lists
+    conflict = {"conflict_id": "c3", "conflict_name": "Non-international armed conflict in Nigeria", "conflict_overview": None,
+                "applicable_law": None, "conflict_citation": None, "conflict_types": [NIAC, IAC],
+                "state_parties": ["Nigeria", "Nigeria"], "non_state_parties": None}
+    rows = [
+        {"group_name": "Niger", "region_name": None, "conflict_id": None},
+        {"group_name": "Nigeria", "region_name": None, **conflict},
+        {"group_name": "Nigeria", "region_name": None, **conflict},
+    ]
+    research = render_by_country(rows, ["Nigeria", "Niger"], [IAC])
+    assert research["summary"] == (
+        'According to RULAC, Nigeria is involved as a state actor to 1 armed conflict classified as "International Armed Conflict (IAC)": '
+        'Non-international armed conflict in Nigeria. Niger is involved as a state actor to 0 armed conflicts classified as '
+        '"International Armed Conflict (IAC)".'
+    )
+    detail = research["conflict_details"][0]
+    assert detail["conflict_classification"] == IAC
+    assert detail["state_parties"] == "Nigeria"
+    assert detail["non_state_parties"] == "No non-state actors recorded"
+
+    # An organization without members still answers, an unknown organization does not
+    assert "no recorded armed conflicts" in render_by_organization([{"group_name": None, "conflict_id": None}], ["G7"], [])["summary"]
+    assert render_by_organization([], ["OPEC"], []) is None
+
+
+@pytest.mark.parametrize("text, expected_codes", [
+    ("Ukraine", ["804"]),
+    ("russian federation", ["643"]),  # Alias, case-insensitive
+    ("Russia", ["643"]),
+    ("804", ["804"]),  # UN M49 code
+    ("Niger", ["562"]),  # Whole names only, not Nigeria
+    ("Ukriane", ["804"]),  # Trigram fuzzy match
+    ("Atlantis", []),
+])
+def test_resolver_maps_names_to_codes(snapshot, text, expected_codes):
+    assert snapshot.resolver.resolve_codes([text]) == expected_codes
+
+
+def test_resolver_kinds_token_containment_and_fuzzy_switch(snapshot):
+    resolver = snapshot.resolver
+    assert [entry.name for entry in resolver.resolve("Boko Haram", [NON_STATE_ACTOR])] == ["Boko Haram"]
+    assert resolver.resolve("Boko Haram", [STATE_ACTOR]) == []
+    # Whole-token containment: a partial name matches the longer node name
+    assert resolver.resolve_ids(["Jihad"], [NON_STATE_ACTOR]) == ["bh"]
+    assert resolver.resolve_codes(["Ukriane"], fuzzy=False) == []
+
+
+@pytest.mark.parametrize("text, expected_names", [
+    ("Somaliland", []),  # Not a fuzzy match for the shorter Somalia
+    ("Africa", []),  # Region names do not match the states containing them
+    ("Americas", []),
+    ("Asia", []),
+    ("Ukriane", ["Ukraine"]),
+    ("Afghanstan", ["Afghanistan"]),
+    ("Korea", ["Democratic People's Republic of Korea", "Republic of Korea"]),  # Whole-token containment
+])
+def test_resolver_does_not_map_other_places_to_states(text, expected_names):
+    resolver = NameResolver((STATE_ACTOR, name, None, name, COUNTRY_ALIASES.get(name)) for name in COUNTRIES)
+    assert sorted(entry.name for entry in resolver.resolve(text)) == expected_names
+
+
+def test_resolver_load_from_names_query():
+    rows = [
+        {"id": "n1", "labels": ["StateActor", "Country"], "name": "Ukraine", "code": "804", "aliases": None},
+        {"id": "n2", "labels": ["NonStateActor"], "name": "Hezbollah", "code": None, "aliases": ["Hizbullah"]},
+    ]
+
+    async def run_query(query, params):
+        assert query == NAMES_QUERY
+        return rows
+
+    resolver = asyncio.run(NameResolver.load(run_query))
+    assert len(resolver.entries) == 3
+    assert resolver.resolve_ids(["hizbullah"], [NON_STATE_ACTOR]) == ["n2"]
+
+
+def test_conflict_profiles_are_rendered_once_per_snapshot(snapshot):
+    details = query_by_country(snapshot, ["Russia"], [])["conflict_details"]
+    profile = snapshot.profiles.get(details[0])
+    assert profile.conflict_id == "c1"
+    assert profile.prompt_block.startswith("##### Conflict Name: International armed conflict between Russia and Ukraine\n")
+    assert "State Parties: Russia, Ukraine" in profile.prompt_block
+    assert profile.citation == {
+        "title": "RULAC - International armed conflict between Russia and Ukraine",
+        "url": "https://www.rulac.org/c1",
+        "formatted_content": profile.citation["formatted_content"],
+    }
+    assert "\n\nOverview: Overview 1\n\n" in profile.citation["formatted_content"]
+
+    # The same conflict from another tool reuses the profile; a new snapshot starts empty
+    same_conflict = query_by_region(snapshot, ["Eastern Europe"], [])["conflict_details"][0]
+    assert snapshot.profiles.get(same_conflict) is profile
+    assert snapshot.profiles.stats()["hits"] == 1
+    assert len(RULACSnapshot(ROWS).profiles) == 0
+
+
+def test_profiles_are_fit_to_the_token_budget_by_relevance(snapshot):
+    details = query_by_region(snapshot, ["Eastern Europe", "Western Africa"], [])["conflict_details"]
+    profiles = [snapshot.profiles.get(detail) for detail in details]
+    total_tokens = sum(profile.tokens for profile in profiles)
+
+    # Everything fits, or no budget: all profiles in full, in lookup order
+    assert fit_profiles_to_budget(profiles, total_tokens, "Boko Haram") == (profiles, [])
+    assert fit_profiles_to_budget(profiles, None, "Boko Haram") == (profiles, [])
+
+    # The conflict involving the group named in the question is kept in full
+    full, condensed = fit_profiles_to_budget(profiles, profiles[2].tokens, "Where is Boko Haram fighting?")
+    assert [profile.conflict_id for profile in full] == ["c3"]
+    assert [profile.conflict_id for profile in condensed] == ["c1", "c2"]
+    assert condensed[0].one_line == (
+        "- International armed conflict between Russia and Ukraine (International Armed Conflict (IAC)); "
+        "state parties: Russia, Ukraine; non-state parties: No non-state actors recorded"
+    )
+
+    # Without a relevant profile, the first one is still shown in full even over budget
+    full, condensed = fit_profiles_to_budget(profiles, 1, "Which conflicts are there?")
+    assert [profile.conflict_id for profile in full] == ["c1"]
+    assert len(condensed) == 2
+
+
+def rulac_output(snapshot, research_task, research, token_budget=None, query=None):
+    """A conflict tool output as built by process_rulac_data, from a rendered lookup"""
+    profiles = [snapshot.profiles.get(detail) for detail in research["conflict_details"]]
+    full, condensed = fit_profiles_to_budget(profiles, token_budget, query)
+    note = elision_note(condensed, len(profiles), token_budget) if condensed else None
+    summary = f"### {research_task}\n\n{research['summary']}"
+    blocks = [profile.prompt_block for profile in full] + [profile.one_line for profile in condensed] + ([note] if note else [])
+    return {
+        "content": f"{summary}\n\n#### Conflict profiles\n\n" + "\n\n".join(blocks),
+        "rulac_research": {"summary": summary, "conflict_profiles": full, "condensed_profiles": condensed,
+                           "elision_note": note, "token_budget": token_budget},
+    }
+
+
+def test_merge_lists_each_shared_conflict_profile_once(snapshot):
+    query = "Where is Boko Haram fighting?"
+    regions = query_by_region(snapshot, ["Eastern Europe", "Western Africa"], [])
+    budget = snapshot.profiles.get(regions["conflict_details"][2]).tokens
+    region_output = rulac_output(snapshot, "Conflicts by region", regions, budget, query)
+    assert "2 of 3 conflict profiles" in region_output["rulac_research"]["elision_note"]
+    methodology = {"content": "RULAC classification methodology"}
+
+    # Outputs without shared conflicts are passed through unchanged
+    assert merge_rulac_sections([region_output, methodology]) == [region_output["content"], methodology["content"]]
+
+    # The country lookup shows c1 and c2 in full, so they are promoted out of the region's one-line list
+    country_output = rulac_output(snapshot, "Conflicts by country", query_by_country(snapshot, ["Russia"], []))
+    sections = merge_rulac_sections([country_output, region_output, methodology])
+    assert len(sections) == 4
+    assert sections[0] == (
+        country_output["rulac_research"]["summary"] + "\n\nConflict profiles (see Shared conflict profiles below): "
+        "International armed conflict between Russia and Ukraine; Military occupation of Ukraine by Russia"
+    )
+    assert sections[1].startswith(region_output["rulac_research"]["summary"] + "\n\nConflict profiles (see Shared")
+    assert sections[2] == methodology["content"]
+    shared = sections[3]
+    assert shared.startswith("### Shared conflict profiles\n\n")
+    assert shared.count("##### Conflict Name:") == 3
+    assert "one line each" not in shared and "shortened" not in shared
+
+    # Profiles both tools condensed are listed once, and the note counts the merged profiles
+    country_output = rulac_output(snapshot, "Conflicts by country", query_by_country(snapshot, ["Russia"], []), 1, query)
+    shared = merge_rulac_sections([country_output, region_output])[-1]
+    assert shared.count("##### Conflict Name:") == 2
+    assert shared.count("- Military occupation of Ukraine by Russia") == 1
+    assert "_1 of 3 conflict profiles were shortened to one line" in shared
+    assert "2 of 3" not in shared
+
+
+def test_statistics_count_distinct_conflicts_per_group_and_region(snapshot):
+    rows = statistics_rows(snapshot.rows_by_region(["Eastern Europe", "Western Africa"], []))
+    assert {"group_name": "Ukraine", "region_name": "Eastern Europe", "conflict_type": OCCUPATION, "conflict_ids": ["c2"]} in rows
+    assert {"group_name": "Russia", "region_name": "Eastern Europe", "conflict_type": None, "conflict_ids": []} in rows
+
+    research = render_statistics(rows, "country", [])
+    assert research["conflict_details"] == []
+    lines = research["summary"].split("\n")
+    assert lines[2] == f"| Country | Region | Conflicts | {IAC} | {NIAC} | {OCCUPATION} |"
+    assert "| Ukraine | Eastern Europe | 2 | 1 | 0 | 1 |" in lines
+    assert "| **Total** | Western Africa | 1 | 0 | 1 | 0 |" in lines
+    assert lines[-1] == "| **Total (distinct)** |  | 3 | 1 | 1 | 1 |"
+
+    # Russia and Ukraine share the IAC, so it is counted once in the total
+    research = render_statistics(statistics_rows(snapshot.rows_by_country(["Russia", "Ukraine"], [IAC])), "state actor", [IAC])
+    assert research["summary"].endswith(f"| State actor | Conflicts | {IAC} |\n|---|---|---|\n| Russia | 1 | 1 |\n| Ukraine | 1 | 1 |\n| **Total (distinct)** | 1 | 1 |")
+    assert render_statistics([], "state actor", []) is None
+
+
+def test_batch_runs_the_queries_of_a_plan_in_one_transaction():
+    transactions = []
+
+    async def run_statements(statements):
+        transactions.append([query for query, _ in statements])
+        return [[{"query": query, **params}] for query, params in statements]
+
+    async def run_query(query, params):
+        transactions.append([query])
+        return [{"query": query, **params}]
+
+    async def tool(query, params):
+        # Tools only see the batch through their context, like query_rulac_research
+        batch = current_rulac_batch.get()
+        if query is None:
+            batch.skip()
+            return None
+        return await batch.run(query, params)
+
+    async def plan():
+        batch = RULACQueryBatch(run_statements, run_query, expected=4, window=5)
+        with use_rulac_batch(batch):
+            tasks = [
+                asyncio.create_task(tool("by_country", {"countries": ["Sudan"]})),
+                asyncio.create_task(tool("by_region", {"regions": ["Eastern Africa"]})),
+                asyncio.create_task(tool("by_country", {"countries": ["Sudan"]})),
+                asyncio.create_task(tool(None, None)),  # Answered from the snapshot
+            ]
+        assert current_rulac_batch.get() is None
+        return await asyncio.gather(*tasks), batch.stats()
+
+    results, stats = asyncio.run(plan())
+    # Flushed as soon as all four tools reported, without waiting for the window; the duplicate query runs once
+    assert transactions == [["by_country", "by_region"]]
+    assert results[0] == results[2] == [{"query": "by_country", "countries": ["Sudan"]}]
+    assert results[1] == [{"query": "by_region", "regions": ["Eastern Africa"]}]
+    assert stats == {"requests": 3, "statements": 2, "transactions": 1}
+
+
+def test_batch_falls_back_to_separate_queries_when_the_transaction_fails():
+    async def run_statements(statements):
+        raise RuntimeError("statement 2 failed")
+
+    async def run_query(query, params):
+        if query == "bad":
+            raise ValueError("bad query")
+        return [{"query": query}]
+
+    async def plan():
+        batch = RULACQueryBatch(run_statements, run_query, expected=3, window=0.01)
+        # Only two of the three expected tools report: the window flushes the batch
+        return await asyncio.gather(batch.run("good", {}), batch.run("bad", {}), return_exceptions=True), batch.stats()
+
+    (good, bad), stats = asyncio.run(plan())
+    assert good == [{"query": "good"}]
+    assert isinstance(bad, ValueError)
+    assert stats["transactions"] == 2
+
+
+def test_result_cache_is_scoped_to_the_graph_version():
+    cache = RULACResultCache(max_entries=2)
+    key = make_result_cache_key("get_armed_conflict_data_by_country", "QUERY", {
+        "countries": ["Ukraine", "Russia"], "conflict_types": [], "research_task": "RULAC armed conflict data by country (Ukraine, Russia)",
+    })
+    # The research task label does not matter; the query variant and the list order (shown in the summary) do
+    assert key == make_result_cache_key("get_armed_conflict_data_by_country", "QUERY", {"conflict_types": [], "countries": ["Ukraine", "Russia"]})
+    assert key != make_result_cache_key("get_armed_conflict_data_by_country", "QUERY", {"countries": ["Russia", "Ukraine"], "conflict_types": []})
+    assert key != make_result_cache_key("get_armed_conflict_data_by_country", "STATS_QUERY", {"countries": ["Russia", "Ukraine"], "conflict_types": []})
+
+    research = {"summary": "According to RULAC, ...", "conflict_details": []}
+    assert cache.get("v1", key) is MISSING
+    cache.put("v1", key, research)
+    cache.put("v1", "unknown", None)  # "Nothing found" answers are cached too
+    assert cache.get("v1", "unknown") is None
+    assert cache.get("v1", key) is research
+    assert cache.stats()["bytes"] > 0
+
+    # Least recently used entries are evicted
+    cache.put("v1", "third", research)
+    assert cache.get("v1", key) is research
+    assert cache.get("v1", "unknown") is MISSING
+
+    # A new graph version invalidates everything
+    assert cache.get("v2", key) is MISSING
+    stats = cache.stats()
+    assert (stats["version"], stats["entries"], stats["bytes"], stats["invalidations"]) == ("v2", 0, 0, 1)
+    assert stats["hits"] == 3 and stats["hit_rate"] == 0.5
+
+
+def test_graph_version_token():
+    assert graph_version_token([{"nodes": 10, "relationships": 20, "version": None}]) == "n10-r20"
+    assert graph_version_token([{"nodes": 10, "relationships": 20, "version": "2025-06-01"}]) == "2025-06-01-n10-r20"
+    assert graph_version_token([]) == "n0-r0"
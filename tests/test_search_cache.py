@@ -0,0 +1,110 @@
+# tests/test_search_cache.py
+
+# RUN from root: python -m pytest -s tests/test_search_cache.py
+
+import asyncio
+
+import pytest
+from helpers.search_cache import SearchResponseCache, make_search_cache_key
+
+
+class FakeSearchAPI:
+    """Counts calls and answers after a short delay"""
+
+    def __init__(self, response=None, error=None, delay=0.01):
+        self.calls = 0
+        self.response = response if response is not None else {"web": {"results": [{"url": "https://www.hrw.org/world-report/2025"}]}}
+        self.error = error
+        self.delay = delay
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.response
+
+
+def test_cache_key_ignores_parameter_order():
+    assert make_search_cache_key("news", {"q": "Ukraine", "count": 2}) == make_search_cache_key("news", {"count": 2, "q": "Ukraine"})
+    assert make_search_cache_key("news", {"q": "Ukraine"}) != make_search_cache_key("web", {"q": "Ukraine"})
+
+
+def test_repeated_searches_are_served_from_the_cache():
+    cache = SearchResponseCache({"web": 60})
+    api = FakeSearchAPI()
+
+    async def run():
+        first = await cache.fetch("web", {"q": "Ukraine"}, api)
+        second = await cache.fetch("web", {"q": "Ukraine"}, api)
+        await cache.fetch("web", {"q": "Sudan"}, api)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first is second
+    assert api.calls == 2
+    assert cache.stats()["hits"] == 1
+
+
+def test_ttl_is_chosen_per_endpoint():
+    cache = SearchResponseCache({"news": 0.05, "hrw_world_report": 3600})
+    news, report = FakeSearchAPI(), FakeSearchAPI()
+
+    async def run():
+        await cache.fetch("news", {"q": "Gaza"}, news)
+        await cache.fetch("hrw_world_report", {"q": "Gaza"}, report)
+        await asyncio.sleep(0.1)
+        await cache.fetch("news", {"q": "Gaza"}, news)
+        await cache.fetch("hrw_world_report", {"q": "Gaza"}, report)
+
+    asyncio.run(run())
+    assert news.calls == 2
+    assert report.calls == 1
+
+
+def test_concurrent_identical_searches_share_one_call():
+    cache = SearchResponseCache({"news": 60})
+    api = FakeSearchAPI(delay=0.05)
+
+    async def run():
+        return await asyncio.gather(*(cache.fetch("news", {"q": "Ukraine ceasefire"}, api) for _ in range(5)))
+
+    responses = asyncio.run(run())
+    assert api.calls == 1
+    assert all(response is responses[0] for response in responses)
+    stats = cache.stats()
+    assert stats["misses"] == 1 and stats["shared"] == 4 and stats["in_flight"] == 0
+
+
+def test_failed_searches_are_not_cached():
+    cache = SearchResponseCache({"web": 60})
+    failing = FakeSearchAPI(error=RuntimeError("429 Too Many Requests"))
+
+    async def empty():
+        return None
+
+    async def run():
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await cache.fetch("web", {"q": "Ukraine"}, failing)
+        assert await cache.fetch("summarizer", {"q": "Ukraine"}, empty) is None
+
+    asyncio.run(run())
+    assert failing.calls == 2
+    assert len(cache) == 0
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_call():
+    cache = SearchResponseCache({"news": 60})
+    api = FakeSearchAPI(delay=0.05)
+
+    async def run():
+        impatient = asyncio.create_task(cache.fetch("news", {"q": "Sudan"}, api))
+        patient = asyncio.create_task(cache.fetch("news", {"q": "Sudan"}, api))
+        await asyncio.sleep(0.01)
+        impatient.cancel()
+        return await patient
+
+    assert asyncio.run(run()) == api.response
+    assert api.calls == 1
+    assert len(cache) == 1
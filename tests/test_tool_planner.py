@@ -0,0 +1,179 @@
+# tests/test_tool_planner.py
+
+# RUN from root: python -m pytest -s tests/test_tool_planner.py
+
+import json
+
+import pytest
+from agents.gazetteer import extract_entities
+from agents.tool_planner import plan_tool_calls, plan_speculative_rulac_calls, make_tool_call_key
+from agents.tool_plan_cache import ToolPlanCache
+from agents.tool_stream_parser import ToolCallStreamParser
+
+
+def tool_names(tool_calls):
+    return [call["name"] for call in tool_calls]
+
+
+def test_gazetteer_matches_whole_names_only():
+    entities = extract_entities("What conflicts involve Nigeria?")
+    assert entities["countries"] == ["Nigeria"]
+
+    entities = extract_entities("Is there fighting in South Sudan?")
+    assert entities["countries"] == ["South Sudan"]
+
+
+def test_gazetteer_resolves_aliases_and_acronyms():
+    entities = extract_entities("Tell me about ISIS, the ADF and NATO in Russia")
+    assert entities["countries"] == ["Russian Federation"]
+    assert entities["organizations"] == ["NATO"]
+    assert "Islamic State group" in entities["non_state_actors"]
+    assert "Allied Democratic Forces (ADF)" in entities["non_state_actors"]
+
+    # Lower-case words must not be mistaken for acronyms
+    assert extract_entities("tell us about it")["countries"] == []
+
+
+@pytest.mark.parametrize("query, expected_tools", [
+    ("Is Ukraine an international armed conflict?", ["get_armed_conflict_data_by_country", "get_combined_news"]),
+    ("What conflicts involve Hezbollah?", ["get_armed_conflict_data_by_non_state_actor", "get_combined_news"]),
+    ("What is the human rights situation in Somalia?", ["get_human_rights_research_by_country", "get_combined_news"]),
+    ("What is the latest news on Sudan?", ["get_combined_news"]),
+])
+def test_planner_handles_common_questions(query, expected_tools):
+    tool_calls = plan_tool_calls(query)
+    assert tool_calls is not None
+    assert tool_names(tool_calls) == expected_tools
+
+
+def test_planner_fills_conflict_types():
+    tool_calls = plan_tool_calls("Is Ukraine an international armed conflict?")
+    assert tool_calls[0]["args"] == {
+        "countries": ["Ukraine"],
+        "conflict_types": ["International Armed Conflict (IAC)"],
+    }
+
+
+@pytest.mark.parametrize("query", [
+    "What is your name?",
+    "Who is the current prime minister of France?",
+    "What is the difference between IHL and IHRL?",
+    "Could you write me a poem about dogs?",
+])
+def test_planner_defers_to_llm(query):
+    assert plan_tool_calls(query) is None
+
+
+def test_planner_defers_follow_ups_with_context():
+    context = "\n\n**User**: What conflicts involve Sudan?"
+    assert plan_tool_calls("What is the latest news there in Sudan?", context) is None
+
+
+def test_tool_plan_cache_hits_on_normalized_query():
+    cache = ToolPlanCache(max_entries=2, ttl_seconds=60)
+    plan = plan_tool_calls("Is Ukraine an international armed conflict?")
+    cache.put("Is Ukraine an international armed conflict?", "", plan)
+
+    cached = cache.get("is ukraine an  International Armed Conflict", "")
+    assert cached == plan
+    # Callers mutate tool args in place, so the cache must hand out copies
+    cached[0]["args"]["countries"].append("Russia")
+    assert cache.get("Is Ukraine an international armed conflict?", "") == plan
+
+    assert cache.get("Is Ukraine an international armed conflict?", "\n\n**User**: Hello") is None
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+
+
+def test_tool_plan_cache_evicts_and_expires():
+    cache = ToolPlanCache(max_entries=2, ttl_seconds=60)
+    for query in ["a", "b", "c"]:
+        cache.put(query, "", [{"name": query}])
+    assert cache.get("a", "") is None
+    assert cache.get("c", "") == [{"name": "c"}]
+
+    cache.put("d", "", [{"name": "d"}], ttl_seconds=-1)
+    assert cache.get("d", "") is None
+
+
+def test_stream_parser_emits_tools_as_objects_close():
+    response = '{"tools": [{"name": "get_combined_news", "args": {"search_query": "Sudan {latest}"}, "reasoning": "News"}, {"name": "get_armed_conflict_data_by_country", "args": {"countries": ["Sudan"]}}]}'
+    parser = ToolCallStreamParser()
+    emitted = []
+    first_emitted_at = None
+    for i in range(0, len(response), 7):
+        emitted += parser.feed(response[i:i + 7])
+        if emitted and first_emitted_at is None:
+            first_emitted_at = i
+    # The first tool is available before the second one has been streamed
+    assert first_emitted_at < response.index("get_armed_conflict_data_by_country")
+
+    assert [call["id"] for call in emitted] == ["tool_0", "tool_1"]
+    assert emitted[0]["args"] == {"search_query": "Sudan {latest}"}
+    assert emitted[1]["reasoning"] == "No reasoning provided"
+    assert parser.json_text == response
+
+
+def test_stream_parser_numbers_every_element_of_the_tools_array():
+    # The full-response parser numbers tools by array position, so non-tool elements must take a position too
+    response = '{"tools": ["plan", 3, {"name": "a", "args": {"q": "x, y"}}, [1, 2], null, {"name": "b", "args": {}}]}'
+    parser = ToolCallStreamParser()
+    emitted = []
+    for i in range(0, len(response), 5):
+        emitted += parser.feed(response[i:i + 5])
+    positions = [i for i, item in enumerate(json.loads(response)["tools"]) if isinstance(item, dict)]
+    assert [call["id"] for call in emitted] == [f"tool_{i}" for i in positions] == ["tool_2", "tool_5"]
+
+
+def test_stream_parser_ignores_reasoning_fences_and_other_fields():
+    parser = ToolCallStreamParser()
+    emitted = parser.feed('<think>maybe {"tools": []}</think>```json\n{"plan": [{"name": "x", "args": {}}], ')
+    emitted += parser.feed('"tools": [{"name": "get_information_about_Argos", "args": {}}]}\n```')
+    assert [call["name"] for call in emitted] == ["get_information_about_Argos"]
+    assert parser.json_text.startswith('{"plan"')
+    assert parser.json_text.endswith("]}")
+
+
+def test_speculative_calls_match_equivalent_planned_calls():
+    speculative = plan_speculative_rulac_calls("How is Ukraine doing these days?")
+    assert tool_names(speculative) == ["get_armed_conflict_data_by_country"]
+
+    # The LLM planner may order the arguments differently, or pass a single name as a string
+    planned_args = {"conflict_types": [], "countries": "Ukraine"}
+    assert make_tool_call_key("get_armed_conflict_data_by_country", planned_args) == \
+        make_tool_call_key(speculative[0]["name"], speculative[0]["args"])
+    assert make_tool_call_key("get_armed_conflict_data_by_country", {"countries": ["Ukraine", "Russia"], "conflict_types": []}) != \
+        make_tool_call_key(speculative[0]["name"], speculative[0]["args"])
+
+    # Names appear in the rendered summary as requested, so other spellings and orders are different calls
+    speculative = plan_speculative_rulac_calls("Is the Russian Federation at war?")
+    assert speculative[0]["args"]["countries"] == ["Russian Federation"]
+    assert make_tool_call_key("get_armed_conflict_data_by_country", {"countries": ["Russia"], "conflict_types": []}) != \
+        make_tool_call_key(speculative[0]["name"], speculative[0]["args"])
+    assert make_tool_call_key("get_armed_conflict_data_by_country", {"countries": ["Ukraine", "Russia"]}) != \
+        make_tool_call_key("get_armed_conflict_data_by_country", {"countries": ["Russia", "Ukraine"]})
+
+    assert plan_speculative_rulac_calls("What is your name?") == []
+
+
+def test_planner_uses_statistics_mode_for_count_questions():
+    tool_calls = plan_tool_calls("How does the number of conflicts in Eastern Africa compare to North Africa?")
+    assert tool_calls[0]["args"] == {
+        "regions": ["Eastern Africa", "Northern Africa"],
+        "conflict_types": [],
+        "statistics_only": True,
+    }
+    assert "statistics_only" not in plan_tool_calls("What are the most recent conflicts involving Russia?")[0]["args"]
+    assert plan_tool_calls("How many armed conflicts is Russia involved in?")[0]["args"]["statistics_only"] is True
+    assert plan_tool_calls("Which country in Western Africa has the most armed conflicts?")[0]["args"]["statistics_only"] is True
+    # Comparisons that are not about counts still go to the LLM
+    assert plan_tool_calls("Compare the conflicts in Syria and Yemen") is None
+    # ... and so do counts of anything other than conflicts
+    assert plan_tool_calls("Tell me about conflicts in Mali and how many civilians died") is None
+    assert plan_tool_calls("Which armed conflicts does Russia count as party to?") is None
+    speculative = plan_speculative_rulac_calls("Tell me about conflicts in Mali and how many civilians died")
+    assert "statistics_only" not in speculative[0]["args"]
+
+    # A statistics-only flag left false by the LLM planner matches the speculative call without it
+    speculative = plan_speculative_rulac_calls("What conflicts involve Russia?")[0]
+    assert make_tool_call_key(speculative["name"], {**speculative["args"], "statistics_only": False}) == make_tool_call_key(speculative["name"], speculative["args"])
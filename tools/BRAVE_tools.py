@@ -12,6 +12,9 @@ from langchain_core.tools import tool
 from datetime import datetime
 import coloredlogs
 
+# Brave responses cached across NEWS, HRW and BRAVE tools
+from helpers.search_cache import brave_search_cache
+
 # Import necessary functionality from RULAC_tools
 try:
     from tools.RULAC_tools import Citation, RULAC_TOOL_RESULT, create_standard_citation, format_standard_tool_result
@@ -112,6 +115,7 @@ class BraveSearchSummary(BaseModel):
 async def brave_search_query(query: str) -> Optional[Dict[str, Any]]:
     """
     Execute a search query using Brave Search API and return the summarized results.
+    Summaries are shared through the Brave search cache, and concurrent identical queries share one call.
     
     Args:
         query: The search query string
@@ -124,7 +128,21 @@ async def brave_search_query(query: str) -> Optional[Dict[str, Any]]:
         "q": query,
         "summary": 1,
     }
+    return await brave_search_cache.fetch(
+        "summarizer", api_params_web, lambda: fetch_brave_summary(api_params_web)
+    )
+
+
+async def fetch_brave_summary(api_params_web: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Fetch a web search with a summary key from the Brave Search API, then the summary itself.
     
+    Args:
+        api_params_web: Web search request params, including "summary": 1
+        
+    Returns:
+        Optional dictionary containing search results and summary
+    """
     try:
         async with API_RATE_LIMIT:
             async with ClientSession(
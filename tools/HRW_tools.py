@@ -15,6 +15,7 @@ import json
 from datetime import datetime
 from fake_useragent import UserAgent
 import random
+import asyncio
 
 # Import standardized functions from RULAC_tools
 from tools.RULAC_tools import (
@@ -26,6 +27,9 @@ from tools.RULAC_tools import (
     display_formatted_results
 )
 
+# Brave responses cached across NEWS, HRW and BRAVE tools
+from helpers.search_cache import brave_search_cache
+
 # Global configuration values
 # NOTE: API keys should be set via environment variables or passed from the pipeline's Valves
 tool_specific_values = {
@@ -309,6 +313,7 @@ async def async_scrape_hrw_report(urls: List[str]) -> List[Dict[str, Any]]:
 async def get_search_results(query: str, number_of_results: int = 1) -> List[Dict[str, Any]]:
     """
     Get search results from the Brave Search API.
+    Responses are shared through the Brave search cache, with the long TTL of World Report lookups.
     
     Args:
         query: The search query string
@@ -332,18 +337,21 @@ async def get_search_results(query: str, number_of_results: int = 1) -> List[Dic
             "freshness": "2023-07-27to2025-03-28"  # Filter for reports from 2023 to 2025
         }
         
-        # Generate headers for this request
-        headers = get_request_headers()
+        def send_request() -> Dict[str, Any]:
+            # Send the request to the Brave Search API
+            resp = requests.get(
+                tool_specific_values["BRAVE_SEARCH_API_BASE_URL"],
+                params=params,
+                headers=get_request_headers(),
+                timeout=120
+            )
+            resp.raise_for_status()
+            return resp.json()
         
-        # Send the request to the Brave Search API
-        resp = requests.get(
-            tool_specific_values["BRAVE_SEARCH_API_BASE_URL"],
-            params=params,
-            headers=headers,
-            timeout=120
+        # Blocking request, run in a worker thread; identical concurrent searches share one call
+        data = await brave_search_cache.fetch(
+            "hrw_world_report", params, lambda: asyncio.to_thread(send_request)
         )
-        resp.raise_for_status()
-        data = resp.json()
         
         # Extract results from Brave Search response
         results = []
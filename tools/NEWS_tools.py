@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, Union, Optional, Literal, Tuple
+from typing import List, Dict, Any, AsyncIterator, Union, Optional, Literal, Tuple
 from typing_extensions import TypedDict
 from langchain_core.tools import tool, BaseTool
 from rich.console import Console
@@ -24,6 +24,7 @@ from langchain_core.messages import SystemMessage, HumanMessage
 import glob
 from pydantic import BaseModel, Field
 import asyncio
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 import groq
 import instructor
 
@@ -37,6 +38,15 @@ from tools.RULAC_tools import (
     display_formatted_results
 )
 
+# Shared, pooled LLM clients
+from helpers.llm_clients import get_groq_instructor_client
+# Process-wide Groq rate limiting of article summaries
+from helpers.groq_scheduler import get_groq_scheduler
+# Persistent cache of article summaries
+from helpers.article_summary_cache import ArticleSummaryCache, content_hash
+# Brave responses cached across NEWS, HRW and BRAVE tools
+from helpers.search_cache import brave_search_cache
+
 # Global configuration values
 # NOTE: API keys should be set via environment variables or passed from the pipeline's Valves
 tool_specific_values = {
@@ -44,6 +54,25 @@ tool_specific_values = {
     "BRAVE_SEARCH_NEWS_API_BASE_URL": "https://api.search.brave.com/res/v1/news/search",
     "BRAVE_SEARCH_API_KEY": os.getenv("BRAVE_SEARCH_API_KEY", ""),
     "PAGE_CONTENT_WORDS_LIMIT": 4000,
+    "SCRAPER_MAX_CONNECTIONS": 32,  # Concurrent article downloads across all news sources
+    "SCRAPER_MAX_CONNECTIONS_PER_HOST": 4,  # Concurrent article downloads per news site
+    "SCRAPER_CONNECT_TIMEOUT": 5,  # Seconds to connect to a news site
+    "SCRAPER_READ_TIMEOUT": 10,  # Seconds to wait for the next chunk of an article page
+    "SCRAPER_TOTAL_TIMEOUT": 20,  # Seconds a single article download may take
+    "SUMMARY_WORKERS": 3,  # Articles of one news source summarized concurrently
+    "SUMMARY_MODEL": "llama-3.3-70b-versatile",  # More reliable model for structured output
+    # Starting Groq limits of SUMMARY_MODEL, until its rate-limit response headers report the account's real ones
+    "SUMMARY_REQUESTS_PER_MINUTE": 30,
+    "SUMMARY_TOKENS_PER_MINUTE": 12000,
+    "SUMMARY_COMPLETION_TOKENS": 1024,  # Completion tokens reserved per summary on top of the prompt estimate
+    # Local SQLite cache of article summaries (empty path = disabled)
+    "ARTICLE_SUMMARY_CACHE_PATH": os.getenv(
+        "ARTICLE_SUMMARY_CACHE_PATH",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "news_search_cache", "article_summaries.sqlite3"),
+    ),
+    "ARTICLE_SUMMARY_CACHE_TTL": 6 * 3600,  # Seconds a cached summary is served before the article is scraped again
+    "ARTICLE_SUMMARY_CACHE_MAX_ENTRIES": 2000,
+    "ARTICLE_SUMMARY_CACHE_MAX_MB": 50,
     # Use dedicated news key if available, otherwise fall back to main Groq key
     "GROQ_API_KEY": os.getenv("GROQ_API_KEY_NEWS", os.getenv("GROQ_API_KEY", "")),
 }
@@ -320,6 +349,167 @@ def log(message, level="info", as_panel=True):
             logger.error(f"Error printing log message to console: {print_error}")
             print(f"[{level.upper()}] {printable_message}")
 
+# Shared aiohttp sessions for article scraping, one per event loop (aiohttp sessions are bound to their loop).
+# Keyed on the loop object rather than its id(), which a later loop can reuse.
+scraper_sessions: Dict[asyncio.AbstractEventLoop, ClientSession] = {}
+
+def get_scraper_session() -> ClientSession:
+    """
+    Get the shared article scraping session for the running event loop, creating it on first use.
+
+    The connector bounds concurrent connections overall and per host, so a source's articles are
+    fetched in parallel without hammering its site; short connect and read timeouts keep a
+    stalled article from holding up the others.
+    """
+    loop = asyncio.get_running_loop()
+    # Forget the sessions of loops that finished without closing them; their connections died with the loop
+    for finished_loop in [other for other in scraper_sessions if other.is_closed()]:
+        del scraper_sessions[finished_loop]
+    session = scraper_sessions.get(loop)
+    if session is None or session.closed:
+        session = ClientSession(
+            connector=TCPConnector(
+                limit=tool_specific_values["SCRAPER_MAX_CONNECTIONS"],
+                limit_per_host=tool_specific_values["SCRAPER_MAX_CONNECTIONS_PER_HOST"],
+                ttl_dns_cache=300,
+            ),
+            timeout=ClientTimeout(
+                total=tool_specific_values["SCRAPER_TOTAL_TIMEOUT"],
+                sock_connect=tool_specific_values["SCRAPER_CONNECT_TIMEOUT"],
+                sock_read=tool_specific_values["SCRAPER_READ_TIMEOUT"],
+            ),
+        )
+        scraper_sessions[loop] = session
+    return session
+
+async def close_scraper_sessions():
+    """Close the scraping session of the running event loop, e.g. on shutdown or before an asyncio.run() loop ends"""
+    session = scraper_sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+article_summary_cache: Optional[ArticleSummaryCache] = None
+
+def get_article_summary_cache() -> Optional[ArticleSummaryCache]:
+    """
+    Get the persistent article summary cache, opening it on first use.
+    Returns None when the cache is disabled or its database cannot be opened, so news tools run uncached.
+    """
+    global article_summary_cache
+    path = tool_specific_values["ARTICLE_SUMMARY_CACHE_PATH"]
+    if not path:
+        return None
+    if article_summary_cache is None or article_summary_cache.path != path:
+        try:
+            article_summary_cache = ArticleSummaryCache(
+                path,
+                ttl_seconds=tool_specific_values["ARTICLE_SUMMARY_CACHE_TTL"],
+                max_entries=tool_specific_values["ARTICLE_SUMMARY_CACHE_MAX_ENTRIES"],
+                max_bytes=tool_specific_values["ARTICLE_SUMMARY_CACHE_MAX_MB"] * 1_000_000,
+            )
+        except Exception as e:
+            logger.warning(f"Article summary cache disabled, could not open {path}: {str(e)}")
+            tool_specific_values["ARTICLE_SUMMARY_CACHE_PATH"] = ""
+            return None
+    return article_summary_cache
+
+def extract_article_text(html: str, source_name: str, find_article_content: callable, clean_content: callable) -> str:
+    """
+    Parse an article page and return its cleaned text, limited to PAGE_CONTENT_WORDS_LIMIT words.
+    CPU-bound; called in a worker thread so parsing one page does not stall the other downloads.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    # Debug HTML structure
+    title_tag = soup.find('title')
+    logger.debug(f"Page title: {title_tag.text if title_tag else 'No title found'}")
+
+    # Find the main article content using the provided function
+    logger.debug(f"Looking for main content container using find_{source_name.lower().replace(' ', '_')}_content()")
+    article_content = find_article_content(soup)
+    if not article_content:
+        logger.warning(f"Could not find main content container for {source_name}")
+        return ""
+
+    logger.debug(f"Found main content container, type: {type(article_content)}, tag: {article_content.name}")
+    text = clean_content(article_content)
+
+    # Limit to specified number of words
+    words = text.split()
+    logger.debug(f"Text length before truncation: {len(words)} words")
+    if len(words) > tool_specific_values["PAGE_CONTENT_WORDS_LIMIT"]:
+        text = " ".join(words[:tool_specific_values["PAGE_CONTENT_WORDS_LIMIT"]])
+        logger.debug(f"Truncated content to {tool_specific_values['PAGE_CONTENT_WORDS_LIMIT']} words")
+    return text
+
+async def scrape_article(url: str, source_name: str, find_article_content: callable, clean_content: callable) -> str:
+    """
+    Fetch and clean a single article on the shared scraping session.
+
+    Returns:
+        The article text, or "" if the page could not be fetched or has no article content
+    """
+    try:
+        logger.debug(f"Scraping {source_name} URL: {url}")
+        async with get_scraper_session().get(url, headers=get_request_headers()) as response:
+            logger.debug(f"Response status code: {response.status}")
+
+            # Check for redirects
+            if response.history:
+                logger.debug(f"Request was redirected {len(response.history)} times, final URL: {response.url}")
+
+            # Check for common issues
+            if response.status == 403:
+                logger.warning(f"Access Forbidden (403) - Site may be blocking scrapers: {url}")
+            elif response.status == 404:
+                logger.warning(f"Page Not Found (404) - The article may have been removed: {url}")
+
+            # Raise for other bad status codes
+            response.raise_for_status()
+            html = await response.text(errors="replace")
+
+        logger.debug(f"Response Content-Type: {response.headers.get('Content-Type', 'unknown')}, size: {len(html)} characters")
+        text = await asyncio.to_thread(extract_article_text, html, source_name, find_article_content, clean_content)
+        logger.debug(f"Successfully scraped: {url}")
+        return text
+
+    except asyncio.TimeoutError:
+        logger.warning(f"Timed out scraping {url}")
+    except Exception as e:
+        logger.error(f"Error scraping {url}: {type(e).__name__}: {str(e)}")
+        logger.debug(f"Traceback: {traceback.format_exc()}")
+    return ""
+
+async def iter_article_texts(
+    urls: List[str],
+    source_name: str,
+    find_article_content: callable,
+    clean_content: callable
+) -> AsyncIterator[Tuple[int, str]]:
+    """
+    Scrape articles concurrently and yield them as they finish, fastest first.
+
+    Args:
+        urls: List of URLs to scrape
+        source_name: Name of the news source for logging
+        find_article_content: Function that takes soup and returns the article content element
+        clean_content: Function that takes article_content and returns cleaned text
+
+    Yields:
+        (index in urls, article text) for every URL; the text is "" when scraping failed.
+        Scrapes still running when the caller stops iterating are cancelled.
+    """
+    async def scrape_indexed(index: int, url: str) -> Tuple[int, str]:
+        return index, await scrape_article(url, source_name, find_article_content, clean_content)
+
+    tasks = [asyncio.create_task(scrape_indexed(index, url)) for index, url in enumerate(urls)]
+    try:
+        for next_finished in asyncio.as_completed(tasks):
+            yield await next_finished
+    finally:
+        for task in tasks:
+            task.cancel()
+
 # Common function for article content scraping
 async def generic_article_scraper(
     urls: List[str], 
@@ -329,6 +519,7 @@ async def generic_article_scraper(
 ) -> List[str]:
     """
     Generic function for scraping article content that can be configured for different news sources.
+    Articles are fetched concurrently on the shared scraping session (see iter_article_texts).
     
     Args:
         urls: List of URLs to scrape
@@ -337,107 +528,13 @@ async def generic_article_scraper(
         clean_content: Function that takes article_content and returns cleaned text
         
     Returns:
-        List of article text contents
+        List of article text contents, in the order of urls ("" for failed scrapes)
     """
-    # Create temp directory if it doesn't exist
-    temp_dir = "temp_test_data"
-    os.makedirs(temp_dir, exist_ok=True)
-    
-    # Initialize results
-    article_texts = []
-    
-    # Process each URL
-    for url in urls:
-        try:
-            logger.debug(f"Scraping {source_name} URL: {url}")
-                
-            # Generate headers for this request
-            headers = get_request_headers()
-            logger.debug(f"Request headers: {headers}")
-                
-            # Fetch the page content with detailed logging
-            logger.debug(f"Making HTTP request to: {url}")
-            response = requests.get(url, headers=headers, timeout=120)
-            
-            # Log response details
-            logger.debug(f"Response status code: {response.status_code}")
-            logger.debug(f"Response headers: {dict(response.headers)}")
-            
-            # Check for redirects
-            if response.history:
-                logger.debug(f"Request was redirected {len(response.history)} times")
-                for r in response.history:
-                    logger.debug(f"Redirect: {r.status_code} - {r.url}")
-                logger.debug(f"Final URL: {response.url}")
-            
-            # Check for common issues
-            if response.status_code == 403:
-                logger.warning(f"Access Forbidden (403) - Site may be blocking scrapers")
-            elif response.status_code == 404:
-                logger.warning(f"Page Not Found (404) - The article may have been removed")
-            elif response.status_code == 302 or response.status_code == 301:
-                logger.warning(f"Redirect detected - Final URL: {response.url}")
-            
-            # Raise for other bad status codes
-            response.raise_for_status()
-            
-            # Log response content type and size
-            content_type = response.headers.get('Content-Type', 'unknown')
-            logger.debug(f"Response Content-Type: {content_type}")
-            logger.debug(f"Response size: {len(response.text)} characters")
-            
-            # Save a sample of the HTML for debugging
-            html_sample = response.text[:500] + "..." if len(response.text) > 500 else response.text
-            logger.debug(f"HTML sample: {html_sample}")
-            
-            # Parse the HTML
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            # # Check if we're hitting a paywall or login page
-            # paywall_indicators = ['paywall', 'subscribe', 'subscription', 'sign in', 'login', 'premium']
-            # for indicator in paywall_indicators:
-            #     if indicator in response.text.lower():
-            #         logger.warning(f"Possible paywall/subscription content detected: '{indicator}'")
-            
-            # Debug HTML structure
-            title_tag = soup.find('title')
-            logger.debug(f"Page title: {title_tag.text if title_tag else 'No title found'}")
-            
-            # Find the main article content using the provided function
-            logger.debug(f"Looking for main content container using find_{source_name.lower().replace(' ', '_')}_content()")
-            article_content = find_article_content(soup)
-            
-            # Process the content if article was found
-            if article_content:
-                logger.debug(f"Found main content container, type: {type(article_content)}, tag: {article_content.name}")
-                # Use the provided cleaning function
-                text = clean_content(article_content)
-                
-                # Log text statistics
-                logger.debug(f"Text length before truncation: {len(text.split())} words")
-                
-                # Limit to specified number of words
-                words = text.split()
-                if len(words) > tool_specific_values["PAGE_CONTENT_WORDS_LIMIT"]:
-                    text = " ".join(words[:tool_specific_values["PAGE_CONTENT_WORDS_LIMIT"]])
-                    logger.debug(f"Truncated content to {tool_specific_values['PAGE_CONTENT_WORDS_LIMIT']} words")
-            else:
-                text = ""
-                logger.warning(f"Could not find main content container for {source_name}")
-            
-            # Add the text content to the results
-            article_texts.append(text)
-            
-            logger.debug(f"Successfully scraped: {url}")
-                
-        except Exception as e:
-            logger.error(f"Error scraping {url}: {str(e)}")
-            logger.error(f"Error type: {type(e).__name__}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            # Add empty content for failed scrapes
-            article_texts.append("")
-    
+    start_time = time.time()
+    article_texts = [""] * len(urls)
+    async for index, text in iter_article_texts(urls, source_name, find_article_content, clean_content):
+        article_texts[index] = text
+    logger.debug(f"Scraped {sum(1 for text in article_texts if text)}/{len(urls)} {source_name} articles in {time.time() - start_time:.2f}s")
     return article_texts
 
 # BBC News content finder
@@ -816,9 +913,22 @@ async def async_scrape_AP_news(urls: List[str]) -> List[str]:
         clean_content=clean_ap_content
     )
 
+def iter_scrape_BBC_news(urls: List[str]) -> AsyncIterator[Tuple[int, str]]:
+    """Scrape BBC URLs concurrently, yielding (index, article text) as each finishes"""
+    return iter_article_texts(urls, "BBC", find_bbc_content, clean_bbc_content)
+
+def iter_scrape_AlJazeera_news(urls: List[str]) -> AsyncIterator[Tuple[int, str]]:
+    """Scrape Al Jazeera URLs concurrently, yielding (index, article text) as each finishes"""
+    return iter_article_texts(urls, "Al Jazeera", find_aljazeera_content, clean_aljazeera_content)
+
+def iter_scrape_AP_news(urls: List[str]) -> AsyncIterator[Tuple[int, str]]:
+    """Scrape Associated Press (AP) URLs concurrently, yielding (index, article text) as each finishes"""
+    return iter_article_texts(urls, "AP News", find_ap_content, clean_ap_content)
+
 async def get_search_results(query: str, number_of_results: int = 1, search_type: Literal["web", "news"] = "web") -> List[Dict[str, Any]]:
     """
     Get search results from the Brave Search API.
+    Responses are shared through the Brave search cache, with a short TTL for news searches.
     
     Args:
         query: The search query string
@@ -858,19 +968,25 @@ async def get_search_results(query: str, number_of_results: int = 1, search_type
         logger.debug(f"Using API endpoint: {api_url}")
         logger.debug(f"Search parameters: {json.dumps(params, indent=2)}")
         
-        # Generate headers for this request
-        headers = get_request_headers()
-        logger.debug(f"Request headers: {json.dumps(headers, indent=2)}")
+        def send_request() -> Dict[str, Any]:
+            # Generate headers for this request
+            headers = get_request_headers()
+            logger.debug(f"Request headers: {json.dumps(headers, indent=2)}")
+            
+            # Send the request to the Brave Search API
+            resp = requests.get(
+                api_url,
+                params=params,
+                headers=headers,
+                timeout=120
+            )
+            resp.raise_for_status()
+            return resp.json()
         
-        # Send the request to the Brave Search API
-        resp = requests.get(
-            api_url,
-            params=params,
-            headers=headers,
-            timeout=120
+        # Blocking request, run in a worker thread; identical concurrent searches share one call
+        data = await brave_search_cache.fetch(
+            search_type, params, lambda: asyncio.to_thread(send_request)
         )
-        resp.raise_for_status()
-        data = resp.json()
         
         # Log the full response for debugging
         # log(f"Full API Response for {search_type} search:", "info")
@@ -1156,7 +1272,8 @@ async def get_latest_news_from_source(
         source_url: The base URL for the news source (e.g., "www.bbc.com/news")
         web_results_count: Number of web search results to fetch (0 to skip web search)
         news_results_count: Number of news search results to fetch (0 to skip news search)
-        scrape_function: The specific scraping function to use for this source
+        scrape_function: The source's scraping function, taking the URLs and yielding (index, article text)
+            as each scrape finishes (e.g. iter_scrape_BBC_news)
         
     Returns:
         A standardized NewsSourceResponse
@@ -1254,79 +1371,103 @@ async def get_latest_news_from_source(
             urls = [r["link"] for r in search_results]
             
             try:
-                logger.debug(f"Scraping content from {len(urls)} pages...")
-                article_texts = await scrape_function(urls)
+                # Producer/consumer pipeline: each article goes to the summarization workers as soon as its
+                # scrape finishes, and each worker pulls the next article as soon as it is free
+                pipeline_start_time = time.time()
+                summaries_by_index: Dict[int, ArticleSummary] = {}
                 
-                # Store original article contents in a dictionary for citation purposes
-                # original_contents = {url: text for url, text in zip(urls, article_texts) if text}
+                # Articles summarized within the cache TTL skip both the scrape and the LLM call
+                summary_cache = get_article_summary_cache()
+                if summary_cache is not None:
+                    try:
+                        cached_summaries = await asyncio.to_thread(lambda: [summary_cache.latest(url) for url in urls])
+                        for index, cached_summary in enumerate(cached_summaries):
+                            if cached_summary:
+                                summaries_by_index[index] = ArticleSummary(**cached_summary)
+                    except Exception as e:
+                        logger.warning(f"Error reading the article summary cache: {str(e)}")
+                    if summaries_by_index:
+                        log(f"Serving {len(summaries_by_index)}/{len(urls)} article summaries from the cache", "debug")
+                uncached_indexes = [index for index in range(len(urls)) if index not in summaries_by_index]
                 
-                # Process and summarize each article in parallel
-                summarization_tasks = []
+                logger.debug(f"Scraping and summarizing {len(uncached_indexes)} pages...")
+                worker_count = max(1, min(tool_specific_values["SUMMARY_WORKERS"], len(uncached_indexes)))
+                scraped_articles: asyncio.Queue = asyncio.Queue()
                 
-                # Prepare all summarization tasks
-                for i, (url, title, publication_date, article_text) in enumerate(zip(
-                    urls, 
-                    [r["title"] for r in search_results], 
-                    [r["publication_date"] for r in search_results], 
-                    article_texts
-                )):
-                    if not article_text:
-                        continue
-                    
-                    # Create task for summarizing this article
-                    summarization_tasks.append({
-                        "index": i,
-                        "url": url,
-                        "title": title,
-                        "publication_date": publication_date,
-                        "content": article_text,
-                        "task": summarize_individual_article(
-                            chat=chat,
-                            title=title,
-                            date=publication_date,
-                            content=article_text,
-                            source_name=source_name,
-                            url=url
-                        )
-                    })
+                async def produce_articles():
+                    try:
+                        if not uncached_indexes:
+                            return
+                        async for position, article_text in scrape_function([urls[index] for index in uncached_indexes]):
+                            index = uncached_indexes[position]
+                            if article_text:
+                                await scraped_articles.put((index, article_text))
+                            else:
+                                logger.debug(f"No content scraped for article {index + 1}, skipping: {urls[index]}")
+                    finally:
+                        # One stop marker per worker, also when scraping fails
+                        for _ in range(worker_count):
+                            await scraped_articles.put(None)
                 
-                # Run summarization tasks in parallel
-                if summarization_tasks:
-                    log(f"Summarizing {len(summarization_tasks)} articles in parallel...", "debug")
-                    summary_start_time = time.time()
-                    
-                    # Execute all tasks in parallel (up to 3 at a time to avoid overloading the API)
-                    # Create batches of 3 tasks
-                    batch_size = 3
-                    for i in range(0, len(summarization_tasks), batch_size):
-                        batch = summarization_tasks[i:i+batch_size]
-                        log(f"Processing batch {i//batch_size + 1}/{(len(summarization_tasks)-1)//batch_size + 1}...", "debug")
-                        
-                        # Execute this batch in parallel
-                        batch_results = await asyncio.gather(
-                            *[task["task"] for task in batch],
-                            return_exceptions=True
-                        )
-                        
-                        # Process the batch results
-                        for task, result in zip(batch, batch_results):
-                            # Check if the result is an exception
-                            if isinstance(result, Exception):
-                                log(f"Error summarizing article {task['index']+1}: {str(result)}", "error")
-                                continue
-                            
-                            # Add the summary to our collection if valid
-                            if result:
-                                article_summaries.append(result)
-                                
-                                # Create citation
-                                citation = create_citation_for_article(result)
-                                citations.append(citation)
-                                
-                                logger.debug(f"Created citation for article: '{task['title'][:50]}...'")
-                    
-                    summary_elapsed = time.time() - summary_start_time
-                    log(f"Parallel summarization completed in {summary_elapsed:.2f} seconds", "debug")
+                async def summarize_articles():
+                    while True:
+                        item = await scraped_articles.get()
+                        if item is None:
+                            return
+                        index, article_text = item
+                        result = search_results[index]
+                        article_hash = content_hash(article_text)
+                        if summary_cache is not None:
+                            # Re-scraped, but the text is unchanged since it was last summarized
+                            try:
+                                cached_summary = await asyncio.to_thread(summary_cache.get, urls[index], article_hash)
+                                if cached_summary:
+                                    summaries_by_index[index] = ArticleSummary(**cached_summary)
+                                    logger.debug(f"Article {index + 1} is unchanged, reusing its cached summary")
+                                    continue
+                            except Exception as e:
+                                logger.warning(f"Error reading the article summary cache: {str(e)}")
+                        try:
+                            summary = await summarize_individual_article(
+                                chat=chat,
+                                title=result["title"],
+                                date=result["publication_date"],
+                                content=article_text,
+                                source_name=source_name,
+                                url=urls[index]
+                            )
+                        except Exception as e:
+                            log(f"Error summarizing article {index + 1}: {str(e)}", "error")
+                            continue
+                        if summary:
+                            summaries_by_index[index] = summary
+                            if summary_cache is not None and summary.content != SUMMARY_FALLBACK_MESSAGE:
+                                try:
+                                    await asyncio.to_thread(summary_cache.put, urls[index], article_hash, summary.model_dump())
+                                except Exception as e:
+                                    logger.warning(f"Error writing the article summary cache: {str(e)}")
+                            logger.debug(f"Summarized article {index + 1} after {time.time() - pipeline_start_time:.2f}s: '{result['title'][:50]}...'")
+                
+                producer_result, *_ = await asyncio.gather(
+                    produce_articles(),
+                    *[summarize_articles() for _ in range(worker_count)],
+                    return_exceptions=True
+                )
+                if isinstance(producer_result, Exception):
+                    log(f"Error during page scraping: {str(producer_result)}", "error")
+                
+                # Keep the search result order (oldest first), whatever order the summaries finished in
+                for index in sorted(summaries_by_index):
+                    article_summaries.append(summaries_by_index[index])
+                    citations.append(create_citation_for_article(summaries_by_index[index]))
+                
+                log(f"Retrieved {len(article_summaries)}/{len(urls)} article summaries with {worker_count} workers in {time.time() - pipeline_start_time:.2f} seconds", "debug")
+                if summary_cache is not None and logger.isEnabledFor(logging.DEBUG):
+                    cache_stats = summary_cache.stats()
+                    logger.debug(
+                        f"Article summary cache: hit rate {cache_stats['hit_rate']:.0%}, {cache_stats['content_hits']} unchanged re-scrapes, "
+                        f"{cache_stats['entries']} entries ({cache_stats['bytes'] / 1_000_000:.1f} MB)"
+                    )
                 
             except Exception as e:
                 log(f"Error during page scraping: {str(e)}", "error")
@@ -1452,7 +1593,7 @@ async def get_latest_news_from_BBC(search_query: str) -> RULAC_TOOL_RESULT:
         source_url="www.bbc.com/news/articles",
         web_results_count=1,
         news_results_count=0,
-        scrape_function=async_scrape_BBC_news
+        scrape_function=iter_scrape_BBC_news
     )
     
     # Convert NewsSourceResponse to RULAC_TOOL_RESULT format
@@ -1533,7 +1674,7 @@ async def get_latest_news_from_AlJazeera(search_query: str) -> RULAC_TOOL_RESULT
         source_url="www.aljazeera.com/news",
         web_results_count=1,
         news_results_count=0,
-        scrape_function=async_scrape_AlJazeera_news
+        scrape_function=iter_scrape_AlJazeera_news
     )
     
     # Convert NewsSourceResponse to RULAC_TOOL_RESULT format
@@ -1614,7 +1755,7 @@ async def get_latest_news_from_AP(search_query: str) -> RULAC_TOOL_RESULT:
         source_url="apnews.com/article",
         web_results_count=1,
         news_results_count=0,
-        scrape_function=async_scrape_AP_news
+        scrape_function=iter_scrape_AP_news
     )
     
     # Convert NewsSourceResponse to RULAC_TOOL_RESULT format
@@ -1958,6 +2099,9 @@ async def get_combined_news(search_query: str) -> RULAC_TOOL_RESULT:
             beacon_tool_source="Multiple News Sources"
         )
 
+# Content of the summary returned when an article could not be summarized (never cached)
+SUMMARY_FALLBACK_MESSAGE = "Article content could not be summarized properly. Please refer to the original source."
+
 async def summarize_individual_article(
     chat: ChatGroq,
     title: str,
@@ -1992,9 +2136,8 @@ async def summarize_individual_article(
             date: str = Field(..., description="The publication date of the article")
             summary: str = Field(..., description="A concise, factual summary of the article contents with essential details, figures, and key quotes. Should be 3+ paragraphs.")
         
-        # Initialize Groq client with instructor
-        groq_client = groq.AsyncGroq(api_key=tool_specific_values["GROQ_API_KEY"])
-        client = instructor.from_groq(groq_client)
+        # Get the shared, pooled Groq client wrapped with instructor
+        client = get_groq_instructor_client(tool_specific_values["GROQ_API_KEY"])
         
         # Create system prompt for article summarization
         system_prompt = f"""
@@ -2012,10 +2155,21 @@ You should return json according to the following schema, including all fields:
         # User message to explicitly request the summary
         user_prompt = "Provide a detailed, factual summary of this article in 3+ paragraphs."
         
+        # Wait for room under the Groq rate limits shared by every summary in the process
+        model = tool_specific_values["SUMMARY_MODEL"]
+        scheduler = get_groq_scheduler(
+            tool_specific_values["GROQ_API_KEY"],
+            model,
+            requests_per_minute=tool_specific_values["SUMMARY_REQUESTS_PER_MINUTE"],
+            tokens_per_minute=tool_specific_values["SUMMARY_TOKENS_PER_MINUTE"],
+        )
+        estimated_tokens = (len(system_prompt) + len(user_prompt)) // 4 + tool_specific_values["SUMMARY_COMPLETION_TOKENS"]
+        await scheduler.acquire(estimated_tokens)
+        
         # Make API call using instructor for automatic parsing and validation
         try:
             validated_response = await client.chat.completions.create(
-                model="llama-3.3-70b-versatile",  # More reliable model for structured output
+                model=model,
                 # model="llama-3.1-8b-instant", # faster and cheaper than the 70b model, but not as reliable for structured output
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -2056,11 +2210,10 @@ You should return json according to the following schema, including all fields:
         
         # Create a fallback summary with the original title and date
         try:
-            fallback_message = "Article content could not be summarized properly. Please refer to the original source."
             return ArticleSummary(
                 title=title,
                 date=date,
-                content=fallback_message,
+                content=SUMMARY_FALLBACK_MESSAGE,
                 original_content=content,  # Store the original content even for fallback cases
                 url=url,
                 source=source_name
@@ -2193,6 +2346,7 @@ if __name__ == "__main__":
        
 
         log("ALL TESTS COMPLETED", "success")
+        await close_scraper_sessions()
     
     # Run the async test function
     asyncio.run(run_tests()) 
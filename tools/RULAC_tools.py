@@ -1,12 +1,12 @@
 from typing import List, Dict, Any, Union, Optional
-from typing_extensions import TypedDict
-from langchain_core.tools import tool
+from typing_extensions import Annotated, NotRequired, TypedDict
+from langchain_core.tools import tool, InjectedToolArg
 from rich.console import Console
 from rich.panel import Panel
 from rich.pretty import Pretty
 from rich.text import Text
 from rich.markdown import Markdown
-from langchain_neo4j import Neo4jGraph
+from neo4j import AsyncGraphDatabase, Query, unit_of_work
 import json
 import logging
 import os
@@ -19,6 +19,13 @@ from urllib.parse import urlparse, urljoin
 import unicodedata
 import time
 
+from helpers.rulac_snapshot import RULACSnapshot, GRAPH_VERSION_QUERY, graph_version_token
+from helpers.rulac_resolver import NameResolver
+from helpers.rulac_batch import RULACQueryBatch, current_rulac_batch
+from helpers.rulac_result_cache import MISSING, RULACResultCache, make_result_cache_key
+from helpers.rulac_profiles import ConflictProfile, ConflictProfileStore, elision_note, fit_profiles_to_budget
+from helpers.rulac_formatter import render_by_country, render_by_non_state_actor, render_by_organization, render_by_region, render_statistics, statistics_rows
+
 # Define Citation type using TypedDict
 class Citation(TypedDict):
     """
@@ -42,10 +49,13 @@ class RULAC_TOOL_RESULT(TypedDict):
         content: The main content of the results (can be a string, list, or dictionary)
         citations: List of citation dictionaries
         tool_use_metadata: Information about tool usage including name and parameters
+        rulac_research: Structured form of the content for conflict tools: the research summary block and
+            the shared conflict profiles, used to merge conflict profiles across tools
     """
     content: Union[str, List[Dict[str, Any]], Dict[str, Any]]
     citations: List[Citation]
     tool_use_metadata: Optional[Dict[str, Any]]
+    rulac_research: NotRequired[Dict[str, Any]]
 
 # Global configuration values
 tool_specific_valves = {
@@ -53,6 +63,18 @@ tool_specific_valves = {
     "NEO4J_TESTING_URL": "bolt://localhost:7687",
     "NEO4J_USERNAME": "neo4j",
     "NEO4J_PASSWORD": "password",
+    "NEO4J_DATABASE": "neo4j",
+    "NEO4J_MAX_POOL_SIZE": 50,  # Max connections in the async driver pool, shared by parallel tool calls and concurrent users
+    "NEO4J_CONNECTION_ACQUISITION_TIMEOUT": 10,  # Seconds to wait for a free pooled connection
+    "NEO4J_QUERY_TIMEOUT": 15,  # Seconds a single RULAC query may run (server-side transaction timeout and client-side cancellation)
+    "RULAC_SNAPSHOT_ENABLED": True,  # Answer the conflict tools from an in-memory snapshot of the RULAC graph
+    "RULAC_SNAPSHOT_REFRESH_INTERVAL": 3600,  # Seconds before the snapshot is reloaded from Neo4j
+    "RULAC_SNAPSHOT_RETRY_INTERVAL": 60,  # Seconds to wait before retrying a failed snapshot load
+    "RULAC_SNAPSHOT_LOAD_TIMEOUT": 60,  # Seconds each snapshot load query may run
+    "RULAC_VERSION_POLL_INTERVAL": 60,  # Seconds between checks of the graph version token; a change reloads the snapshot and clears the result cache
+    "RULAC_VERSION_QUERY_TIMEOUT": 5,  # Seconds the graph version query may run
+    "RULAC_RESULT_CACHE_SIZE": 512,  # Conflict lookups kept in the result cache for the current graph version (0 = disabled)
+    "RULAC_BATCH_WINDOW": 0.05,  # Seconds a batch of one plan's conflict queries waits for its remaining tools
 }
 
 # Initialize Rich Console
@@ -107,7 +129,8 @@ def format_standard_tool_result(
     citations: List[Citation],
     tool_name: Optional[str] = None,
     tool_params: Optional[Dict[str, Any]] = None,
-    beacon_tool_source: str = "RULAC"
+    beacon_tool_source: str = "RULAC",
+    rulac_research: Optional[Dict[str, Any]] = None
 ) -> RULAC_TOOL_RESULT:
     """
     Format tool results in a standardized structure.
@@ -118,6 +141,7 @@ def format_standard_tool_result(
         tool_name (Optional[str]): Name of the tool being used
         tool_params (Optional[Dict[str, Any]]): Parameters used for the tool call
         beacon_tool_source (str): Source of the tool ("RULAC", "WEB", etc.). Defaults to "RULAC".
+        rulac_research (Optional[Dict[str, Any]]): Research summary and conflict profiles of a conflict tool, from process_rulac_data
     
     Returns:
         RULAC_TOOL_RESULT: A standardized result dictionary
@@ -138,6 +162,8 @@ def format_standard_tool_result(
         "citations": citations,
         "tool_use_metadata": tool_use_metadata
     }
+    if rulac_research is not None:
+        result["rulac_research"] = rulac_research
     
     return result
     
@@ -190,51 +216,332 @@ async def standardized_tool_test(
     
     console.print(f"\n[bold green]All tests completed for {test_title}[/]")
 
-# Global Neo4j graph connection
-graph = None
+# Async Neo4j drivers for the RULAC graph tools, one per event loop, since a driver's connection pool is bound to the loop that created it.
+# Keyed on the loop object rather than its id(), which a later loop can reuse.
+async_drivers: Dict[asyncio.AbstractEventLoop, Any] = {}
 
-def initialize_neo4j(local_testing=False):
-    """Initialize the Neo4j graph connection using configuration values"""
-    global graph
-    
-    # If graph is already initialized, just return it
-    if graph is not None:
-        return graph
-    
-    # Dynamically switch Neo4j URL based on the testing flag
+def get_async_neo4j_driver(local_testing: Optional[bool] = None):
+    """
+    Get the pooled neo4j AsyncDriver for the running event loop, creating it on first use.
+
+    Args:
+        local_testing: Use the local testing URL; defaults to detecting the OpenWebUI container
+
+    Returns:
+        neo4j.AsyncDriver shared by all RULAC graph queries on this event loop
+    """
+    global rulac_index_task
+    loop = asyncio.get_running_loop()
+    driver = async_drivers.get(loop)
+    if driver is not None:
+        return driver
+
+    # Forget the drivers of loops that finished without closing them; their connections died with the loop
+    for finished_loop in [other for other in async_drivers if other.is_closed()]:
+        del async_drivers[finished_loop]
+
+    if local_testing is None:
+        local_testing = not os.path.exists("/app/backend/beacon_code")
     neo4j_url = tool_specific_valves["NEO4J_TESTING_URL"] if local_testing else tool_specific_valves["NEO4J_URL"]
-    neo4j_username = tool_specific_valves["NEO4J_USERNAME"]
-    neo4j_password = tool_specific_valves["NEO4J_PASSWORD"]
-    
-    # Debugging: Neo4j connection
-    print(f"DEBUG: Connecting to Neo4j at {neo4j_url} with username {neo4j_username}")
-    
+    logger.debug(f"Creating async Neo4j driver for {neo4j_url} (pool size {tool_specific_valves['NEO4J_MAX_POOL_SIZE']})")
+
+    driver = AsyncGraphDatabase.driver(
+        neo4j_url,
+        auth=(tool_specific_valves["NEO4J_USERNAME"], tool_specific_valves["NEO4J_PASSWORD"]),
+        max_connection_pool_size=tool_specific_valves["NEO4J_MAX_POOL_SIZE"],
+        connection_acquisition_timeout=tool_specific_valves["NEO4J_CONNECTION_ACQUISITION_TIMEOUT"],
+    )
+    async_drivers[loop] = driver
+
+    if not rulac_indexes_ready and (rulac_index_task is None or rulac_index_task.done()):
+        # In the background, so the first query does not wait for it; retried with the next driver if it failed
+        rulac_index_task = loop.create_task(ensure_rulac_indexes(driver))
+    return driver
+
+# Schema indexes the RULAC queries rely on, created once per process by the first driver
+rulac_indexes_ready = False
+rulac_index_task = None
+
+async def ensure_rulac_indexes(driver) -> bool:
+    """
+    Create the indexes backing the RULAC lookups (CREATE INDEX ... IF NOT EXISTS, so a no-op once they exist).
+
+    Returns:
+        True if all statements ran; failures (e.g. a read-only user) are logged and the
+        lookups still work, scanning the label instead
+    """
+    global rulac_indexes_ready
     try:
-        # Connect to Neo4j using the provided credentials
-        graph = Neo4jGraph(
-            url=neo4j_url,
-            username=neo4j_username,
-            password=neo4j_password,
-            enhanced_schema=False,
+        async with driver.session(database=tool_specific_valves["NEO4J_DATABASE"]) as session:
+            for statement in tool_cypher_RULAC_conflict_by_StateActor.INDEX_STATEMENTS:
+                await (await session.run(statement)).consume()
+        rulac_indexes_ready = True
+        logger.debug("RULAC indexes are in place")
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to create the RULAC indexes, code lookups will scan every StateActor: {e}")
+        return False
+
+async def run_rulac_query(query: str, params: dict, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+    """
+    Run a read-only Cypher query on the pooled async driver without blocking the event loop.
+
+    The timeout is enforced server-side as a transaction timeout and client-side with
+    asyncio.wait_for. A cancelled call (timeout, or a tool missing its deadline) releases its
+    connection back to the pool.
+
+    Args:
+        query: Cypher query text
+        params: Query parameters
+        timeout: Seconds the query may take; defaults to NEO4J_QUERY_TIMEOUT
+
+    Returns:
+        List of records as dictionaries
+    """
+    timeout = timeout if timeout is not None else tool_specific_valves["NEO4J_QUERY_TIMEOUT"]
+    driver = get_async_neo4j_driver()
+
+    async def run_query():
+        async with driver.session(database=tool_specific_valves["NEO4J_DATABASE"], default_access_mode="READ") as session:
+            result = await session.run(Query(query, timeout=timeout), params)
+            return await result.data()
+
+    return await asyncio.wait_for(run_query(), timeout=timeout)
+
+async def run_rulac_statements(statements: List[tuple], timeout: Optional[float] = None) -> List[List[Dict[str, Any]]]:
+    """
+    Run several read-only Cypher queries as the statements of one read transaction, on one pooled connection.
+
+    Args:
+        statements: List of (query, params)
+        timeout: Seconds the whole transaction may take; defaults to NEO4J_QUERY_TIMEOUT
+
+    Returns:
+        The records of each statement as dictionaries, in statement order
+    """
+    timeout = timeout if timeout is not None else tool_specific_valves["NEO4J_QUERY_TIMEOUT"]
+    driver = get_async_neo4j_driver()
+
+    @unit_of_work(timeout=timeout)
+    async def run_all(tx):
+        results = []
+        for query, params in statements:
+            result = await tx.run(query, params)
+            results.append(await result.data())
+        return results
+
+    async def run_transaction():
+        async with driver.session(database=tool_specific_valves["NEO4J_DATABASE"], default_access_mode="READ") as session:
+            return await session.execute_read(run_all)
+
+    return await asyncio.wait_for(run_transaction(), timeout=timeout)
+
+def new_rulac_query_batch(expected: int) -> RULACQueryBatch:
+    """Batch for the RULAC conflict queries of a plan with `expected` conflict tools (see helpers/rulac_batch.py)"""
+    return RULACQueryBatch(run_rulac_statements, run_rulac_query, expected, window=tool_specific_valves["RULAC_BATCH_WINDOW"])
+
+async def close_async_neo4j_drivers():
+    """Close the async driver of the running event loop, e.g. on shutdown or before reconfiguring credentials"""
+    global rulac_index_task
+    loop = asyncio.get_running_loop()
+    driver = async_drivers.pop(loop, None)
+    if rulac_index_task is not None and not rulac_index_task.done() and rulac_index_task.get_loop() is loop:
+        rulac_index_task.cancel()
+        rulac_index_task = None
+    if driver is not None:
+        await driver.close()
+
+# In-memory RULAC graph snapshot, swapped in whole on every refresh; Neo4j is the source of truth and the fallback
+rulac_snapshot: Optional[RULACSnapshot] = None
+snapshot_refresh_task = None
+snapshot_last_attempt = 0.0
+
+async def refresh_rulac_snapshot() -> Optional[RULACSnapshot]:
+    """Reload the RULAC snapshot from Neo4j, keeping the previous snapshot if the load fails"""
+    global rulac_snapshot
+    load_timeout = tool_specific_valves["RULAC_SNAPSHOT_LOAD_TIMEOUT"]
+    try:
+        rulac_snapshot = await RULACSnapshot.load(lambda query, params: run_rulac_query(query, params, timeout=load_timeout))
+    except Exception as e:
+        logger.warning(f"Failed to load RULAC snapshot, still using {'the previous snapshot' if rulac_snapshot else 'Neo4j queries'}: {e}")
+    return rulac_snapshot
+
+def get_rulac_snapshot() -> Optional[RULACSnapshot]:
+    """
+    Return the current RULAC snapshot, or None if none is loaded yet.
+
+    When the snapshot is missing or older than the refresh interval, a reload is started in
+    the background; callers never wait for it and keep using the current snapshot (or Neo4j).
+    """
+    global snapshot_refresh_task, snapshot_last_attempt
+    if not tool_specific_valves["RULAC_SNAPSHOT_ENABLED"]:
+        return None
+
+    now = time.time()
+    is_stale = rulac_snapshot is None or now - rulac_snapshot.loaded_at > tool_specific_valves["RULAC_SNAPSHOT_REFRESH_INTERVAL"]
+    refresh_running = snapshot_refresh_task is not None and not snapshot_refresh_task.done()
+    if is_stale and not refresh_running and now - snapshot_last_attempt > tool_specific_valves["RULAC_SNAPSHOT_RETRY_INTERVAL"]:
+        snapshot_last_attempt = now
+        snapshot_refresh_task = asyncio.get_running_loop().create_task(refresh_rulac_snapshot())
+    return rulac_snapshot
+
+# Graph version token, polled periodically; conflict lookups are cached per version
+graph_version: Optional[str] = None
+graph_version_task = None
+graph_version_last_attempt = 0.0
+
+async def refresh_graph_version() -> Optional[str]:
+    """Poll the graph version token; when it changed, start reloading a snapshot built from an older graph"""
+    global graph_version, snapshot_refresh_task, snapshot_last_attempt
+    try:
+        rows = await run_rulac_query(GRAPH_VERSION_QUERY, {}, timeout=tool_specific_valves["RULAC_VERSION_QUERY_TIMEOUT"])
+    except Exception as e:
+        logger.warning(f"Failed to check the RULAC graph version, keeping {graph_version}: {e}")
+        return graph_version
+
+    token = graph_version_token(rows)
+    if token != graph_version:
+        logger.info(f"RULAC graph version is now {token} (was {graph_version})")
+        graph_version = token
+    refresh_running = snapshot_refresh_task is not None and not snapshot_refresh_task.done()
+    if rulac_snapshot is not None and rulac_snapshot.version != token and not refresh_running and tool_specific_valves["RULAC_SNAPSHOT_ENABLED"]:
+        logger.info(f"RULAC snapshot was built from graph version {rulac_snapshot.version}, reloading")
+        snapshot_last_attempt = time.time()
+        snapshot_refresh_task = asyncio.get_running_loop().create_task(refresh_rulac_snapshot())
+    return graph_version
+
+async def get_graph_version() -> Optional[str]:
+    """
+    Return the current graph version token, or None if it could not be read yet.
+
+    The first call waits for the version query; later calls return the last token at once and
+    start a background check when it is older than RULAC_VERSION_POLL_INTERVAL.
+    """
+    global graph_version_task, graph_version_last_attempt
+    now = time.time()
+    check_running = graph_version_task is not None and not graph_version_task.done()
+    if graph_version is None:
+        if check_running:
+            return None
+        if now - graph_version_last_attempt > tool_specific_valves["RULAC_SNAPSHOT_RETRY_INTERVAL"]:
+            graph_version_last_attempt = now
+            return await refresh_graph_version()
+        return None
+
+    if not check_running and now - graph_version_last_attempt > tool_specific_valves["RULAC_VERSION_POLL_INTERVAL"]:
+        graph_version_last_attempt = now
+        graph_version_task = asyncio.get_running_loop().create_task(refresh_graph_version())
+    return graph_version
+
+# Conflict lookups (RULAC_research maps) of the current graph version
+rulac_result_cache = RULACResultCache(max_entries=tool_specific_valves["RULAC_RESULT_CACHE_SIZE"])
+
+def get_rulac_cache_stats() -> Dict[str, Any]:
+    """Hit rate, size and estimated memory use of the RULAC result cache, for monitoring"""
+    return rulac_result_cache.stats()
+
+# Name resolver used for Neo4j queries while no snapshot is loaded (a loaded snapshot brings its own)
+name_resolver: Optional[NameResolver] = None
+
+async def get_name_resolver() -> Optional[NameResolver]:
+    """
+    Return a resolver mapping user-supplied names to canonical RULAC nodes and UN M49 codes.
+
+    Uses the snapshot's resolver when a snapshot is loaded, otherwise builds one from a single
+    names query and reuses it until the refresh interval passes. Returns None if Neo4j cannot
+    be reached, in which case callers fall back to CONTAINS matching.
+    """
+    global name_resolver
+    snapshot = get_rulac_snapshot()
+    if snapshot is not None:
+        return snapshot.resolver
+
+    if name_resolver is None or time.time() - name_resolver.loaded_at > tool_specific_valves["RULAC_SNAPSHOT_REFRESH_INTERVAL"]:
+        try:
+            name_resolver = await NameResolver.load(run_rulac_query)
+        except Exception as e:
+            logger.warning(f"Failed to build RULAC name resolver, falling back to CONTAINS matching: {e}")
+    return name_resolver
+
+# Conflict profile store used while no snapshot is loaded (a loaded snapshot brings its own)
+conflict_profile_store: Optional[ConflictProfileStore] = None
+
+def get_conflict_profile_store() -> ConflictProfileStore:
+    """
+    Return the store of rendered conflict profiles for the current graph version.
+
+    Uses the snapshot's store when a snapshot is loaded, so profiles are re-rendered once per
+    snapshot refresh; otherwise a module-level store keyed on the polled graph version token
+    (see get_graph_version), replaced when the version changes, like the result cache.
+    """
+    global conflict_profile_store
+    if rulac_snapshot is not None and tool_specific_valves["RULAC_SNAPSHOT_ENABLED"]:
+        return rulac_snapshot.profiles
+
+    # Until the version has been read, keep the current store; it is replaced once a version is known
+    if conflict_profile_store is None or (graph_version is not None and conflict_profile_store.version != graph_version):
+        conflict_profile_store = ConflictProfileStore(graph_version)
+    return conflict_profile_store
+
+async def query_rulac_research(tool_name: str, query: str, params: dict, snapshot_rows: callable, render: callable) -> Optional[Dict[str, Any]]:
+    """
+    Get the RULAC_research map for a conflict tool: flat conflict rows from the snapshot when loaded,
+    otherwise from Neo4j, rendered client-side by a helpers/rulac_formatter renderer.
+
+    Results are cached by tool and canonicalized parameters for the current graph version (the
+    snapshot's version when it answers). Neo4j queries join the current RULACQueryBatch when the
+    pipeline dispatched the tool as part of a batched plan, sharing one read transaction with the
+    plan's other conflict tools.
+
+    Args:
+        tool_name: Name of the calling tool, part of the cache key
+        query: Cypher query returning flat conflict rows, used as the fallback
+        params: Cypher query parameters
+        snapshot_rows: Function taking a RULACSnapshot and returning the same rows
+        render: Function turning the rows into the RULAC_research map (or None for no results)
+
+    Returns:
+        The RULAC_research map with summary and conflict_details, or None when nothing was found
+    """
+    batch = current_rulac_batch.get()
+    version = await get_graph_version()
+    snapshot = get_rulac_snapshot()
+    if snapshot is not None:
+        version = snapshot.version
+
+    cache_key = make_result_cache_key(tool_name, query, params)
+    rulac_result_cache.max_entries = tool_specific_valves["RULAC_RESULT_CACHE_SIZE"]
+    if version is not None:
+        cached = rulac_result_cache.get(version, cache_key)
+        cache_stats = rulac_result_cache.stats()
+        logger.info(
+            f"RULAC result cache {'miss' if cached is MISSING else 'hit'} for {tool_name} "
+            f"(hit rate={cache_stats['hit_rate']:.0%}, {cache_stats['entries']} entries, ~{cache_stats['bytes'] // 1024} KB)"
         )
-        return graph
-    except Exception as conn_error:
-        error_msg = f"Error connecting to Neo4j: {conn_error}"
-        logger.error(error_msg)
-        raise Exception(error_msg) from conn_error
+        if cached is not MISSING:
+            if batch is not None:
+                batch.skip()
+            return cached
 
-# Initialize the Neo4j connection once at module load time
-try:
-    # Default to local testing mode which uses localhost Neo4j
-    # This can be overridden when the function is called
-    if os.path.exists("/app/backend/beacon_code"):
-        graph = initialize_neo4j(local_testing=False)
+    rows = None
+    if snapshot is not None:
+        try:
+            rows = snapshot_rows(snapshot)
+        except Exception as e:
+            logger.warning(f"RULAC snapshot lookup failed, falling back to Neo4j: {e}")
+
+    if rows is not None:
+        if batch is not None:
+            batch.skip()
+    elif batch is not None:
+        rows = await batch.run(query, params)
     else:
-        graph = initialize_neo4j(local_testing=True)
-    print("DEBUG: Neo4j connection initialized successfully")
-except Exception as e:
-    print(f"WARNING: Failed to initialize Neo4j on module load: {e}")
-    print("Tools requiring Neo4j will attempt to reconnect when used")
+        rows = await run_rulac_query(query, params)
+
+    research = render(rows)
+    if version is not None:
+        rulac_result_cache.put(version, cache_key, research)
+    return research
 
 
 class HelpFunctions:
@@ -288,72 +595,64 @@ def substitute_params(query: str, params: dict) -> str:
     return debug_query
 
 
-def process_rulac_data(data: dict, research_task: str = "No task provided") -> tuple[str, List[Citation]]:
+def process_rulac_data(
+    data: dict,
+    research_task: str = "No task provided",
+    profile_store: Optional[ConflictProfileStore] = None,
+    token_budget: Optional[int] = None,
+    relevance_query: Optional[str] = None
+) -> tuple[str, List[Citation], Dict[str, Any]]:
     """
     Processes RULAC research data by formatting it into a human-readable markdown string
     and extracting citation information. 
     
+    Each conflict's system prompt block and citation come from the conflict profile store, which
+    renders them once per graph version; citations are shared dicts and must not be modified.
+    With a token budget, only the conflicts most relevant to relevance_query get a full profile;
+    the rest are listed one line each and the elided amount is reported. Citations always
+    cover every conflict.
+    
     Args:
         data: The research data dictionary retrieved from Neo4j
         research_task: The research task that was used to retrieve the data (defaults to "No task provided")
+        profile_store: Store of rendered conflict profiles (defaults to get_conflict_profile_store())
+        token_budget: Estimated tokens available for full conflict profiles; None for no limit
+        relevance_query: The user question, used to rank conflicts when the budget is exceeded
     
     Returns:
-        tuple[str, List[Citation]]: A tuple containing (formatted_content, citations)
+        tuple[str, List[Citation], Dict[str, Any]]: A tuple containing (formatted_content, citations, rulac_research)
             - formatted_content: Formatted markdown string with the research results
             - citations: A list of citation dictionaries
+            - rulac_research: The same research as {"summary": markdown before the conflict profiles,
+              "conflict_profiles": full List[ConflictProfile], "condensed_profiles": one-line List[ConflictProfile],
+              "elision_note": str or None, "token_budget": int or None}, for merging profiles across tools
     """
     logger.debug("Processing RULAC data: formatting and collecting citations")
+    profile_store = profile_store if profile_store is not None else get_conflict_profile_store()
     
-    # ----- FORMATTING CONTENT -----
     # Extract the summary if present
     summary = data.get("summary", "No summary available.")
     
-    # Extract and format conflicts
-    formatted_conflicts_for_final_output = []
-    conflicts = data.get("conflict_details", [])
+    # Look up the prerendered profile of each conflict
+    profiles = [profile_store.get(conflict) for conflict in data.get("conflict_details", [])]
+    citations: List[Citation] = [profile.citation for profile in profiles if profile.citation is not None]
     
-    # ----- COLLECTING CITATIONS -----
-    citations: List[Citation] = []
+    # Keep full profiles for the most relevant conflicts within the token budget, one line for the rest
+    full_profiles, condensed_profiles = fit_profiles_to_budget(profiles, token_budget, relevance_query)
+    profile_blocks = [profile.prompt_block for profile in full_profiles]
+    note = None
+    if condensed_profiles:
+        note = elision_note(condensed_profiles, len(profiles), token_budget)
+        profile_blocks.append("##### Other conflicts (one line each)\n" + "\n".join(profile.one_line for profile in condensed_profiles))
+        profile_blocks.append(note)
+        logger.info(f"RULAC output over budget: {len(full_profiles)} full profiles, {len(condensed_profiles)} one-line")
     
-    for conflict in conflicts:
-        # Format conflict details, one version for citation and one for eventual system prompt
-
-        formatted_for_citation = (
-            f"{conflict.get('conflict_name', 'Unnamed Conflict')}\n\n"
-            f"Conflict Classification under IHL: {conflict.get('conflict_classification', 'N/A')}\n\n"
-            f"Overview: {conflict.get('conflict_overview', 'N/A')}\n\n"
-            f"Applicable IHL Law: {conflict.get('applicable_ihl_law', 'N/A')}\n\n"
-            f"State Parties: {conflict.get('state_parties', 'None recorded')}\n\n"
-            f"Non-State Parties: {conflict.get('non_state_parties', 'None recorded')}"
-            # f"Source Citation: {conflict.get('conflict_citation', 'No Citation Available')}\n"
-        )
-
-        formatted_for_system_prompt = (
-            f"##### Conflict Name: {conflict.get('conflict_name', 'Unnamed Conflict')}\n"
-            f"Conflict Classification under IHL: {conflict.get('conflict_classification', 'N/A')}\n"
-            f"Overview: {conflict.get('conflict_overview', 'N/A')}\n"
-            f"Applicable IHL Law: {conflict.get('applicable_ihl_law', 'N/A')}\n"
-            f"State Parties: {conflict.get('state_parties', 'None recorded')}\n"
-            f"Non-State Parties: {conflict.get('non_state_parties', 'None recorded')}"
-        )
-
-        formatted_conflicts_for_final_output.append(formatted_for_system_prompt)
-        
-        # Create citation for this conflict
-        if "conflict_citation" in conflict and "conflict_name" in conflict:
-            citation = create_standard_citation(
-                title="RULAC - " + conflict.get("conflict_name", "Unnamed Conflict"),
-                url=conflict.get("conflict_citation", "https://www.rulac.org"),
-                formatted_content=formatted_for_citation
-            )
-            citations.append(citation)
-    
-    all_combined_conflicts_for_final_output = "\n\n".join(formatted_conflicts_for_final_output) if formatted_conflicts_for_final_output else "No conflict details available."
+    all_combined_conflicts_for_final_output = "\n\n".join(profile_blocks) if profile_blocks else "No conflict details available."
     
+    # output a human readable of the query that was used to generate the RULAC research
+    research_summary = f"### {research_task}\n\n{summary}"
     formatted_output = (
-        # output a human readable of the query that was used to generate the RULAC research
-        f"### {research_task}\n\n"
-        f"{summary}\n\n"
+        f"{research_summary}\n\n"
         f"#### Conflict profiles\n\n"
         f"{all_combined_conflicts_for_final_output}"
     )
@@ -368,6 +667,28 @@ def process_rulac_data(data: dict, research_task: str = "No task provided") -> t
         )
         citations.append(citation)
     
+    rulac_research = {
+        "summary": research_summary,
+        "conflict_profiles": full_profiles,
+        "condensed_profiles": condensed_profiles,
+        "elision_note": note,
+        "token_budget": token_budget,
+    }
+    return formatted_output, citations, rulac_research
+
+
+def process_rulac_statistics(data: dict, research_task: str = "No task provided") -> tuple[str, List[Citation]]:
+    """
+    Formats a statistics-only RULAC lookup (a table of conflict counts from render_statistics),
+    without conflict profiles; the single citation points to RULAC and shows the table.
+
+    Returns:
+        tuple[str, List[Citation]]: A tuple containing (formatted_content, citations)
+    """
+    summary = data.get("summary", "No summary available.")
+    formatted_output = f"### {research_task}\n\n{summary}"
+    citations = [create_standard_citation(title="RULAC", url="https://www.rulac.org", formatted_content=summary)]
+    logger.debug(f"RULAC statistics-only output: ~{len(formatted_output) // 4} estimated tokens")
     return formatted_output, citations
 
 
@@ -563,6 +884,11 @@ def remove_emojis(text):
 async def get_armed_conflict_data_by_country(
     countries: List[str],
     conflict_types: List[str],
+    statistics_only: bool = False,
+    # Injected by the pipeline, hidden from the tool-calling schema: prompt token budget for conflict profiles
+    # and the user question used to pick which conflicts get a full profile
+    token_budget: Annotated[Optional[int], InjectedToolArg] = None,
+    relevance_query: Annotated[Optional[str], InjectedToolArg] = None,
 ) -> RULAC_TOOL_RESULT:
     """
     Retreives armed conflict data from RULAC (Rule of Law in Armed Conflict) for one or more countries. 
@@ -571,6 +897,8 @@ async def get_armed_conflict_data_by_country(
 
     This tool retreive all conflicts per country by default, but can also use an optional filter by conflict classification type. Note: There are only three valid conflict classifications, as defined by RULAC: "International Armed Conflict (IAC)", "Non-International Armed Conflict (NIAC)", "Military Occupation".
 
+    Set statistics_only to true for questions that only need numbers of conflicts (how many, which has the most, comparisons of counts): the tool then returns a compact table of conflict counts per country and classification instead of full conflict profiles.
+
     ## Steps
     1. Identify the country or countries to retreive conflict data for
     2. Identify any conflict classification filters to apply, if requested. By default, return an empty [] for conflict_types to retrieve all conflicts per country.
@@ -590,8 +918,14 @@ async def get_armed_conflict_data_by_country(
     countries: ["Democratic Republic of Congo"]
     conflict_types: []
 
+    Example question:"Is Russia or Ukraine party to more armed conflicts?"
+    countries: ["Russia", "Ukraine"]
+    conflict_types: []
+    statistics_only: true
+
     :param countries: List of country names to retrieve conflict data for
     :param conflict_types: List of conflict classification types to filter by in query
+    :param statistics_only: Return only conflict counts, for count and comparison questions (default false)
     
     :return: A dictionary with "result" string containing the formatted research data and "citations" list of citation objects
     """
@@ -601,15 +935,10 @@ async def get_armed_conflict_data_by_country(
                  f"STARTING TOOL: {tool_name}\n" + 
                  "="*50 + "[/bold white]\n")
     
-    # Make sure Neo4j is connected
-    global graph
-    if graph is None:
-        # Try to initialize the connection
-        # print("Initializing Neo4j connection... make sure it only happens once here ...")
-        graph = initialize_neo4j(local_testing=True)
-        
     # Create research task from parameters
     research_task = f"RULAC armed conflict data by country ({', '.join(countries)})" + (f" with conflict classification ({', '.join(conflict_types)})" if conflict_types else "")
+    if statistics_only:
+        research_task += " - conflict counts only"
     # Prepare the parameters for the query
     params = {
         "countries": countries,  # Keep the internal parameter name the same for compatibility
@@ -617,8 +946,15 @@ async def get_armed_conflict_data_by_country(
         "research_task": research_task
     }
 
-    # Load tool-specific cypher template
-    TOOL_PROMPT = tool_cypher_RULAC_conflict_by_StateActor.PROMPT
+    # Load tool-specific cypher template: resolve the countries to UN M49 codes for an indexed lookup,
+    # or fall back to name/alias CONTAINS matching when listing all state actors or no resolver is available
+    resolver = await get_name_resolver() if countries else None
+    if resolver is not None:
+        params["state_actor_codes"] = resolver.resolve_codes(countries)
+        logger.debug(f"Resolved countries {countries} to UN M49 codes {params['state_actor_codes']}")
+        TOOL_PROMPT = tool_cypher_RULAC_conflict_by_StateActor.STATS_PROMPT if statistics_only else tool_cypher_RULAC_conflict_by_StateActor.PROMPT
+    else:
+        TOOL_PROMPT = tool_cypher_RULAC_conflict_by_StateActor.CONTAINS_STATS_PROMPT if statistics_only else tool_cypher_RULAC_conflict_by_StateActor.CONTAINS_PROMPT
 
     # DEBUGGING section
     debug_query = substitute_params(TOOL_PROMPT, params)
@@ -633,9 +969,21 @@ async def get_armed_conflict_data_by_country(
             console.print(panel)
 
     try:
-        # Execute the query using the graph.query() method
-        results = graph.query(TOOL_PROMPT, params)
-        if not results:
+        # Get flat conflict rows from the in-memory RULAC snapshot (falling back to the Cypher query on Neo4j) and render them
+        if statistics_only:
+            # Counts per group and classification only, rendered as a compact table without conflict profiles
+            research_result = await query_rulac_research(
+                tool_name, TOOL_PROMPT, params,
+                lambda snapshot: statistics_rows(snapshot.rows_by_country(countries, conflict_types)),
+                lambda rows: render_statistics(rows, "state actor", conflict_types)
+            )
+        else:
+            research_result = await query_rulac_research(
+                tool_name, TOOL_PROMPT, params,
+                lambda snapshot: snapshot.rows_by_country(countries, conflict_types),
+                lambda rows: render_by_country(rows, countries, conflict_types)
+            )
+        if not research_result:
             logger.warning("No RULAC data found.")
             
             # Format empty result
@@ -661,19 +1009,23 @@ async def get_armed_conflict_data_by_country(
             
             return empty_result
 
-        # IF there are results, format the result content
-        # Assume the first record contains the required RULAC_research field   
-        research_result = results[0].get("RULAC_research")
         
         # Process the result data - formatting content and collecting citations in one step
-        formatted_content, citations = process_rulac_data(research_result, research_task)
+        if statistics_only:
+            formatted_content, citations = process_rulac_statistics(research_result, research_task)
+            rulac_research = None
+        else:
+            formatted_content, citations, rulac_research = process_rulac_data(
+                research_result, research_task, token_budget=token_budget, relevance_query=relevance_query
+            )
 
         # Format the standardized result
         result = format_standard_tool_result(
             content=formatted_content,
             citations=citations,
             tool_name=tool_name,
-            tool_params=params
+            tool_params=params,
+            rulac_research=rulac_research
         )
         
         display_formatted_results(
@@ -723,6 +1075,11 @@ async def get_armed_conflict_data_by_country(
 @tool
 async def get_armed_conflict_data_by_non_state_actor(
     non_state_actors: List[str],
+    statistics_only: bool = False,
+    # Injected by the pipeline, hidden from the tool-calling schema: prompt token budget for conflict profiles
+    # and the user question used to pick which conflicts get a full profile
+    token_budget: Annotated[Optional[int], InjectedToolArg] = None,
+    relevance_query: Annotated[Optional[str], InjectedToolArg] = None,
 ) -> RULAC_TOOL_RESULT:
     """
     Retreives armed conflict data from RULAC (Rule of Law in Armed Conflict) by one or more non-state actors. 
@@ -731,6 +1088,8 @@ async def get_armed_conflict_data_by_non_state_actor(
 
     This tool retrieves all conflicts involving the specified non-state actors. The tool accepts various spellings, aliases, and acronyms for each non-state actor to ensure comprehensive data retrieval.
 
+    Set statistics_only to true for questions that only need numbers of conflicts (how many, which has the most, comparisons of counts): the tool then returns a compact table of conflict counts per non-state actor and classification instead of full conflict profiles.
+
     ## Steps
     1. Identify the non-state actor(s) to retrieve conflict data for
     2. Provide a list of alternative spellings, aliases, and acronyms for each non-state actor to ensure comprehensive data retrieval
@@ -748,6 +1107,7 @@ async def get_armed_conflict_data_by_non_state_actor(
     non_state_actors: ["Revolutionary Armed Forces of Colombia (FARC)", "Revolutionary Armed Forces", "FARC", "Fuerzas Armadas Revolucionarias de Colombia"]
 
     :param non_state_actors: List of spellings, aliases, and acronyms for the non-state actor(s) to retrieve conflict data for
+    :param statistics_only: Return only conflict counts, for count and comparison questions (default false)
     
     :return: A dictionary with "result" string containing the formatted research data and "citations" list of citation objects
     """
@@ -759,14 +1119,8 @@ async def get_armed_conflict_data_by_non_state_actor(
                  "="*50 + "[/bold white]\n")
     
     try:
-        # Make sure Neo4j is connected
-        global graph
-        if graph is None:
-            # Try to initialize the connection
-            graph = initialize_neo4j(local_testing=True)
-            
         # Create research task from parameters
-        research_task = f"RULAC conflict data for non-state actor(s): {', '.join(non_state_actors)}"
+        research_task = f"RULAC conflict data for non-state actor(s): {', '.join(non_state_actors)}" + (" - conflict counts only" if statistics_only else "")
         
         # Prepare the parameters for the query
         params = {
@@ -775,7 +1129,8 @@ async def get_armed_conflict_data_by_non_state_actor(
         }
 
         # Load tool-specific cypher template
-        TOOL_PROMPT = tool_cypher_RULAC_conflict_by_NonStateActor.PROMPT
+        # Statistics-only lookups aggregate on the database and return conflict ids per classification, without conflict text
+        TOOL_PROMPT = tool_cypher_RULAC_conflict_by_NonStateActor.STATS_PROMPT if statistics_only else tool_cypher_RULAC_conflict_by_NonStateActor.PROMPT
 
         # DEBUGGING statement
         # Create a debug version of the query with parameters substituted
@@ -790,9 +1145,21 @@ async def get_armed_conflict_data_by_non_state_actor(
                 )            
                 console.print(panel)
 
-        # Execute the query using the graph.query() method
-        results = graph.query(TOOL_PROMPT, params)
-        if not results:
+        # Get flat conflict rows from the in-memory RULAC snapshot (falling back to the Cypher query on Neo4j) and render them
+        if statistics_only:
+            # Counts per group and classification only, rendered as a compact table without conflict profiles
+            research_result = await query_rulac_research(
+                tool_name, TOOL_PROMPT, params,
+                lambda snapshot: statistics_rows(snapshot.rows_by_non_state_actor(non_state_actors)),
+                lambda rows: render_statistics(rows, "non-state actor", [])
+            )
+        else:
+            research_result = await query_rulac_research(
+                tool_name, TOOL_PROMPT, params,
+                lambda snapshot: snapshot.rows_by_non_state_actor(non_state_actors),
+                lambda rows: render_by_non_state_actor(rows, non_state_actors)
+            )
+        if not research_result:
             # Display "no results" message with tool info
             display_formatted_results(
                 "No RULAC conflict data found for the specified non-state actors.",
@@ -813,11 +1180,15 @@ async def get_armed_conflict_data_by_non_state_actor(
                 tool_params=params
             )
 
-        # Assume the first record contains the required RULAC_research field
-        research_result = results[0].get("RULAC_research")
 
         # Process the result data - formatting content and collecting citations in one step
-        formatted_content, citations = process_rulac_data(research_result, research_task)
+        if statistics_only:
+            formatted_content, citations = process_rulac_statistics(research_result, research_task)
+            rulac_research = None
+        else:
+            formatted_content, citations, rulac_research = process_rulac_data(
+                research_result, research_task, token_budget=token_budget, relevance_query=relevance_query
+            )
 
         # Display formatted results
         display_formatted_results(
@@ -839,7 +1210,8 @@ async def get_armed_conflict_data_by_non_state_actor(
             content=formatted_content,
             citations=citations,
             tool_name=tool_name,
-            tool_params=params
+            tool_params=params,
+            rulac_research=rulac_research
         )
     except Exception as e:
         error_message = f"Error retrieving RULAC data: {str(e)}"
@@ -869,6 +1241,11 @@ async def get_armed_conflict_data_by_non_state_actor(
 async def get_armed_conflict_data_by_organization(
     organizations: List[str],
     conflict_types: List[str],
+    statistics_only: bool = False,
+    # Injected by the pipeline, hidden from the tool-calling schema: prompt token budget for conflict profiles
+    # and the user question used to pick which conflicts get a full profile
+    token_budget: Annotated[Optional[int], InjectedToolArg] = None,
+    relevance_query: Annotated[Optional[str], InjectedToolArg] = None,
 ) -> RULAC_TOOL_RESULT:
     """
     Retreives armed conflict data from RULAC (Rule of Law in Armed Conflict) by one or more organizations. 
@@ -879,6 +1256,8 @@ async def get_armed_conflict_data_by_organization(
 
     This tool can ONLY retrieve information regarding the following Organizations: "European Union", "African Union", "G7", "BRICS", "NATO", "ASEAN"
 
+    Set statistics_only to true for questions that only need numbers of conflicts (how many, which has the most, comparisons of counts): the tool then returns a compact table of conflict counts per member state and classification instead of full conflict profiles.
+
     ## Steps
     1. Identify the organization(s) to retrieve conflict data for
     2. Identify any conflict classification filters to apply, if requested. By default, return an empty [] for conflict_types to retrieve all conflicts per organization.
@@ -893,8 +1272,14 @@ async def get_armed_conflict_data_by_organization(
     organizations: ["NATO"]
     conflict_types: []
 
+    Example question:"Which BRICS member is party to the most armed conflicts?"
+    organizations: ["BRICS"]
+    conflict_types: []
+    statistics_only: true
+
     :param organizations: List of organization names to retrieve conflict data for
     :param conflict_types: List of conflict classification types to filter by in query
+    :param statistics_only: Return only conflict counts, for count and comparison questions (default false)
     
     :return: A dictionary with "result" string containing the formatted research data and "citations" list of citation objects
     """
@@ -905,17 +1290,14 @@ async def get_armed_conflict_data_by_organization(
                  f"STARTING TOOL: {tool_name}\n" + 
                  "="*50 + "[/bold white]\n")
 
-    # Make sure Neo4j is connected
-    global graph
-    if graph is None:
-        # Try to initialize the connection
-        graph = initialize_neo4j(local_testing=True)
-
     # Create research task from parameters
     research_task = f"RULAC conflict data for organization(s): {', '.join(organizations)}" + (f" with conflict classification ({', '.join(conflict_types)})" if conflict_types else "")
+    if statistics_only:
+        research_task += " - conflict counts only"
     
     # Load tool-specific cypher template
-    TOOL_PROMPT = tool_cypher_RULAC_conflict_by_org.PROMPT
+    # Statistics-only lookups aggregate on the database and return conflict ids per classification, without conflict text
+    TOOL_PROMPT = tool_cypher_RULAC_conflict_by_org.STATS_PROMPT if statistics_only else tool_cypher_RULAC_conflict_by_org.PROMPT
     
     # Prepare the parameters for the query
     params = {
@@ -938,9 +1320,21 @@ async def get_armed_conflict_data_by_organization(
             console.print(panel)
 
     try:
-        # Execute the query using the graph.query() method
-        results = graph.query(TOOL_PROMPT, params)
-        if not results:
+        # Get flat conflict rows from the in-memory RULAC snapshot (falling back to the Cypher query on Neo4j) and render them
+        if statistics_only:
+            # Counts per group and classification only, rendered as a compact table without conflict profiles
+            research_result = await query_rulac_research(
+                tool_name, TOOL_PROMPT, params,
+                lambda snapshot: statistics_rows(snapshot.rows_by_organization(organizations, conflict_types)),
+                lambda rows: render_statistics(rows, "member state", conflict_types)
+            )
+        else:
+            research_result = await query_rulac_research(
+                tool_name, TOOL_PROMPT, params,
+                lambda snapshot: snapshot.rows_by_organization(organizations, conflict_types),
+                lambda rows: render_by_organization(rows, organizations, conflict_types)
+            )
+        if not research_result:
             # Display "no results" message with tool info
             display_formatted_results(
                 "No RULAC conflict data found for the specified organizations.",
@@ -961,11 +1355,15 @@ async def get_armed_conflict_data_by_organization(
                 tool_params=params
             )
 
-        # Assume the first record contains the required RULAC_research field
-        research_result = results[0].get("RULAC_research")
 
         # Process the result data - formatting content and collecting citations in one step
-        formatted_content, citations = process_rulac_data(research_result, research_task)
+        if statistics_only:
+            formatted_content, citations = process_rulac_statistics(research_result, research_task)
+            rulac_research = None
+        else:
+            formatted_content, citations, rulac_research = process_rulac_data(
+                research_result, research_task, token_budget=token_budget, relevance_query=relevance_query
+            )
 
         # Display formatted results
         display_formatted_results(
@@ -987,7 +1385,8 @@ async def get_armed_conflict_data_by_organization(
             content=formatted_content,
             citations=citations,
             tool_name=tool_name,
-            tool_params=params
+            tool_params=params,
+            rulac_research=rulac_research
         )
 
     except Exception as e:
@@ -1019,6 +1418,11 @@ async def get_armed_conflict_data_by_organization(
 async def get_armed_conflict_data_by_region(
     regions: List[str],
     conflict_types: List[str],
+    statistics_only: bool = False,
+    # Injected by the pipeline, hidden from the tool-calling schema: prompt token budget for conflict profiles
+    # and the user question used to pick which conflicts get a full profile
+    token_budget: Annotated[Optional[int], InjectedToolArg] = None,
+    relevance_query: Annotated[Optional[str], InjectedToolArg] = None,
 ) -> RULAC_TOOL_RESULT:
     """
     Retreives conflict data from RULAC (Rule of Law in Armed Conflict) on armed conflicts taking place in specific regions of the world.
@@ -1027,6 +1431,8 @@ async def get_armed_conflict_data_by_region(
 
     This tool retreives all conflicts in a region by default, but can also use an optional filter by conflict classification type. Note: There are only three valid conflict classifications, as defined by RULAC: "International Armed Conflict (IAC)", "Non-International Armed Conflict (NIAC)", "Military Occupation".
 
+    Set statistics_only to true for questions that only need numbers of conflicts (how many, which has the most, comparisons of counts): the tool then returns a compact table of conflict counts per country, region and classification instead of full conflict profiles.
+
     ## Steps
     1. Identify the region(s) to retrieve conflict data for, using the official regions below
     2. Identify any conflict classification filters to apply, if requested. If there are no conflict classification filters to apply, return an empty [] for conflict_types
@@ -1069,6 +1475,7 @@ Regions
     Example question:"How does the number of conflicts taking place in Eastern Africa region compare to those in North Africa region?"
     regions: ["Eastern Africa", "Northern Africa"]
     conflict_types: []
+    statistics_only: true
 
     Example question:"What IAC conflicts are taking place in Europe?"
     regions: ["Europe"]
@@ -1077,6 +1484,7 @@ Regions
 
     :param regions: List of UN region names to retrieve conflict data for
     :param conflict_types: List of conflict classification types to filter by in query
+    :param statistics_only: Return only conflict counts, for count and comparison questions (default false)
     :return: A dictionary with "result" string containing the formatted research data and "citations" list of citation objects
     """
     tool_name = "get_armed_conflict_data_by_region"
@@ -1087,17 +1495,14 @@ Regions
                  "="*50 + "[/bold white]\n")
     
     try:
-        # Make sure Neo4j is connected
-        global graph
-        if graph is None:
-            # Try to initialize the connection
-            graph = initialize_neo4j(local_testing=True)
-
         # Create research task from parameters
         research_task = f"RULAC conflict data for region(s): {', '.join(regions)}" + (f" with conflict classification ({', '.join(conflict_types)})" if conflict_types else "")
+        if statistics_only:
+            research_task += " - conflict counts only"
         
         # Load tool-specific cypher template
-        TOOL_PROMPT = tool_cypher_RULAC_conflict_by_Region.PROMPT
+        # Statistics-only lookups aggregate on the database and return conflict ids per classification, without conflict text
+        TOOL_PROMPT = tool_cypher_RULAC_conflict_by_Region.STATS_PROMPT if statistics_only else tool_cypher_RULAC_conflict_by_Region.PROMPT
         
         # Prepare the parameters for the query
         params = {
@@ -1119,9 +1524,21 @@ Regions
                 )            
                 console.print(panel)
 
-        # Execute the query using the graph.query() method
-        results = graph.query(TOOL_PROMPT, params)
-        if not results:
+        # Get flat conflict rows from the in-memory RULAC snapshot (falling back to the Cypher query on Neo4j) and render them
+        if statistics_only:
+            # Counts per group and classification only, rendered as a compact table without conflict profiles
+            research_result = await query_rulac_research(
+                tool_name, TOOL_PROMPT, params,
+                lambda snapshot: statistics_rows(snapshot.rows_by_region(regions, conflict_types)),
+                lambda rows: render_statistics(rows, "country", conflict_types)
+            )
+        else:
+            research_result = await query_rulac_research(
+                tool_name, TOOL_PROMPT, params,
+                lambda snapshot: snapshot.rows_by_region(regions, conflict_types),
+                lambda rows: render_by_region(rows, regions, conflict_types)
+            )
+        if not research_result:
             # Display "no results" message with tool info
             display_formatted_results(
                 "No RULAC conflict data found for the specified regions.",
@@ -1142,11 +1559,15 @@ Regions
                 tool_params=params
             )
 
-        # Assume the first record contains the required RULAC_research field
-        research_result = results[0].get("RULAC_research")
 
         # Process the result data - formatting content and collecting citations in one step
-        formatted_content, citations = process_rulac_data(research_result, research_task)
+        if statistics_only:
+            formatted_content, citations = process_rulac_statistics(research_result, research_task)
+            rulac_research = None
+        else:
+            formatted_content, citations, rulac_research = process_rulac_data(
+                research_result, research_task, token_budget=token_budget, relevance_query=relevance_query
+            )
 
         # Display formatted results
         display_formatted_results(
@@ -1168,7 +1589,8 @@ Regions
             content=formatted_content,
             citations=citations,
             tool_name=tool_name,
-            tool_params=params
+            tool_params=params,
+            rulac_research=rulac_research
         )
         
     except Exception as e: